@@ -0,0 +1,60 @@
+import importlib
+import os
+import sys
+import types
+
+BENCHMARKS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+ADDIN_ROOT = os.path.dirname(BENCHMARKS_FOLDER)
+FAKE_ADSK_FOLDER = os.path.join(BENCHMARKS_FOLDER, 'fakeAdsk')
+ADDIN_PACKAGE_NAME = 'gridfinityGeneratorAddin'
+
+if not FAKE_ADSK_FOLDER in sys.path:
+    sys.path.insert(0, FAKE_ADSK_FOLDER)
+
+import adsk.core, adsk.fusion
+from adsk import recorder
+
+def registerAddinPackage():
+    # generator modules use relative imports up to the add-in root, so the root has to be importable as a package
+    if not ADDIN_PACKAGE_NAME in sys.modules:
+        package = types.ModuleType(ADDIN_PACKAGE_NAME)
+        package.__path__ = [ADDIN_ROOT]
+        sys.modules[ADDIN_PACKAGE_NAME] = package
+    return sys.modules[ADDIN_PACKAGE_NAME]
+
+def loadAddinModule(name: str):
+    registerAddinPackage()
+    return importlib.import_module(f'{ADDIN_PACKAGE_NAME}.{name}')
+
+def newDesign() -> adsk.fusion.Design:
+    recorder.reset()
+    return adsk.core.Application.get().newDesign()
+
+def newComponent(name: str = 'Benchmark') -> adsk.fusion.Component:
+    design = newDesign()
+    occurrence = design.rootComponent.occurrences.addNewComponent(adsk.core.Matrix3D.create())
+    occurrence.component.name = name
+    occurrence.activate()
+    return occurrence.component
+
+def timelineGroupSize(component: adsk.fusion.Component):
+    # same formula the commands use to collapse generated features into a timeline group
+    return component.features.count + component.constructionPlanes.count + component.sketches.count
+
+def summarize(component: adsk.fusion.Component, ops: list[dict] = None):
+    ops = recorder.operations if ops is None else ops
+    counts = recorder.countByKind(ops)
+    return {
+        'features': recorder.featureCount(ops),
+        'sketches': counts.get('sketch', 0),
+        'planes': counts.get('constructionPlane', 0),
+        'timelineGroup': timelineGroupSize(component),
+        'bodies': component.bRepBodies.count,
+        'extrudes': counts.get('extrude', 0),
+        'fillets': counts.get('fillet', 0),
+        'chamfers': counts.get('chamfer', 0),
+        'sweeps': counts.get('sweep', 0),
+        'patterns': counts.get('rectangularPattern', 0) + counts.get('circularPattern', 0) + counts.get('mirror', 0),
+        'combines': counts.get('combine', 0),
+        'combineTools': recorder.combineToolCount(ops),
+    }
@@ -0,0 +1,139 @@
+import argparse
+import math
+import sys
+
+import runBenchmarks
+
+# local growth exponent of the last two points, 0 for constant, 1 for linear, 2 for quadratic
+MAX_LINEAR_EXPONENT = 1.15
+MAX_CONSTANT_EXPONENT = 0.15
+
+CHECKS = [
+    {
+        'name': 'baseplate features vs plate cells',
+        'generator': 'baseplate',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': n, 'length': n, 'magnetCutouts': True, 'screwHoles': True, 'skeletonized': True, 'connectionHoles': True},
+        'x': lambda n: n * n,
+        'metric': 'features',
+        'maxExponent': MAX_LINEAR_EXPONENT,
+    },
+    {
+        'name': 'light baseplate features vs plate cells',
+        'generator': 'baseplate',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': n, 'length': n, 'light': True},
+        'x': lambda n: n * n,
+        'metric': 'features',
+        'maxExponent': MAX_LINEAR_EXPONENT,
+    },
+    {
+        'name': 'bin body features vs compartments in a fixed bin',
+        'generator': 'binBody',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': 8, 'length': 8, 'compartmentsX': n, 'compartmentsY': n, 'scoop': True, 'tab': True},
+        'x': lambda n: n * n,
+        'metric': 'features',
+        'maxExponent': MAX_LINEAR_EXPONENT,
+    },
+    {
+        'name': 'bin body features vs bin cells, single compartment',
+        'generator': 'binBody',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': n, 'length': n, 'lipNotches': True},
+        'x': lambda n: n * n,
+        'metric': 'features',
+        'maxExponent': MAX_LINEAR_EXPONENT,
+    },
+    {
+        # the lip notch cutout is one body for all cells, so the lip cut must not take more tools with bin size
+        'name': 'bin body combine tool bodies vs bin cells, lip notches',
+        'generator': 'binBody',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': n, 'length': n, 'lipNotches': True},
+        'x': lambda n: n * n,
+        'metric': 'combineTools',
+        'maxExponent': MAX_CONSTANT_EXPONENT,
+    },
+    {
+        # catches work added per compartment per cell, which is quadratic here
+        'name': 'bin body features vs compartments, one compartment per cell',
+        'generator': 'binBody',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': n, 'length': n, 'compartmentsX': n, 'compartmentsY': n, 'scoop': True, 'tab': True, 'lipNotches': True},
+        'x': lambda n: n * n,
+        'metric': 'features',
+        'maxExponent': MAX_LINEAR_EXPONENT,
+    },
+    {
+        'name': 'bin features vs bin cells with base',
+        'generator': 'bin',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': n, 'length': n, 'magnetCutouts': True, 'screwHoles': True},
+        'x': lambda n: n * n,
+        'metric': 'features',
+        'maxExponent': MAX_LINEAR_EXPONENT,
+    },
+    {
+        'name': 'bin combine tool bodies vs bin cells with base',
+        'generator': 'bin',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': n, 'length': n, 'magnetCutouts': True, 'screwHoles': True},
+        'x': lambda n: n * n,
+        'metric': 'combineTools',
+        'maxExponent': MAX_LINEAR_EXPONENT,
+    },
+    {
+        'name': 'bin features vs bin cells, single profile base',
+        'generator': 'bin',
+        'sizes': [1, 2, 4, 6, 8],
+        'options': lambda n: {'width': n, 'length': n, 'magnetCutouts': True, 'screwHoles': True, 'singleProfileBase': True},
+        'x': lambda n: n * n,
+        'metric': 'features',
+        'maxExponent': MAX_LINEAR_EXPONENT,
+    },
+]
+
+def growthExponent(xs: list[float], ys: list[float]):
+    [x1, x2] = xs[-2:]
+    [y1, y2] = ys[-2:]
+    if y2 <= y1:
+        return 0
+    return math.log(y2 / y1) / math.log(x2 / x1)
+
+def runCheck(check: dict):
+    xs = []
+    ys = []
+    for size in check['sizes']:
+        result = runBenchmarks.runConfiguration(check['generator'], check['options'](size))
+        xs.append(check['x'](size))
+        ys.append(result[check['metric']])
+    exponent = growthExponent(xs, ys)
+    return {
+        'name': check['name'],
+        'xs': xs,
+        'ys': ys,
+        'exponent': exponent,
+        'passed': exponent <= check['maxExponent'],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Check that generated feature counts grow at most linearly with bin and baseplate size')
+    parser.add_argument('--filter', help='only run checks whose name contains this text')
+    args = parser.parse_args()
+
+    failures = 0
+    for check in CHECKS:
+        if args.filter is not None and not args.filter in check['name']:
+            continue
+        result = runCheck(check)
+        status = 'ok' if result['passed'] else 'FAILED'
+        print(f'{status:6} {result["name"]}: exponent {result["exponent"]:.2f}, {check["metric"]} {result["ys"]} for x {result["xs"]}')
+        if not result['passed']:
+            failures += 1
+    if failures > 0:
+        print(f'{failures} complexity check(s) failed')
+    return 1 if failures > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
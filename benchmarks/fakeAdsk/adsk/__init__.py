@@ -0,0 +1,5 @@
+# Offline stand-in for the Fusion 360 API used by the benchmarks.
+# Only the subset of adsk.core/adsk.fusion touched by lib/gridfinityUtils is implemented,
+# geometry is approximated with axis aligned boxes which is enough to drive the
+# face/edge selection logic of the generators. Every modelling operation is logged
+# by adsk.recorder so feature counts can be tracked without a Fusion licence.
@@ -0,0 +1,285 @@
+import math
+
+class Base:
+    @classmethod
+    def classType(cls):
+        return f'adsk::core::{cls.__name__}'
+
+    @classmethod
+    def cast(cls, obj):
+        return obj
+
+    @property
+    def objectType(self):
+        return self.classType()
+
+    @property
+    def isValid(self):
+        return True
+
+class LogLevels:
+    InfoLogLevel = 0
+    WarningLogLevel = 1
+    ErrorLogLevel = 2
+
+class LogTypes:
+    ConsoleLogType = 0
+    FileLogType = 1
+
+class ValueTypes:
+    RealValueType = 0
+    StringValueType = 1
+    ObjectValueType = 2
+
+class Point3D(Base):
+    def __init__(self, x: float = 0, y: float = 0, z: float = 0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @staticmethod
+    def create(x: float = 0, y: float = 0, z: float = 0):
+        return Point3D(x, y, z)
+
+    def copy(self):
+        return Point3D(self.x, self.y, self.z)
+
+    def asArray(self):
+        return [self.x, self.y, self.z]
+
+    def asVector(self):
+        return Vector3D(self.x, self.y, self.z)
+
+    def distanceTo(self, point: 'Point3D'):
+        return math.dist(self.asArray(), point.asArray())
+
+    def vectorTo(self, point: 'Point3D'):
+        return Vector3D(point.x - self.x, point.y - self.y, point.z - self.z)
+
+    def isEqualTo(self, point: 'Point3D'):
+        return self.asArray() == point.asArray()
+
+    def isEqualToByTolerance(self, point: 'Point3D', tolerance: float):
+        return self.distanceTo(point) <= tolerance
+
+    def translateBy(self, vector: 'Vector3D'):
+        self.x += vector.x
+        self.y += vector.y
+        self.z += vector.z
+        return True
+
+    def transformBy(self, matrix: 'Matrix3D'):
+        return self.translateBy(matrix.translation)
+
+    def __repr__(self):
+        return f'Point3D({self.x}, {self.y}, {self.z})'
+
+class Vector3D(Base):
+    def __init__(self, x: float = 0, y: float = 0, z: float = 0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @staticmethod
+    def create(x: float = 0, y: float = 0, z: float = 0):
+        return Vector3D(x, y, z)
+
+    def copy(self):
+        return Vector3D(self.x, self.y, self.z)
+
+    def asArray(self):
+        return [self.x, self.y, self.z]
+
+    def asPoint(self):
+        return Point3D(self.x, self.y, self.z)
+
+    @property
+    def length(self):
+        return math.hypot(self.x, self.y, self.z)
+
+    def add(self, vector: 'Vector3D'):
+        self.x += vector.x
+        self.y += vector.y
+        self.z += vector.z
+        return True
+
+    def subtract(self, vector: 'Vector3D'):
+        self.x -= vector.x
+        self.y -= vector.y
+        self.z -= vector.z
+        return True
+
+    def scaleBy(self, scale: float):
+        self.x *= scale
+        self.y *= scale
+        self.z *= scale
+        return True
+
+    def normalize(self):
+        length = self.length
+        if length > 0:
+            self.scaleBy(1 / length)
+        return True
+
+    def dotProduct(self, vector: 'Vector3D'):
+        return self.x * vector.x + self.y * vector.y + self.z * vector.z
+
+    def crossProduct(self, vector: 'Vector3D'):
+        return Vector3D(
+            self.y * vector.z - self.z * vector.y,
+            self.z * vector.x - self.x * vector.z,
+            self.x * vector.y - self.y * vector.x,
+        )
+
+class Matrix3D(Base):
+    def __init__(self):
+        self.translation = Vector3D()
+
+    @staticmethod
+    def create():
+        return Matrix3D()
+
+    def setToIdentity(self):
+        self.translation = Vector3D()
+        return True
+
+    def copy(self):
+        matrix = Matrix3D()
+        matrix.translation = self.translation.copy()
+        return matrix
+
+class BoundingBox3D(Base):
+    def __init__(self, minPoint: Point3D, maxPoint: Point3D):
+        self.minPoint = minPoint
+        self.maxPoint = maxPoint
+
+    @staticmethod
+    def create(minPoint: Point3D, maxPoint: Point3D):
+        return BoundingBox3D(minPoint.copy(), maxPoint.copy())
+
+    def copy(self):
+        return BoundingBox3D(self.minPoint.copy(), self.maxPoint.copy())
+
+    def intersects(self, box: 'BoundingBox3D'):
+        return all(self.minPoint.asArray()[i] <= box.maxPoint.asArray()[i] and box.minPoint.asArray()[i] <= self.maxPoint.asArray()[i] for i in range(3))
+
+    def contains(self, point: Point3D):
+        return all(self.minPoint.asArray()[i] <= point.asArray()[i] <= self.maxPoint.asArray()[i] for i in range(3))
+
+class ObjectCollection(Base):
+    def __init__(self):
+        self._items = []
+
+    @staticmethod
+    def create():
+        return ObjectCollection()
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def add(self, item):
+        self._items.append(item)
+        return True
+
+    def item(self, index: int):
+        return self._items[index]
+
+    def clear(self):
+        self._items.clear()
+        return True
+
+    def removeByIndex(self, index: int):
+        self._items.pop(index)
+        return True
+
+    def contains(self, item):
+        return any(x is item for x in self._items)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+class ValueInput(Base):
+    def __init__(self, valueType: int, value):
+        self.valueType = valueType
+        self._value = value
+
+    @staticmethod
+    def createByReal(value: float):
+        return ValueInput(ValueTypes.RealValueType, value)
+
+    @staticmethod
+    def createByString(value: str):
+        return ValueInput(ValueTypes.StringValueType, value)
+
+    @staticmethod
+    def createByObject(value):
+        return ValueInput(ValueTypes.ObjectValueType, value)
+
+    @property
+    def realValue(self):
+        if self.valueType == ValueTypes.RealValueType:
+            return self._value
+        if self.valueType == ValueTypes.StringValueType:
+            [number, *unit] = str(self._value).split()
+            return math.radians(float(number)) if unit == ['deg'] else float(number)
+        return 0
+
+    @property
+    def stringValue(self):
+        return str(self._value)
+
+class UserInterface(Base):
+    def __init__(self):
+        self.messages: list[str] = []
+
+    def messageBox(self, text: str, title: str = '', *args):
+        self.messages.append(text)
+        return 0
+
+class Document(Base):
+    def __init__(self, name: str = 'Untitled'):
+        self.name = name
+
+class Application(Base):
+    _instance: 'Application' = None
+
+    def __init__(self):
+        self.userInterface = UserInterface()
+        self.logMessages: list[str] = []
+        self._activeProduct = None
+
+    @staticmethod
+    def get():
+        if Application._instance is None:
+            Application._instance = Application()
+        return Application._instance
+
+    @property
+    def activeProduct(self):
+        if self._activeProduct is None:
+            from . import fusion
+            self._activeProduct = fusion.Design()
+        return self._activeProduct
+
+    def newDesign(self):
+        from . import fusion
+        self._activeProduct = fusion.Design()
+        return self._activeProduct
+
+    def log(self, message: str, level: int = LogLevels.InfoLogLevel, logType: int = LogTypes.ConsoleLogType):
+        self.logMessages.append(message)
+
+# types which are only referenced in annotations by the add-in code
+def __getattr__(name: str):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    placeholder = type(name, (Base,), {})
+    globals()[name] = placeholder
+    return placeholder
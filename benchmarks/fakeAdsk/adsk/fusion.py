@@ -0,0 +1,1430 @@
+import itertools
+import math
+
+from . import core, recorder
+
+TOLERANCE = 0.000001
+
+class FeatureOperations:
+    JoinFeatureOperation = 0
+    CutFeatureOperation = 1
+    IntersectFeatureOperation = 2
+    NewBodyFeatureOperation = 3
+    NewComponentFeatureOperation = 4
+
+FEATURE_OPERATION_NAMES = {
+    FeatureOperations.JoinFeatureOperation: 'join',
+    FeatureOperations.CutFeatureOperation: 'cut',
+    FeatureOperations.IntersectFeatureOperation: 'intersect',
+    FeatureOperations.NewBodyFeatureOperation: 'newBody',
+    FeatureOperations.NewComponentFeatureOperation: 'newComponent',
+}
+
+class ExtentDirections:
+    PositiveExtentDirection = 0
+    NegativeExtentDirection = 1
+    SymmetricExtentDirection = 2
+
+class PatternDistanceType:
+    ExtentPatternDistanceType = 0
+    SpacingPatternDistanceType = 1
+
+class DimensionOrientations:
+    AlignedDimensionOrientation = 0
+    HorizontalDimensionOrientation = 1
+    VerticalDimensionOrientation = 2
+
+class SurfaceExtendTypes:
+    NaturalSurfaceExtendType = 0
+    TangentSurfaceExtendType = 1
+    PerpendicularSurfaceExtendType = 2
+
+class SweepOrientationTypes:
+    ParallelOrientationType = 0
+    PerpendicularOrientationType = 1
+
+class DesignTypes:
+    DirectDesignType = 0
+    ParametricDesignType = 1
+
+_ids = itertools.count(1)
+
+def _add(a: tuple, b: tuple):
+    return tuple(a[i] + b[i] for i in range(3))
+
+def _scale(a: tuple, factor: float):
+    return tuple(x * factor for x in a)
+
+def _dot(a: tuple, b: tuple):
+    return sum(a[i] * b[i] for i in range(3))
+
+def _toTuple(point):
+    if isinstance(point, tuple):
+        return point
+    if isinstance(point, SketchPoint):
+        point = point.worldGeometry
+    return (point.x, point.y, point.z)
+
+def _boxOf(points: list[tuple]):
+    return (
+        tuple(min(p[i] for p in points) for i in range(3)),
+        tuple(max(p[i] for p in points) for i in range(3)),
+    )
+
+def _boxUnion(boxes: list[tuple]):
+    return _boxOf([box[0] for box in boxes] + [box[1] for box in boxes])
+
+def _boxIntersection(a: tuple, b: tuple):
+    minPoint = tuple(max(a[0][i], b[0][i]) for i in range(3))
+    maxPoint = tuple(max(minPoint[i], min(a[1][i], b[1][i])) for i in range(3))
+    return (minPoint, maxPoint)
+
+def _boxesTouch(a: tuple, b: tuple):
+    return all(a[0][i] <= b[1][i] + TOLERANCE and b[0][i] <= a[1][i] + TOLERANCE for i in range(3))
+
+def _boundingBox(box: tuple):
+    return core.BoundingBox3D(core.Point3D(*box[0]), core.Point3D(*box[1]))
+
+def _axisOf(normal: tuple):
+    axis = max(range(3), key=lambda i: abs(normal[i]))
+    return (axis, 1 if normal[axis] > 0 else -1)
+
+# sketch (u, v) axes for a plane with a given outward normal, u x v == normal
+_FRAME_AXES = {
+    (0, 1): ((0, 1, 0), (0, 0, 1)),
+    (0, -1): ((0, 1, 0), (0, 0, -1)),
+    (1, 1): ((0, 0, 1), (1, 0, 0)),
+    (1, -1): ((0, 0, 1), (-1, 0, 0)),
+    (2, 1): ((1, 0, 0), (0, 1, 0)),
+    (2, -1): ((1, 0, 0), (0, -1, 0)),
+}
+
+class _Frame:
+    def __init__(self, origin: tuple, u: tuple, v: tuple, normal: tuple):
+        self.origin = origin
+        self.u = u
+        self.v = v
+        self.normal = normal
+
+    @staticmethod
+    def forNormal(axis: int, sign: int, coordinate: float):
+        [u, v] = _FRAME_AXES[(axis, sign)]
+        normal = tuple(sign if i == axis else 0 for i in range(3))
+        origin = tuple(coordinate if i == axis else 0 for i in range(3))
+        return _Frame(origin, u, v, normal)
+
+    def offset(self, distance: float):
+        return _Frame(_add(self.origin, _scale(self.normal, distance)), self.u, self.v, self.normal)
+
+    def toModel(self, a: float, b: float, c: float = 0):
+        return _add(self.origin, _add(_scale(self.u, a), _add(_scale(self.v, b), _scale(self.normal, c))))
+
+    def toSketch(self, point: tuple):
+        relative = _add(point, _scale(self.origin, -1))
+        return (_dot(relative, self.u), _dot(relative, self.v), _dot(relative, self.normal))
+
+    def mirror(self, point: tuple):
+        distance = _dot(_add(point, _scale(self.origin, -1)), self.normal)
+        return _add(point, _scale(self.normal, -2 * distance))
+
+def _frameOf(entity):
+    if isinstance(entity, (ConstructionPlane, BRepFace, Sketch)):
+        return entity._frame
+    if isinstance(entity, Profile):
+        return entity.parentSketch._frame
+    raise TypeError(f'Unsupported planar entity {entity}')
+
+class _Collection(core.Base):
+    def __init__(self, items: list = None):
+        self._items = [] if items is None else items
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index: int):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+class BRepBodies(_Collection):
+    def itemByName(self, name: str):
+        return next((body for body in self._items if body.name == name), None)
+
+class BRepFaces(_Collection):
+    pass
+
+class BRepEdges(_Collection):
+    pass
+
+class BRepVertices(_Collection):
+    pass
+
+class BRepVertex(core.Base):
+    def __init__(self, point: tuple):
+        self._point = point
+
+    @property
+    def geometry(self):
+        return core.Point3D(*self._point)
+
+class CurveEvaluator3D(core.Base):
+    def __init__(self, edge: 'BRepEdge'):
+        self._edge = edge
+
+    def getEndPoints(self):
+        return (True, self._edge.startVertex.geometry, self._edge.endVertex.geometry)
+
+class BRepEdge(core.Base):
+    def __init__(self, body: 'BRepBody', startVertex: BRepVertex, endVertex: BRepVertex):
+        self.body = body
+        self.startVertex = startVertex
+        self.endVertex = endVertex
+        self.tempId = next(_ids)
+        self._faces: list['BRepFace'] = []
+
+    @property
+    def boundingBox(self):
+        return _boundingBox(_boxOf([self.startVertex._point, self.endVertex._point]))
+
+    @property
+    def length(self):
+        return math.dist(self.startVertex._point, self.endVertex._point)
+
+    @property
+    def evaluator(self):
+        return CurveEvaluator3D(self)
+
+    @property
+    def faces(self):
+        return BRepFaces(list(self._faces))
+
+    @property
+    def tangentiallyConnectedEdges(self):
+        loop = list(self._faces[0]._edges) if len(self._faces) > 0 else [self]
+        index = loop.index(self)
+        return BRepEdges(loop[index:] + loop[:index])
+
+class Plane(core.Base):
+    def __init__(self, frame: _Frame):
+        self.origin = core.Point3D(*frame.origin)
+        self.normal = core.Vector3D(*frame.normal)
+
+class BRepFace(core.Base):
+    def __init__(self, body: 'BRepBody', axis: int, sign: int, box: tuple, edges: list[BRepEdge]):
+        self.body = body
+        self._axis = axis
+        self._sign = sign
+        self._box = box
+        self._edges = edges
+        self._frame = _Frame.forNormal(axis, sign, box[0][axis])
+        self.tempId = next(_ids)
+        for edge in edges:
+            edge._faces.append(self)
+
+    @property
+    def boundingBox(self):
+        return _boundingBox(self._box)
+
+    @property
+    def edges(self):
+        return BRepEdges(list(self._edges))
+
+    @property
+    def vertices(self):
+        return BRepVertices([edge.startVertex for edge in self._edges])
+
+    @property
+    def area(self):
+        [a, b] = [i for i in range(3) if i != self._axis]
+        return (self._box[1][a] - self._box[0][a]) * (self._box[1][b] - self._box[0][b])
+
+    @property
+    def geometry(self):
+        return Plane(self._frame)
+
+    @property
+    def pointOnFace(self):
+        return core.Point3D(*[(self._box[0][i] + self._box[1][i]) / 2 for i in range(3)])
+
+    def _extent(self):
+        points = [self._frame.toSketch(corner) for corner in [self._box[0], self._box[1]]]
+        return (
+            min(p[0] for p in points), min(p[1] for p in points),
+            max(p[0] for p in points), max(p[1] for p in points),
+        )
+
+class BRepBody(core.Base):
+    def __init__(self, component: 'Component', box: tuple, name: str = 'Body', isSolid: bool = True, faceNormals: list[tuple] = None):
+        self.parentComponent = component
+        self.name = name
+        self.isSolid = isSolid
+        self.isVisible = True
+        self._id = next(_ids)
+        self._revision = 0
+        self._faceNormals = faceNormals
+        self._box = box
+        self._faces: list[BRepFace] = None
+        self._edges: list[BRepEdge] = None
+
+    def _setBox(self, box: tuple):
+        self._box = box
+        self._revision += 1
+        self._faces = None
+        self._edges = None
+
+    def _buildTopology(self):
+        corners = {}
+        for bits in itertools.product((0, 1), repeat=3):
+            corners[bits] = BRepVertex(tuple(self._box[bits[i]][i] for i in range(3)))
+        edges = {}
+        for bits in itertools.product((0, 1), repeat=3):
+            for axis in range(3):
+                if bits[axis] == 0:
+                    otherBits = tuple(1 if i == axis else bits[i] for i in range(3))
+                    edges[(bits, otherBits)] = BRepEdge(self, corners[bits], corners[otherBits])
+        faces = []
+        usedEdges = []
+        for axis in range(3):
+            for side in (0, 1):
+                sign = 1 if side == 1 else -1
+                if self._faceNormals is not None and not (axis, sign) in self._faceNormals:
+                    continue
+                faceEdges = [edge for (start, end), edge in edges.items() if start[axis] == side and end[axis] == side]
+                faceBox = (
+                    tuple(self._box[side][i] if i == axis else self._box[0][i] for i in range(3)),
+                    tuple(self._box[side][i] if i == axis else self._box[1][i] for i in range(3)),
+                )
+                faces.append(BRepFace(self, axis, sign, faceBox, faceEdges))
+                usedEdges = usedEdges + [edge for edge in faceEdges if not edge in usedEdges]
+        self._faces = BRepFaces(faces)
+        self._edges = BRepEdges(usedEdges)
+
+    @property
+    def faces(self):
+        if self._faces is None:
+            self._buildTopology()
+        return self._faces
+
+    @property
+    def edges(self):
+        if self._edges is None:
+            self._buildTopology()
+        return self._edges
+
+    @property
+    def vertices(self):
+        return BRepVertices(list({id(edge.startVertex): edge.startVertex for edge in self.edges}.values()))
+
+    @property
+    def boundingBox(self):
+        return _boundingBox(self._box)
+
+    @property
+    def volume(self):
+        return math.prod(self._box[1][i] - self._box[0][i] for i in range(3))
+
+    @property
+    def revisionId(self):
+        return f'{self._id}:{self._revision}'
+
+    @property
+    def entityToken(self):
+        return f'body:{self._id}'
+
+    def _faceAt(self, axis: int, sign: int, coordinate: float):
+        for face in self.faces:
+            if face._axis == axis and face._sign == sign and abs(face._box[0][axis] - coordinate) <= TOLERANCE:
+                return face
+        return None
+
+class SketchPoint(core.Base):
+    def __init__(self, sketch: 'Sketch', point: tuple):
+        self.parentSketch = sketch
+        self._point = point
+
+    @property
+    def geometry(self):
+        return core.Point3D(*self._point)
+
+    @property
+    def worldGeometry(self):
+        return core.Point3D(*self.parentSketch._frame.toModel(*self._point))
+
+def _sketchPoint(sketch: 'Sketch', point):
+    if isinstance(point, SketchPoint):
+        return point
+    return SketchPoint(sketch, (point.x, point.y, point.z))
+
+class SketchCurve(core.Base):
+    def __init__(self, sketch: 'Sketch'):
+        self.parentSketch = sketch
+        self.isConstruction = False
+        self.isFixed = False
+
+    def _points(self) -> list[SketchPoint]:
+        return []
+
+    def _extentPoints(self) -> list[tuple]:
+        return [point._point for point in self._points()]
+
+class SketchLine(SketchCurve):
+    def __init__(self, sketch: 'Sketch', startSketchPoint: SketchPoint, endSketchPoint: SketchPoint):
+        super().__init__(sketch)
+        self.startSketchPoint = startSketchPoint
+        self.endSketchPoint = endSketchPoint
+
+    @property
+    def length(self):
+        return math.dist(self.startSketchPoint._point, self.endSketchPoint._point)
+
+    def _points(self):
+        return [self.startSketchPoint, self.endSketchPoint]
+
+class SketchCircle(SketchCurve):
+    def __init__(self, sketch: 'Sketch', centerSketchPoint: SketchPoint, radius: float):
+        super().__init__(sketch)
+        self.centerSketchPoint = centerSketchPoint
+        self.radius = radius
+
+    def _points(self):
+        return [self.centerSketchPoint]
+
+    def _extentPoints(self):
+        [x, y, z] = self.centerSketchPoint._point
+        return [(x - self.radius, y - self.radius, z), (x + self.radius, y + self.radius, z)]
+
+class SketchArc(SketchCurve):
+    def __init__(self, sketch: 'Sketch', centerSketchPoint: SketchPoint, startSketchPoint: SketchPoint, endSketchPoint: SketchPoint):
+        super().__init__(sketch)
+        self.centerSketchPoint = centerSketchPoint
+        self.startSketchPoint = startSketchPoint
+        self.endSketchPoint = endSketchPoint
+
+    @property
+    def radius(self):
+        return math.dist(self.centerSketchPoint._point, self.startSketchPoint._point)
+
+    def _points(self):
+        return [self.startSketchPoint, self.endSketchPoint]
+
+class SketchLineList(_Collection):
+    pass
+
+class SketchLines(_Collection):
+    def __init__(self, sketch: 'Sketch'):
+        super().__init__()
+        self._sketch = sketch
+
+    def addByTwoPoints(self, startPoint, endPoint):
+        line = SketchLine(self._sketch, _sketchPoint(self._sketch, startPoint), _sketchPoint(self._sketch, endPoint))
+        self._items.append(line)
+        return line
+
+    def addTwoPointRectangle(self, pointOne, pointTwo):
+        [x1, y1] = [pointOne.x, pointOne.y] if not isinstance(pointOne, SketchPoint) else pointOne._point[:2]
+        [x2, y2] = [pointTwo.x, pointTwo.y] if not isinstance(pointTwo, SketchPoint) else pointTwo._point[:2]
+        corners = [SketchPoint(self._sketch, point) for point in [(x1, y1, 0), (x2, y1, 0), (x2, y2, 0), (x1, y2, 0)]]
+        lines = [SketchLine(self._sketch, corners[i], corners[(i + 1) % 4]) for i in range(4)]
+        self._items.extend(lines)
+        return SketchLineList(lines)
+
+class SketchCircles(_Collection):
+    def __init__(self, sketch: 'Sketch'):
+        super().__init__()
+        self._sketch = sketch
+
+    def addByCenterRadius(self, centerPoint, radius: float):
+        circle = SketchCircle(self._sketch, _sketchPoint(self._sketch, centerPoint), radius)
+        self._items.append(circle)
+        return circle
+
+class SketchArcs(_Collection):
+    def __init__(self, sketch: 'Sketch'):
+        super().__init__()
+        self._sketch = sketch
+
+    def addByCenterStartSweep(self, centerPoint, startPoint, sweepAngle: float):
+        center = _sketchPoint(self._sketch, centerPoint)
+        start = _sketchPoint(self._sketch, startPoint)
+        [cx, cy, _] = center._point
+        [sx, sy, sz] = start._point
+        cos = math.cos(sweepAngle)
+        sin = math.sin(sweepAngle)
+        end = SketchPoint(self._sketch, (cx + (sx - cx) * cos - (sy - cy) * sin, cy + (sx - cx) * sin + (sy - cy) * cos, sz))
+        arc = SketchArc(self._sketch, center, start, end)
+        self._items.append(arc)
+        return arc
+
+    def addByThreePoints(self, startPoint, point, endPoint):
+        start = _sketchPoint(self._sketch, startPoint)
+        end = _sketchPoint(self._sketch, endPoint)
+        [ax, ay, z] = start._point
+        [bx, by] = [point.x, point.y]
+        [cx, cy, _] = end._point
+        d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+        centerX = ((ax * ax + ay * ay) * (by - cy) + (bx * bx + by * by) * (cy - ay) + (cx * cx + cy * cy) * (ay - by)) / d
+        centerY = ((ax * ax + ay * ay) * (cx - bx) + (bx * bx + by * by) * (ax - cx) + (cx * cx + cy * cy) * (bx - ax)) / d
+        arc = SketchArc(self._sketch, SketchPoint(self._sketch, (centerX, centerY, z)), start, end)
+        self._items.append(arc)
+        return arc
+
+    def addFillet(self, firstEntity: SketchLine, firstEntityPoint, secondEntity: SketchLine, secondEntityPoint, radius: float):
+        # corner shared by both lines stays where it is, only connectivity matters for profiles
+        shared = next((p for p in firstEntity._points() if p in secondEntity._points()), firstEntity.endSketchPoint)
+        arc = SketchArc(self._sketch, SketchPoint(self._sketch, shared._point), shared, shared)
+        self._items.append(arc)
+        return arc
+
+class SketchCurves(core.Base):
+    def __init__(self, sketch: 'Sketch'):
+        self.sketchLines = SketchLines(sketch)
+        self.sketchCircles = SketchCircles(sketch)
+        self.sketchArcs = SketchArcs(sketch)
+
+    def _all(self) -> list[SketchCurve]:
+        return list(self.sketchLines) + list(self.sketchCircles) + list(self.sketchArcs)
+
+    @property
+    def count(self):
+        return len(self._all())
+
+    def item(self, index: int):
+        return self._all()[index]
+
+    def __iter__(self):
+        return iter(self._all())
+
+class SketchEntityList(_Collection):
+    def _append(self, entity):
+        self._items.append(entity)
+        return entity
+
+class SketchDimension(core.Base):
+    def __init__(self, kind: str, entities: tuple):
+        self.kind = kind
+        self.entities = entities
+
+class SketchDimensions(SketchEntityList):
+    def addDistanceDimension(self, pointOne, pointTwo, orientation: int, textPoint, isDriving: bool = True):
+        return self._append(SketchDimension('distance', (pointOne, pointTwo)))
+
+    def addDiameterDimension(self, entity, textPoint, isDriving: bool = True):
+        return self._append(SketchDimension('diameter', (entity,)))
+
+    def addRadialDimension(self, entity, textPoint, isDriving: bool = True):
+        return self._append(SketchDimension('radial', (entity,)))
+
+    def addAngularDimension(self, lineOne, lineTwo, textPoint, isDriving: bool = True):
+        return self._append(SketchDimension('angular', (lineOne, lineTwo)))
+
+class GeometricConstraint(core.Base):
+    def __init__(self, kind: str, entities: tuple):
+        self.kind = kind
+        self.entities = entities
+
+class GeometricConstraints(SketchEntityList):
+    def __getattr__(self, name: str):
+        if not name.startswith('add'):
+            raise AttributeError(name)
+        return lambda *entities: self._append(GeometricConstraint(name[3:], entities))
+
+class AreaProperties(core.Base):
+    def __init__(self, area: float):
+        self.area = area
+
+class Profile(core.Base):
+    def __init__(self, sketch: 'Sketch', extent: tuple):
+        self.parentSketch = sketch
+        self._extent = extent
+
+    def areaProperties(self, *args):
+        return AreaProperties((self._extent[2] - self._extent[0]) * (self._extent[3] - self._extent[1]))
+
+    @property
+    def boundingBox(self):
+        # sketch space, like Fusion
+        return _boundingBox(((self._extent[0], self._extent[1], 0), (self._extent[2], self._extent[3], 0)))
+
+class Profiles(_Collection):
+    pass
+
+class Sketch(core.Base):
+    def __init__(self, component: 'Component', frame: _Frame, referencePlane):
+        self.parentComponent = component
+        self.referencePlane = referencePlane
+        self.name = 'Sketch'
+        self.isVisible = True
+        self._frame = frame
+        self.sketchCurves = SketchCurves(self)
+        self.sketchDimensions = SketchDimensions()
+        self.geometricConstraints = GeometricConstraints()
+        self.originPoint = SketchPoint(self, (0, 0, 0))
+        self.timelineObject = component._nextTimelineObject(self)
+
+    @property
+    def origin(self):
+        return core.Point3D(*self._frame.origin)
+
+    def modelToSketchSpace(self, point: core.Point3D):
+        return core.Point3D(*self._frame.toSketch(_toTuple(point)))
+
+    def sketchToModelSpace(self, point: core.Point3D):
+        return core.Point3D(*self._frame.toModel(point.x, point.y, point.z))
+
+    @property
+    def sketchPoints(self):
+        points = [self.originPoint]
+        for curve in self.sketchCurves:
+            points = points + [point for point in curve._points() if not point in points]
+        return SketchEntityList(points)
+
+    @property
+    def profiles(self):
+        curves = [curve for curve in self.sketchCurves if not curve.isConstruction]
+        groups: list[list[SketchCurve]] = []
+        for curve in curves:
+            connected = [group for group in groups if not isinstance(curve, SketchCircle) and any(not isinstance(other, SketchCircle) and any(point in other._points() for point in curve._points()) for other in group)]
+            merged = [curve]
+            for group in connected:
+                groups.remove(group)
+                merged = group + merged
+            groups.append(merged)
+        profiles = []
+        for group in groups:
+            points = [point for curve in group for point in curve._extentPoints()]
+            profiles.append(Profile(self, (
+                min(p[0] for p in points), min(p[1] for p in points),
+                max(p[0] for p in points), max(p[1] for p in points),
+            )))
+        return Profiles(profiles)
+
+class Sketches(_Collection):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+
+    def add(self, planarEntity, occurrenceForCreation=None):
+        sketch = Sketch(self._component, _frameOf(planarEntity), planarEntity)
+        if isinstance(planarEntity, BRepFace):
+            # edges of the face are projected into the sketch like Fusion does by default
+            corners = {}
+            for edge in planarEntity._edges:
+                for vertex in [edge.startVertex, edge.endVertex]:
+                    if not id(vertex) in corners:
+                        corners[id(vertex)] = SketchPoint(sketch, sketch._frame.toSketch(vertex._point))
+                sketch.sketchCurves.sketchLines._items.append(SketchLine(sketch, corners[id(edge.startVertex)], corners[id(edge.endVertex)]))
+        self._items.append(sketch)
+        recorder.record('sketch', self._component.name, projectedCurves=sketch.sketchCurves.count)
+        return sketch
+
+class ConstructionPoint(core.Base):
+    def __init__(self, point: tuple):
+        self._point = point
+
+    @property
+    def geometry(self):
+        return core.Point3D(*self._point)
+
+class ConstructionAxis(core.Base):
+    def __init__(self, point: tuple, direction: tuple, name: str = 'Axis'):
+        self.name = name
+        self.isLightBulbOn = True
+        self._point = point
+        self._direction = direction
+
+class ConstructionAxisInput(core.Base):
+    def setByNormalToFaceAtPoint(self, face: BRepFace, pointEntity):
+        self._point = _toTuple(pointEntity)
+        self._direction = face._frame.normal
+        return True
+
+    def setByLine(self, line):
+        self._point = (0, 0, 0)
+        self._direction = (0, 0, 1)
+        return True
+
+class ConstructionAxes(_Collection):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+
+    def createInput(self, occurrenceForCreation=None):
+        return ConstructionAxisInput()
+
+    def add(self, input: ConstructionAxisInput):
+        axis = ConstructionAxis(input._point, input._direction)
+        axis.timelineObject = self._component._nextTimelineObject(axis)
+        self._items.append(axis)
+        recorder.record('constructionAxis', self._component.name)
+        return axis
+
+class ConstructionPlane(core.Base):
+    def __init__(self, frame: _Frame, name: str = 'Plane'):
+        self.name = name
+        self.isLightBulbOn = True
+        self._frame = frame
+
+    @property
+    def geometry(self):
+        return Plane(self._frame)
+
+class ConstructionPlaneInput(core.Base):
+    def setByOffset(self, planarEntity, offset: core.ValueInput):
+        self._frame = _frameOf(planarEntity).offset(offset.realValue)
+        return True
+
+    def setByPlane(self, plane: Plane):
+        self._frame = _Frame.forNormal(*_axisOf(_toTuple(plane.normal)), _dot(_toTuple(plane.origin), _toTuple(plane.normal)))
+        return True
+
+class ConstructionPlanes(_Collection):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+
+    def createInput(self, occurrenceForCreation=None):
+        return ConstructionPlaneInput()
+
+    def add(self, input: ConstructionPlaneInput):
+        plane = ConstructionPlane(input._frame)
+        plane.timelineObject = self._component._nextTimelineObject(plane)
+        self._items.append(plane)
+        recorder.record('constructionPlane', self._component.name)
+        return plane
+
+class TimelineObject(core.Base):
+    def __init__(self, entity, index: int):
+        self.entity = entity
+        self.index = index
+        self.isSuppressed = False
+        self.isRolledBack = False
+
+    @property
+    def name(self):
+        return getattr(self.entity, 'name', '')
+
+    def rollTo(self, rollBefore: bool):
+        recorder.record('rollTo', '', index=self.index, rollBefore=rollBefore)
+        return True
+
+class TimelineGroup(_Collection):
+    def __init__(self, objects: list[TimelineObject]):
+        super().__init__(objects)
+        self.name = 'Group'
+        self.isCollapsed = True
+
+class TimelineGroups(_Collection):
+    def __init__(self, timeline: 'Timeline'):
+        super().__init__()
+        self._timeline = timeline
+
+    def add(self, startIndex: int, endIndex: int):
+        group = TimelineGroup([obj for obj in self._timeline._objects if startIndex <= obj.index <= endIndex])
+        self._items.append(group)
+        return group
+
+class Timeline(_Collection):
+    def __init__(self):
+        super().__init__()
+        self._objects: list[TimelineObject] = []
+        self.timelineGroups = TimelineGroups(self)
+        self.markerPosition = 0
+
+    def _append(self, entity):
+        timelineObject = TimelineObject(entity, len(self._objects))
+        self._objects.append(timelineObject)
+        self._items = self._objects
+        self.markerPosition = len(self._objects)
+        return timelineObject
+
+    def moveToEnd(self):
+        self.markerPosition = len(self._objects)
+        return True
+
+class Feature(core.Base):
+    def __init__(self, component: 'Component', bodies: list[BRepBody], name: str):
+        self.parentComponent = component
+        self.name = name
+        self.isSuppressed = False
+        self._bodies = bodies
+        self.timelineObject = component._nextTimelineObject(self)
+
+    @property
+    def bodies(self):
+        return BRepBodies(list(self._bodies))
+
+    @property
+    def faces(self):
+        return BRepFaces([face for body in self._bodies for face in body.faces])
+
+class FeatureCollection(_Collection):
+    kind = 'feature'
+
+    def __init__(self, features: 'Features'):
+        super().__init__()
+        self._features = features
+
+    @property
+    def _component(self) -> 'Component':
+        return self._features._component
+
+    def _register(self, feature: Feature, **details):
+        self._items.append(feature)
+        self._features._items.append(feature)
+        recorder.record(self.kind, self._component.name, **details)
+        return feature
+
+class DistanceExtentDefinition(core.Base):
+    def __init__(self, distance: core.ValueInput):
+        self.distance = distance
+
+    @staticmethod
+    def create(distance: core.ValueInput):
+        return DistanceExtentDefinition(distance)
+
+class ExtrudeFeatureInput(core.Base):
+    def __init__(self, profile, operation: int):
+        self.profile = profile
+        self.operation = operation
+        self.participantBodies = []
+        self.isSolid = True
+        self._distance = 0
+        self._taperAngle = 0
+
+    def setOneSideExtent(self, extent: DistanceExtentDefinition, direction: int, taperAngle: core.ValueInput = None):
+        distance = extent.distance.realValue
+        self._distance = -distance if direction == ExtentDirections.NegativeExtentDirection else distance
+        self._taperAngle = 0 if taperAngle is None else taperAngle.realValue
+        return True
+
+    def setDistanceExtent(self, isSymmetric: bool, distance: core.ValueInput):
+        self._distance = distance.realValue
+        return True
+
+class ExtrudeFeature(Feature):
+    def __init__(self, component: 'Component', bodies: list[BRepBody], startFaces: list[BRepFace], endFaces: list[BRepFace]):
+        super().__init__(component, bodies, 'Extrude')
+        self._startFaces = startFaces
+        self._endFaces = endFaces
+
+    @property
+    def startFaces(self):
+        return BRepFaces(list(self._startFaces))
+
+    @property
+    def endFaces(self):
+        return BRepFaces(list(self._endFaces))
+
+def _footprints(profile) -> list[tuple]:
+    if isinstance(profile, (core.ObjectCollection, list, tuple, _Collection)):
+        return [footprint for item in profile for footprint in _footprints(item)]
+    if isinstance(profile, Profile):
+        return [(profile.parentSketch._frame, profile._extent)]
+    if isinstance(profile, BRepFace):
+        return [(profile._frame, profile._extent())]
+    raise TypeError(f'Unsupported extrude profile {profile}')
+
+def _groupTouchingBoxes(boxes: list[tuple]):
+    groups: list[list[tuple]] = []
+    for box in boxes:
+        connected = [group for group in groups if any(_boxesTouch(box, other) for other in group)]
+        merged = [box]
+        for group in connected:
+            groups.remove(group)
+            merged = group + merged
+        groups.append(merged)
+    return [_boxUnion(group) for group in groups]
+
+class ExtrudeFeatures(FeatureCollection):
+    kind = 'extrude'
+
+    def createInput(self, profile, operation: int):
+        return ExtrudeFeatureInput(profile, operation)
+
+    def addSimple(self, profile, distance: core.ValueInput, operation: int):
+        extrudeInput = self.createInput(profile, operation)
+        extrudeInput.setDistanceExtent(False, distance)
+        return self.add(extrudeInput)
+
+    def add(self, input: ExtrudeFeatureInput):
+        component = self._component
+        footprints = _footprints(input.profile)
+        boxes = []
+        for frame, [u0, v0, u1, v1] in footprints:
+            boxes.append(_boxOf([frame.toModel(u, v, h) for u in (u0, u1) for v in (v0, v1) for h in (0, input._distance)]))
+        [frame, _] = footprints[0]
+        [axis, sign] = _axisOf(frame.normal)
+        endSign = sign if input._distance >= 0 else -sign
+        startCoordinate = frame.origin[axis]
+        endCoordinate = frame.toModel(0, 0, input._distance)[axis]
+
+        participants = list(input.participantBodies) or [body for body in component.bRepBodies if any(_boxesTouch(body._box, box) for box in boxes)]
+        if input.operation == FeatureOperations.NewBodyFeatureOperation:
+            bodies = [component.bRepBodies._create(box) for box in _groupTouchingBoxes(boxes)]
+        elif input.operation == FeatureOperations.JoinFeatureOperation and len(participants) > 0:
+            participants[0]._setBox(_boxUnion([participants[0]._box] + boxes))
+            bodies = participants[:1]
+        elif input.operation == FeatureOperations.IntersectFeatureOperation:
+            for body in participants:
+                body._setBox(_boxIntersection(body._box, _boxUnion(boxes)))
+            bodies = participants
+        else:
+            for body in participants:
+                body._revision += 1
+            bodies = participants
+
+        startFaces = []
+        endFaces = []
+        if not input.operation in [FeatureOperations.CutFeatureOperation, FeatureOperations.IntersectFeatureOperation]:
+            startFaces = [face for face in [body._faceAt(axis, -endSign, startCoordinate) for body in bodies] if face is not None]
+            endFaces = [face for face in [body._faceAt(axis, endSign, endCoordinate) for body in bodies] if face is not None]
+        feature = ExtrudeFeature(component, bodies, startFaces, endFaces)
+        return self._register(
+            feature,
+            operation=FEATURE_OPERATION_NAMES[input.operation],
+            profileCount=len(footprints),
+            distance=input._distance,
+            taperAngle=input._taperAngle,
+            bodyCount=len(bodies),
+        )
+
+def _edgeList(edges) -> list[BRepEdge]:
+    return [edge for edge in edges]
+
+class FilletEdgeSetInputs(_Collection):
+    def addConstantRadiusEdgeSet(self, edges, radius: core.ValueInput, isTangentChain: bool):
+        edgeSet = (_edgeList(edges), radius.realValue, isTangentChain)
+        self._items.append(edgeSet)
+        return edgeSet
+
+class FilletFeatureInput(core.Base):
+    def __init__(self):
+        self.edgeSetInputs = FilletEdgeSetInputs()
+        self.isRollingBallCorner = False
+        self.isTangentChain = True
+
+class FilletFeatures(FeatureCollection):
+    kind = 'fillet'
+
+    def createInput(self):
+        return FilletFeatureInput()
+
+    def add(self, input: FilletFeatureInput):
+        edges = [edge for edgeSet in input.edgeSetInputs for edge in edgeSet[0]]
+        bodies = list({id(edge.body): edge.body for edge in edges}.values())
+        for body in bodies:
+            body._revision += 1
+        return self._register(
+            Feature(self._component, bodies, 'Fillet'),
+            edgeSetCount=input.edgeSetInputs.count,
+            edgeCount=len(edges),
+            radii=[edgeSet[1] for edgeSet in input.edgeSetInputs],
+        )
+
+class ChamferEdgeSets(_Collection):
+    def addEqualDistanceChamferEdgeSet(self, edges, distance: core.ValueInput, isTangentChain: bool):
+        edgeSet = (_edgeList(edges), distance.realValue, isTangentChain)
+        self._items.append(edgeSet)
+        return edgeSet
+
+    def addTwoDistancesChamferEdgeSet(self, edges, distanceOne: core.ValueInput, distanceTwo: core.ValueInput, isFlipped: bool, isTangentChain: bool):
+        edgeSet = (_edgeList(edges), distanceOne.realValue, isTangentChain)
+        self._items.append(edgeSet)
+        return edgeSet
+
+class ChamferFeatureInput(core.Base):
+    def __init__(self):
+        self.chamferEdgeSets = ChamferEdgeSets()
+
+class ChamferFeatures(FeatureCollection):
+    kind = 'chamfer'
+
+    def createInput2(self):
+        return ChamferFeatureInput()
+
+    def add(self, input: ChamferFeatureInput):
+        edges = [edge for edgeSet in input.chamferEdgeSets for edge in edgeSet[0]]
+        bodies = list({id(edge.body): edge.body for edge in edges}.values())
+        for body in bodies:
+            body._revision += 1
+        return self._register(
+            Feature(self._component, bodies, 'Chamfer'),
+            edgeSetCount=input.chamferEdgeSets.count,
+            edgeCount=len(edges),
+        )
+
+class CombineFeatureInput(core.Base):
+    def __init__(self, targetBody: BRepBody, toolBodies):
+        self.targetBody = targetBody
+        self.toolBodies = toolBodies
+        self.operation = FeatureOperations.JoinFeatureOperation
+        self.isKeepToolBodies = False
+        self.isNewComponent = False
+
+class CombineFeatures(FeatureCollection):
+    kind = 'combine'
+
+    def createInput(self, targetBody: BRepBody, toolBodies):
+        return CombineFeatureInput(targetBody, toolBodies)
+
+    def add(self, input: CombineFeatureInput):
+        target = input.targetBody
+        tools = [body for body in input.toolBodies]
+        if input.operation == FeatureOperations.JoinFeatureOperation:
+            target._setBox(_boxUnion([target._box] + [tool._box for tool in tools]))
+        elif input.operation == FeatureOperations.IntersectFeatureOperation:
+            target._setBox(_boxIntersection(target._box, _boxUnion([tool._box for tool in tools])))
+        else:
+            target._revision += 1
+        if not input.isKeepToolBodies:
+            for tool in tools:
+                if not tool is target:
+                    self._component.bRepBodies._remove(tool)
+        bodies = [target] + (tools if input.isKeepToolBodies else [])
+        return self._register(
+            Feature(self._component, bodies, 'Combine'),
+            operation=FEATURE_OPERATION_NAMES[input.operation],
+            toolCount=len(tools),
+            keepTools=input.isKeepToolBodies,
+        )
+
+def _patternBodies(inputEntities) -> list[BRepBody]:
+    bodies = []
+    for entity in inputEntities:
+        if isinstance(entity, Feature):
+            bodies = bodies + list(entity._bodies)
+        else:
+            bodies.append(entity)
+    return bodies
+
+class RectangularPatternFeatureInput(core.Base):
+    def __init__(self, inputEntities, directionOneEntity, quantityOne: core.ValueInput, distanceOne: core.ValueInput, patternDistanceType: int):
+        self.inputEntities = inputEntities
+        self.directionOneEntity = directionOneEntity
+        self.quantityOne = quantityOne
+        self.distanceOne = distanceOne
+        self.patternDistanceType = patternDistanceType
+        self.directionTwoEntity = None
+        self.quantityTwo = core.ValueInput.createByReal(1)
+        self.distanceTwo = core.ValueInput.createByReal(0)
+
+class RectangularPatternFeatures(FeatureCollection):
+    kind = 'rectangularPattern'
+
+    def createInput(self, inputEntities, directionOneEntity, quantityOne: core.ValueInput, distanceOne: core.ValueInput, patternDistanceType: int):
+        return RectangularPatternFeatureInput(inputEntities, directionOneEntity, quantityOne, distanceOne, patternDistanceType)
+
+    def add(self, input: RectangularPatternFeatureInput):
+        sources = _patternBodies(input.inputEntities)
+        quantityOne = max(1, int(round(input.quantityOne.realValue)))
+        quantityTwo = max(1, int(round(input.quantityTwo.realValue)))
+        directionOne = input.directionOneEntity._direction
+        directionTwo = input.directionTwoEntity._direction if input.directionTwoEntity is not None else (0, 0, 0)
+        copies = []
+        for i in range(quantityOne):
+            for j in range(quantityTwo):
+                if i == 0 and j == 0:
+                    continue
+                shift = _add(_scale(directionOne, i * input.distanceOne.realValue), _scale(directionTwo, j * input.distanceTwo.realValue))
+                for body in sources:
+                    copies.append(self._component.bRepBodies._create((_add(body._box[0], shift), _add(body._box[1], shift)), body.name))
+        return self._register(
+            Feature(self._component, copies, 'Rectangular pattern'),
+            inputCount=len(sources),
+            quantity=quantityOne * quantityTwo,
+            bodyCount=len(copies),
+        )
+
+class CircularPatternFeatureInput(core.Base):
+    def __init__(self, inputEntities, axis: ConstructionAxis):
+        self.inputEntities = inputEntities
+        self.axis = axis
+        self.quantity = core.ValueInput.createByReal(1)
+        self.totalAngle = core.ValueInput.createByString('360 deg')
+        self.isSymmetric = False
+
+class CircularPatternFeatures(FeatureCollection):
+    kind = 'circularPattern'
+
+    def createInput(self, inputEntities, axis: ConstructionAxis):
+        return CircularPatternFeatureInput(inputEntities, axis)
+
+    def add(self, input: CircularPatternFeatureInput):
+        sources = _patternBodies(input.inputEntities)
+        quantity = max(1, int(round(input.quantity.realValue)))
+        [cx, cy, _] = input.axis._point
+        copies = []
+        for i in range(1, quantity):
+            angle = input.totalAngle.realValue * i / quantity
+            for body in sources:
+                corners = [(x, y, z) for x in (body._box[0][0], body._box[1][0]) for y in (body._box[0][1], body._box[1][1]) for z in (body._box[0][2], body._box[1][2])]
+                rotated = [(cx + (x - cx) * math.cos(angle) - (y - cy) * math.sin(angle), cy + (x - cx) * math.sin(angle) + (y - cy) * math.cos(angle), z) for [x, y, z] in corners]
+                copies.append(self._component.bRepBodies._create(_boxOf(rotated), body.name))
+        return self._register(
+            Feature(self._component, sources + copies, 'Circular pattern'),
+            inputCount=len(sources),
+            quantity=quantity,
+            bodyCount=len(copies),
+        )
+
+class MirrorFeatureInput(core.Base):
+    def __init__(self, inputEntities, mirrorPlane):
+        self.inputEntities = inputEntities
+        self.mirrorPlane = mirrorPlane
+
+class MirrorFeatures(FeatureCollection):
+    kind = 'mirror'
+
+    def createInput(self, inputEntities, mirrorPlane):
+        return MirrorFeatureInput(inputEntities, mirrorPlane)
+
+    def add(self, input: MirrorFeatureInput):
+        frame = _frameOf(input.mirrorPlane)
+        sources = _patternBodies(input.inputEntities)
+        copies = [self._component.bRepBodies._create(_boxOf([frame.mirror(body._box[0]), frame.mirror(body._box[1])]), body.name) for body in sources]
+        return self._register(Feature(self._component, copies, 'Mirror'), inputCount=len(sources), bodyCount=len(copies))
+
+class OffsetFeatureInput(core.Base):
+    def __init__(self, entities, distance: core.ValueInput, operation: int, isChainSelection: bool):
+        self.entities = entities
+        self.distance = distance
+        self.operation = operation
+
+class OffsetFeatures(FeatureCollection):
+    kind = 'offsetFaces'
+
+    def createInput(self, entities, distance: core.ValueInput, operation: int, isChainSelection: bool = True):
+        return OffsetFeatureInput(entities, distance, operation, isChainSelection)
+
+    def add(self, input: OffsetFeatureInput):
+        faces = [face for face in input.entities]
+        surface = self._component.bRepBodies._create(
+            _boxUnion([face._box for face in faces]),
+            'Surface',
+            isSolid=False,
+            faceNormals=list({(face._axis, face._sign) for face in faces}),
+        )
+        return self._register(Feature(self._component, [surface], 'Offset'), faceCount=len(faces))
+
+class ExtendFeatureInput(core.Base):
+    def __init__(self, edges, distance: core.ValueInput, extendType: int, isChainSelection: bool):
+        self.edges = edges
+        self.distance = distance
+        self.extendType = extendType
+
+class ExtendFeatures(FeatureCollection):
+    kind = 'extend'
+
+    def createInput(self, edges, distance: core.ValueInput, extendType: int, isChainSelection: bool = True):
+        return ExtendFeatureInput(edges, distance, extendType, isChainSelection)
+
+    def add(self, input: ExtendFeatureInput):
+        bodies = list({id(edge.body): edge.body for edge in input.edges}.values())
+        return self._register(Feature(self._component, bodies, 'Extend'), edgeCount=input.edges.count)
+
+class ThickenFeatureInput(core.Base):
+    def __init__(self, inputFaces, thickness: core.ValueInput, isSymmetric: bool, operation: int, isChainSelection: bool):
+        self.inputFaces = inputFaces
+        self.thickness = thickness
+        self.operation = operation
+
+class ThickenFeatures(FeatureCollection):
+    kind = 'thicken'
+
+    def createInput(self, inputFaces, thickness: core.ValueInput, isSymmetric: bool, operation: int, isChainSelection: bool = True):
+        return ThickenFeatureInput(inputFaces, thickness, isSymmetric, operation, isChainSelection)
+
+    def add(self, input: ThickenFeatureInput):
+        thickness = input.thickness.realValue
+        [minPoint, maxPoint] = _boxUnion([face._box for face in input.inputFaces])
+        body = self._component.bRepBodies._create((_add(minPoint, (-thickness,) * 3), _add(maxPoint, (thickness,) * 3)))
+        return self._register(Feature(self._component, [body], 'Thicken'), faceCount=input.inputFaces.count)
+
+class RemoveFeatures(FeatureCollection):
+    kind = 'remove'
+
+    def add(self, itemToRemove: BRepBody):
+        self._component.bRepBodies._remove(itemToRemove)
+        return self._register(Feature(self._component, [], 'Remove'))
+
+class ShellFeatureInput(core.Base):
+    def __init__(self, inputEntities, isTangentChain: bool):
+        self.inputEntities = inputEntities
+        self.isTangentChain = isTangentChain
+        self.insideThickness = core.ValueInput.createByReal(0)
+        self.outsideThickness = core.ValueInput.createByReal(0)
+
+class ShellFeatures(FeatureCollection):
+    kind = 'shell'
+
+    def createInput(self, inputEntities, isTangentChain: bool = True):
+        return ShellFeatureInput(inputEntities, isTangentChain)
+
+    def add(self, input: ShellFeatureInput):
+        bodies = list({id(face.body): face.body for face in input.inputEntities}.values())
+        for body in bodies:
+            body._revision += 1
+        return self._register(Feature(self._component, bodies, 'Shell'), faceCount=input.inputEntities.count)
+
+class SplitBodyFeatureInput(core.Base):
+    def __init__(self, splitBodies, splittingTool, isSplittingToolExtended: bool):
+        self.splitBodies = splitBodies
+        self.splittingTool = splittingTool
+
+class SplitBodyFeatures(FeatureCollection):
+    kind = 'splitBody'
+
+    def createInput(self, splitBodies, splittingTool, isSplittingToolExtended: bool):
+        return SplitBodyFeatureInput(splitBodies, splittingTool, isSplittingToolExtended)
+
+    def add(self, input: SplitBodyFeatureInput):
+        body: BRepBody = input.splitBodies
+        frame = _frameOf(input.splittingTool)
+        [axis, _] = _axisOf(frame.normal)
+        coordinate = frame.origin[axis]
+        bodies = [body]
+        if body._box[0][axis] + TOLERANCE < coordinate < body._box[1][axis] - TOLERANCE:
+            upperBox = (tuple(coordinate if i == axis else body._box[0][i] for i in range(3)), body._box[1])
+            body._setBox((body._box[0], tuple(coordinate if i == axis else body._box[1][i] for i in range(3))))
+            bodies.append(self._component.bRepBodies._create(upperBox, body.name))
+        return self._register(Feature(self._component, bodies, 'Split body'), bodyCount=len(bodies))
+
+class CopyPasteBodies(FeatureCollection):
+    kind = 'copyPaste'
+
+    def add(self, sourceBodies):
+        sources = [sourceBodies] if isinstance(sourceBodies, BRepBody) else _patternBodies(sourceBodies)
+        copies = [self._component.bRepBodies._create(body._box, body.name) for body in sources]
+        return self._register(Feature(self._component, copies, 'Copy paste body'), bodyCount=len(copies))
+
+class MoveFeatureInput(core.Base):
+    def __init__(self, inputEntities):
+        self.inputEntities = inputEntities
+        self._translation = (0, 0, 0)
+
+    def defineAsTranslateXYZ(self, xDistance: core.ValueInput, yDistance: core.ValueInput, zDistance: core.ValueInput, isDesignSpace: bool):
+        self._translation = (xDistance.realValue, yDistance.realValue, zDistance.realValue)
+        return True
+
+    def defineAsFreeMove(self, transform: core.Matrix3D):
+        self._translation = tuple(transform.translation.asArray())
+        return True
+
+class MoveFeatures(FeatureCollection):
+    kind = 'move'
+
+    def createInput2(self, inputEntities):
+        return MoveFeatureInput(inputEntities)
+
+    def add(self, input: MoveFeatureInput):
+        bodies = _patternBodies(input.inputEntities)
+        for body in bodies:
+            body._setBox((_add(body._box[0], input._translation), _add(body._box[1], input._translation)))
+        return self._register(Feature(self._component, bodies, 'Move'), bodyCount=len(bodies))
+
+class Path(_Collection):
+    pass
+
+def _chainedCurves(curve: SketchCurve) -> list[SketchCurve]:
+    curves = [other for other in curve.parentSketch.sketchCurves if not other.isConstruction]
+    chain = [curve]
+    isGrowing = True
+    while isGrowing:
+        connected = [other for other in curves if not other in chain and any(point in item._points() for item in chain for point in other._points())]
+        chain = chain + connected
+        isGrowing = len(connected) > 0
+    return chain
+
+class SweepFeatureInput(core.Base):
+    def __init__(self, profile, path: Path, operation: int):
+        self.profile = profile
+        self.path = path
+        self.operation = operation
+        self.orientation = SweepOrientationTypes.PerpendicularOrientationType
+        self.participantBodies = []
+        self.isSolid = True
+
+class SweepFeatures(FeatureCollection):
+    kind = 'sweep'
+
+    def createInput(self, profile, path: Path, operation: int):
+        return SweepFeatureInput(profile, path, operation)
+
+    def add(self, input: SweepFeatureInput):
+        component = self._component
+        footprints = _footprints(input.profile)
+        # the swept volume is approximated by the box spanned by the path and the profile
+        points = [frame.toModel(u, v) for frame, [u0, v0, u1, v1] in footprints for u in (u0, u1) for v in (v0, v1)]
+        points = points + [point.parentSketch._frame.toModel(*point._point) for curve in input.path for point in curve._points()]
+        box = _boxOf(points)
+        participants = list(input.participantBodies) or [body for body in component.bRepBodies if _boxesTouch(body._box, box)]
+        if input.operation == FeatureOperations.NewBodyFeatureOperation:
+            bodies = [component.bRepBodies._create(box)]
+        elif input.operation == FeatureOperations.JoinFeatureOperation and len(participants) > 0:
+            participants[0]._setBox(_boxUnion([participants[0]._box, box]))
+            bodies = participants[:1]
+        else:
+            for body in participants:
+                body._revision += 1
+            bodies = participants
+        return self._register(
+            Feature(component, bodies, 'Sweep'),
+            operation=FEATURE_OPERATION_NAMES[input.operation],
+            profileCount=len(footprints),
+            pathCurveCount=input.path.count,
+            bodyCount=len(bodies),
+        )
+
+class BaseFeature(Feature):
+    def __init__(self, component: 'Component'):
+        super().__init__(component, [], 'Base feature')
+        self.isEditing = False
+
+    def startEdit(self):
+        self.isEditing = True
+        return True
+
+    def finishEdit(self):
+        self.isEditing = False
+        return True
+
+class BaseFeatures(FeatureCollection):
+    kind = 'baseFeature'
+
+    def add(self):
+        return self._register(BaseFeature(self._component))
+
+class TemporaryBRepManager(core.Base):
+    _instance: 'TemporaryBRepManager' = None
+
+    @staticmethod
+    def get():
+        if TemporaryBRepManager._instance is None:
+            TemporaryBRepManager._instance = TemporaryBRepManager()
+        return TemporaryBRepManager._instance
+
+    def copy(self, body: BRepBody):
+        # temporary bodies belong to no component until they are added to one
+        recorder.record('temporaryCopy', body.parentComponent.name if body.parentComponent is not None else '')
+        return BRepBody(None, body._box, body.name, body.isSolid, body._faceNormals)
+
+    def transform(self, body: BRepBody, transform: core.Matrix3D):
+        shift = tuple(transform.translation.asArray())
+        body._setBox((_add(body._box[0], shift), _add(body._box[1], shift)))
+        return True
+
+class Features(_Collection):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+        self.extrudeFeatures = ExtrudeFeatures(self)
+        self.filletFeatures = FilletFeatures(self)
+        self.chamferFeatures = ChamferFeatures(self)
+        self.combineFeatures = CombineFeatures(self)
+        self.rectangularPatternFeatures = RectangularPatternFeatures(self)
+        self.circularPatternFeatures = CircularPatternFeatures(self)
+        self.mirrorFeatures = MirrorFeatures(self)
+        self.offsetFeatures = OffsetFeatures(self)
+        self.extendFeatures = ExtendFeatures(self)
+        self.thickenFeatures = ThickenFeatures(self)
+        self.removeFeatures = RemoveFeatures(self)
+        self.shellFeatures = ShellFeatures(self)
+        self.splitBodyFeatures = SplitBodyFeatures(self)
+        self.copyPasteBodies = CopyPasteBodies(self)
+        self.moveFeatures = MoveFeatures(self)
+        self.sweepFeatures = SweepFeatures(self)
+        self.baseFeatures = BaseFeatures(self)
+
+    def createPath(self, curve, isChain: bool = True):
+        return Path(_chainedCurves(curve) if isChain else [curve])
+
+class ComponentBodies(BRepBodies):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+
+    def _create(self, box: tuple, name: str = 'Body', isSolid: bool = True, faceNormals: list[tuple] = None):
+        body = BRepBody(self._component, box, name, isSolid, faceNormals)
+        self._items.append(body)
+        return body
+
+    def _remove(self, body: BRepBody):
+        self._items = [item for item in self._items if item is not body]
+
+    def add(self, body: BRepBody, baseFeature: 'BaseFeature' = None):
+        added = self._create(body._box, body.name, body.isSolid, body._faceNormals)
+        if baseFeature is not None:
+            baseFeature._bodies.append(added)
+        return added
+
+class Occurrence(core.Base):
+    def __init__(self, component: 'Component', timelineObject: TimelineObject):
+        self.component = component
+        self.timelineObject = timelineObject
+        self.isActive = False
+
+    def activate(self):
+        self.isActive = True
+        return True
+
+class Occurrences(_Collection):
+    def __init__(self, component: 'Component'):
+        super().__init__()
+        self._component = component
+
+    def addNewComponent(self, transform: core.Matrix3D):
+        design = self._component.parentDesign
+        component = Component(design, f'Component{len(design._components)}')
+        occurrence = Occurrence(component, design.timeline._append(component))
+        self._items.append(occurrence)
+        return occurrence
+
+class Component(core.Base):
+    def __init__(self, design: 'Design', name: str):
+        self.parentDesign = design
+        self.name = name
+        self.features = Features(self)
+        self.sketches = Sketches(self)
+        self.constructionPlanes = ConstructionPlanes(self)
+        self.constructionAxes = ConstructionAxes(self)
+        self.bRepBodies = ComponentBodies(self)
+        self.occurrences = Occurrences(self)
+        self.xYConstructionPlane = ConstructionPlane(_Frame.forNormal(2, 1, 0), 'XY')
+        self.yZConstructionPlane = ConstructionPlane(_Frame.forNormal(0, 1, 0), 'YZ')
+        self.xZConstructionPlane = ConstructionPlane(_Frame((0, 0, 0), (1, 0, 0), (0, 0, -1), (0, 1, 0)), 'XZ')
+        self.xConstructionAxis = ConstructionAxis((0, 0, 0), (1, 0, 0), 'X')
+        self.yConstructionAxis = ConstructionAxis((0, 0, 0), (0, 1, 0), 'Y')
+        self.zConstructionAxis = ConstructionAxis((0, 0, 0), (0, 0, 1), 'Z')
+        self.originConstructionPoint = ConstructionPoint((0, 0, 0))
+        design._components.append(self)
+
+    def _nextTimelineObject(self, entity):
+        return self.parentDesign.timeline._append(entity)
+
+class Design(core.Base):
+    def __init__(self):
+        self.designType = DesignTypes.ParametricDesignType
+        self.timeline = Timeline()
+        self.parentDocument = core.Document()
+        self._components: list[Component] = []
+        self.rootComponent = Component(self, 'root')
+
+    @property
+    def allComponents(self):
+        return _Collection(list(self._components))
+
+# types which are only referenced in annotations by the add-in code
+def __getattr__(name: str):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    placeholder = type(name, (core.Base,), {})
+    globals()[name] = placeholder
+    return placeholder
@@ -0,0 +1,51 @@
+import time
+
+# Operation kinds which end up as timeline features in a real design
+FEATURE_KINDS = [
+    'extrude',
+    'fillet',
+    'chamfer',
+    'rectangularPattern',
+    'circularPattern',
+    'mirror',
+    'combine',
+    'offsetFaces',
+    'extend',
+    'thicken',
+    'remove',
+    'shell',
+    'splitBody',
+    'copyPaste',
+    'move',
+    'sweep',
+    'baseFeature',
+]
+
+operations: list[dict] = []
+
+def reset():
+    operations.clear()
+
+def record(kind: str, component: str, **details):
+    operation = {
+        'index': len(operations),
+        'kind': kind,
+        'component': component,
+        'time': time.perf_counter(),
+    }
+    operation.update(details)
+    operations.append(operation)
+    return operation
+
+def countByKind(ops: list[dict] = None):
+    result: dict[str, int] = {}
+    for operation in (operations if ops is None else ops):
+        result[operation['kind']] = result.get(operation['kind'], 0) + 1
+    return result
+
+def featureCount(ops: list[dict] = None):
+    counts = countByKind(ops)
+    return sum(counts.get(kind, 0) for kind in FEATURE_KINDS)
+
+def combineToolCount(ops: list[dict] = None):
+    return sum(operation.get('toolCount', 0) for operation in (operations if ops is None else ops) if operation['kind'] == 'combine')
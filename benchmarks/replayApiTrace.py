@@ -0,0 +1,123 @@
+import argparse
+import json
+import statistics
+
+import benchmarkUtils
+import runBenchmarks
+
+apiProxyUtils = benchmarkUtils.loadAddinModule('lib.apiProxyUtils')
+
+def loadTrace(path: str):
+    with open(path) as traceFile:
+        trace = json.load(traceFile)
+    if trace.get('format') != apiProxyUtils.API_TRACE_FORMAT:
+        raise ValueError(f'{path} is not an api trace, record one with api_trace = yes in the [TRACING] config section')
+    return trace
+
+def buildCostModel(traces: list[dict]):
+    # median measured duration per api, kinds are the fallback for apis the traces never hit
+    byApi: dict[str, list[float]] = {}
+    byKind: dict[str, list[float]] = {}
+    for trace in traces:
+        for event in trace['events']:
+            byApi.setdefault(event['api'], []).append(event['time'])
+            byKind.setdefault(event['kind'], []).append(event['time'])
+    return {
+        'sources': [trace['name'] + ' ' + trace.get('recordedAt', '') for trace in traces],
+        'apis': {api: {'count': len(times), 'median': statistics.median(times), 'mean': statistics.mean(times)} for api, times in sorted(byApi.items())},
+        'kinds': {kind: statistics.median(times) for kind, times in sorted(byKind.items())},
+    }
+
+def eventCost(event: dict, model: dict):
+    apiModel = model['apis'].get(event['api'])
+    if apiModel is not None:
+        return apiModel['median'], True
+    return model['kinds'].get(event['kind'], 0), False
+
+def predict(events: list[dict], model: dict):
+    total = 0
+    byCaller: dict[str, float] = {}
+    unknownApis: dict[str, int] = {}
+    for event in events:
+        cost, isKnown = eventCost(event, model)
+        total += cost
+        byCaller[event['caller']] = byCaller.get(event['caller'], 0) + cost
+        if not isKnown:
+            unknownApis[event['api']] = unknownApis.get(event['api'], 0) + 1
+    return {
+        'predictedApiTime': total,
+        'events': len(events),
+        'byCaller': dict(sorted(byCaller.items(), key=lambda x: x[1], reverse=True)),
+        'unknownApis': unknownApis,
+    }
+
+def loadModel(path: str):
+    with open(path) as modelFile:
+        return json.load(modelFile)
+
+def commandModel(args):
+    model = buildCostModel([loadTrace(path) for path in args.traces])
+    with open(args.output, 'w') as modelFile:
+        json.dump(model, modelFile, indent=1)
+    print(f'{len(model["apis"])} apis from {len(args.traces)} trace(s) written to {args.output}')
+
+def commandReplay(args):
+    model = loadModel(args.model)
+    for path in args.traces:
+        trace = loadTrace(path)
+        prediction = predict(trace['events'], model)
+        print(f'{trace["name"]} ({path}): {prediction["events"]} api events, recorded api time {trace["apiTime"]:.1f} ms, predicted {prediction["predictedApiTime"]:.1f} ms')
+        for caller, cost in list(prediction['byCaller'].items())[:args.top]:
+            print(f'    {caller}: {cost:.1f} ms')
+        if len(prediction['unknownApis']) > 0:
+            print(f'    {len(prediction["unknownApis"])} apis not in the model, costed by kind')
+
+def commandScore(args):
+    model = loadModel(args.model)
+    configurations = [configuration for configuration in runBenchmarks.CONFIGURATIONS if args.filter is None or args.filter in configuration[0]]
+    results = []
+    for name, generator, options in configurations:
+        result = runBenchmarks.runConfiguration(generator, options, recordApiSequence=True)
+        prediction = predict(result.pop('apiTrace')['events'], model)
+        results.append({
+            'name': name,
+            'features': result['features'],
+            'apiEvents': prediction['events'],
+            'unknownApis': sum(prediction['unknownApis'].values()),
+            'predictedMs': round(prediction['predictedApiTime'], 1),
+        })
+    nameWidth = max(len(result['name']) for result in results)
+    columns = ['features', 'apiEvents', 'unknownApis', 'predictedMs']
+    print(' '.join(['configuration'.ljust(nameWidth)] + columns))
+    for result in results:
+        print(' '.join([result['name'].ljust(nameWidth)] + [str(result[column]).rjust(len(column)) for column in columns]))
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a cost model from api traces recorded in Fusion 360 and score generator runs with it offline')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    modelParser = subparsers.add_parser('model', help='build a cost model out of recorded api traces')
+    modelParser.add_argument('traces', nargs='+', help='*_apitrace_*.json files')
+    modelParser.add_argument('--output', default='costModel.json', help='cost model file to write')
+    modelParser.set_defaults(handler=commandModel)
+
+    replayParser = subparsers.add_parser('replay', help='replay recorded api traces against a cost model')
+    replayParser.add_argument('traces', nargs='+', help='*_apitrace_*.json files')
+    replayParser.add_argument('--model', required=True, help='cost model file')
+    replayParser.add_argument('--top', type=int, default=10, help='number of most expensive callers to print')
+    replayParser.set_defaults(handler=commandReplay)
+
+    scoreParser = subparsers.add_parser('score', help='run the benchmark configurations offline and predict their api time in Fusion')
+    scoreParser.add_argument('--model', required=True, help='cost model file')
+    scoreParser.add_argument('--filter', help='only run configurations whose name contains this text')
+    scoreParser.add_argument('--json', help='write results to this file')
+    scoreParser.set_defaults(handler=commandScore)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+if __name__ == '__main__':
+    main()
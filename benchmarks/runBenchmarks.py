@@ -0,0 +1,242 @@
+import argparse
+import json
+import math
+import time
+
+import benchmarkUtils
+import adsk.core, adsk.fusion
+
+const = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.const')
+baseGenerator = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.baseGenerator')
+baseGeneratorInput = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.baseGeneratorInput')
+binBodyGenerator = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.binBodyGenerator')
+binShellGenerator = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.binShellGenerator')
+binBodyGeneratorInput = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.binBodyGeneratorInput')
+baseplateGenerator = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.baseplateGenerator')
+baseplateGeneratorInput = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.baseplateGeneratorInput')
+apiProxyUtils = benchmarkUtils.loadAddinModule('lib.apiProxyUtils')
+templateCacheUtils = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.templateCacheUtils')
+feasibilityUtils = benchmarkUtils.loadAddinModule('lib.gridfinityUtils.feasibilityUtils')
+
+def baseInput(component: adsk.fusion.Component, options: dict):
+    input = baseGeneratorInput.BaseGeneratorInput()
+    input.originPoint = component.originConstructionPoint.geometry
+    input.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    input.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    input.xyClearance = const.BIN_XY_CLEARANCE
+    input.hasScrewHoles = options.get('screwHoles', False)
+    input.hasMagnetCutouts = options.get('magnetCutouts', False)
+    input.screwHolesDiameter = const.DIMENSION_SCREW_HOLE_DIAMETER
+    input.magnetCutoutsDiameter = const.DIMENSION_MAGNET_CUTOUT_DIAMETER
+    input.magnetCutoutsDepth = const.DIMENSION_MAGNET_CUTOUT_DEPTH
+    input.isSweepProfile = options.get('sweepBaseProfile', False)
+    return input
+
+def binBodyInput(options: dict):
+    input = binBodyGeneratorInput.BinBodyGeneratorInput()
+    input.hasLip = options.get('lip', True)
+    input.hasLipNotches = options.get('lipNotches', False)
+    input.binWidth = options.get('width', 1)
+    input.binLength = options.get('length', 1)
+    input.binHeight = options.get('height', 5)
+    input.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    input.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    input.heightUnit = const.DIMENSION_DEFAULT_HEIGHT_UNIT
+    input.xyTolerance = const.BIN_XY_CLEARANCE
+    input.isSolid = options.get('solid', False) or options.get('shelled', False)
+    input.wallThickness = const.BIN_WALL_THICKNESS
+    input.hasScoop = options.get('scoop', False)
+    input.scoopMaxRadius = const.BIN_SCOOP_MAX_RADIUS
+    input.hasTab = options.get('tab', False)
+    input.tabLength = 1
+    input.tabWidth = const.BIN_TAB_WIDTH
+    input.tabPosition = 0
+    input.tabOverhangAngle = math.radians(const.BIN_TAB_OVERHANG_ANGLE)
+    input.compartmentsByX = options.get('compartmentsX', 1)
+    input.compartmentsByY = options.get('compartmentsY', 1)
+    input.isProfileCutout = options.get('profileCutouts', False)
+    input.isSweepBaseProfile = options.get('sweepBaseProfile', False)
+    if 'compartments' in options:
+        input.compartments = [binBodyGeneratorInput.BinBodyCompartmentDefinition(*compartment) for compartment in options['compartments']]
+    else:
+        input.compartments = binBodyGenerator.uniformCompartments(input.compartmentsByX, input.compartmentsByY)
+    return input
+
+class InfeasibleConfiguration(Exception):
+    pass
+
+def feasibleBinBodyInput(options: dict):
+    # the bin command checks feasibility before generation, configurations it would reject fail here too
+    input = binBodyInput(options)
+    issues = feasibilityUtils.checkBinBodyFeasibility(input)
+    if not feasibilityUtils.isFeasible(issues):
+        raise InfeasibleConfiguration(feasibilityUtils.formatIssues([issue for issue in issues if issue.isError]))
+    return input
+
+def runBase(component: adsk.fusion.Component, options: dict):
+    baseGenerator.createGridfinityBase(baseInput(component, options), component)
+
+def runBinBody(component: adsk.fusion.Component, options: dict):
+    binBodyGenerator.createGridfinityBinBody(feasibleBinBodyInput(options), component)
+
+def runBinBodySeries(component: adsk.fusion.Component, options: dict):
+    # several bins in their own components of one design, like a user filling a drawer
+    design = component.parentDesign
+    if options.get('templateCache', False):
+        templateCacheUtils.startSession(design)
+    try:
+        binBodyGenerator.createGridfinityBinBody(feasibleBinBodyInput(options), component)
+        for _ in range(options.get('count', 1) - 1):
+            occurrence = design.rootComponent.occurrences.addNewComponent(adsk.core.Matrix3D.create())
+            binBodyGenerator.createGridfinityBinBody(feasibleBinBodyInput(options), occurrence.component)
+    finally:
+        templateCacheUtils.stopSession()
+
+def runBin(component: adsk.fusion.Component, options: dict):
+    # mirrors the base + pattern + body + merge sequence of the bin command
+    bodyInput = feasibleBinBodyInput(options)
+    if options.get('singleProfileBase', False):
+        binBody = binBodyGenerator.createGridfinityBinBody(bodyInput, component)
+        baseGenerator.createGridfinityBaseGrid(baseInput(component, options), bodyInput.binWidth, bodyInput.binLength, component, binBody)
+        if options.get('shelled', False):
+            binShellGenerator.shellGridfinityBin(binBody, bodyInput, True, options.get('shellCutout', False), component)
+        return
+    baseBody = baseGenerator.createGridfinityBase(baseInput(component, options), component)
+    rectangularPatternFeatures = component.features.rectangularPatternFeatures
+    patternInputBodies = adsk.core.ObjectCollection.create()
+    patternInputBodies.add(baseBody)
+    patternInput = rectangularPatternFeatures.createInput(patternInputBodies,
+        component.xConstructionAxis,
+        adsk.core.ValueInput.createByReal(bodyInput.binWidth),
+        adsk.core.ValueInput.createByReal(bodyInput.baseWidth),
+        adsk.fusion.PatternDistanceType.SpacingPatternDistanceType)
+    patternInput.directionTwoEntity = component.yConstructionAxis
+    patternInput.quantityTwo = adsk.core.ValueInput.createByReal(bodyInput.binLength)
+    patternInput.distanceTwo = adsk.core.ValueInput.createByReal(bodyInput.baseLength)
+    rectangularPattern = rectangularPatternFeatures.add(patternInput)
+    binBody = binBodyGenerator.createGridfinityBinBody(bodyInput, component)
+    toolBodies = adsk.core.ObjectCollection.create()
+    toolBodies.add(baseBody)
+    for body in rectangularPattern.bodies:
+        toolBodies.add(body)
+    combineFeatures = component.features.combineFeatures
+    combineFeatures.add(combineFeatures.createInput(binBody, toolBodies))
+    if options.get('shelled', False):
+        binShellGenerator.shellGridfinityBin(binBody, bodyInput, True, options.get('shellCutout', False), component)
+
+def runBaseplate(component: adsk.fusion.Component, options: dict):
+    input = baseplateGeneratorInput.BaseplateGeneratorInput()
+    input.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    input.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    input.xyClearance = const.BIN_XY_CLEARANCE
+    input.baseplateWidth = options.get('width', 1)
+    input.baseplateLength = options.get('length', 1)
+    input.hasExtendedBottom = not options.get('light', False)
+    input.hasSkeletonizedBottom = options.get('skeletonized', False)
+    input.hasMagnetCutouts = options.get('magnetCutouts', False)
+    input.magnetCutoutsDiameter = const.DIMENSION_MAGNET_CUTOUT_DIAMETER
+    input.magnetCutoutsDepth = const.DIMENSION_MAGNET_CUTOUT_DEPTH
+    input.hasScrewHoles = options.get('screwHoles', False)
+    input.screwHolesDiameter = const.DIMENSION_PLATE_SCREW_HOLE_DIAMETER
+    input.screwHeadCutoutDiameter = const.DIMENSION_SCREW_HEAD_CUTOUT_DIAMETER
+    input.hasConnectionHoles = options.get('connectionHoles', False)
+    input.connectionScrewHolesDiameter = const.DIMENSION_PLATE_CONNECTION_SCREW_HOLE_DIAMETER
+    input.bottomExtensionHeight = const.BASEPLATE_EXTRA_HEIGHT
+    input.binZClearance = const.BASEPLATE_BIN_Z_CLEARANCE
+    input.isSweepBaseProfile = options.get('sweepBaseProfile', False)
+    baseplateGenerator.createGridfinityBaseplate(input, component)
+
+GENERATORS = {
+    'base': runBase,
+    'binBody': runBinBody,
+    'bin': runBin,
+    'binBodySeries': runBinBodySeries,
+    'baseplate': runBaseplate,
+}
+
+CONFIGURATIONS = [
+    ('base plain', 'base', {}),
+    ('base magnets+screws', 'base', {'magnetCutouts': True, 'screwHoles': True}),
+    ('base magnets+screws sweep profile', 'base', {'magnetCutouts': True, 'screwHoles': True, 'sweepBaseProfile': True}),
+    ('bin body 1x1 hollow', 'binBody', {}),
+    ('bin body 1x1 solid', 'binBody', {'solid': True}),
+    ('bin body 2x2 notches', 'binBody', {'width': 2, 'length': 2, 'lipNotches': True}),
+    ('bin body 3x3 3x3 compartments', 'binBody', {'width': 3, 'length': 3, 'compartmentsX': 3, 'compartmentsY': 3}),
+    ('bin body 4x3 custom compartments', 'binBody', {'width': 4, 'length': 3, 'compartmentsX': 4, 'compartmentsY': 3, 'tab': True,
+        'compartments': [(0, 0, 2, 1), (2, 0, 2, 1), (0, 1, 1, 2), (1, 1, 1, 2), (2, 1, 2, 1, 2), (2, 2, 1, 1, 2), (3, 2, 1, 1, 2)]}),
+    ('bin body 4x3 custom compartments profile cutouts', 'binBody', {'width': 4, 'length': 3, 'compartmentsX': 4, 'compartmentsY': 3, 'tab': True, 'profileCutouts': True,
+        'compartments': [(0, 0, 2, 1), (2, 0, 2, 1), (0, 1, 1, 2), (1, 1, 1, 2), (2, 1, 2, 1, 2), (2, 2, 1, 1, 2), (3, 2, 1, 1, 2)]}),
+    ('bin body 4x4 custom shape compartments', 'binBody', {'width': 4, 'length': 4, 'compartmentsX': 4, 'compartmentsY': 6, 'tab': True,
+        'compartments': [(0, 0, 3, 1), (2, 0, 1, 6), (2, 5, 2, 1), (0, 1, 1, 4)]}),
+    ('bin body 2x2 notches x4', 'binBodySeries', {'width': 2, 'length': 2, 'lipNotches': True, 'count': 4}),
+    ('bin body 2x2 notches x4 template cache', 'binBodySeries', {'width': 2, 'length': 2, 'lipNotches': True, 'count': 4, 'templateCache': True}),
+    ('bin body 3x2 scoop+tab', 'binBody', {'width': 3, 'length': 2, 'compartmentsX': 3, 'compartmentsY': 2, 'scoop': True, 'tab': True}),
+    ('bin 2x2 magnets', 'bin', {'width': 2, 'length': 2, 'magnetCutouts': True}),
+    ('bin 3x3 shelled', 'bin', {'width': 3, 'length': 3, 'shelled': True}),
+    ('bin 3x3 shelled cutout', 'bin', {'width': 3, 'length': 3, 'shelled': True, 'shellCutout': True}),
+    ('bin 2x2 magnets single profile base', 'bin', {'width': 2, 'length': 2, 'magnetCutouts': True, 'singleProfileBase': True}),
+    ('bin 2x2 magnets sweep base profile', 'bin', {'width': 2, 'length': 2, 'magnetCutouts': True, 'sweepBaseProfile': True}),
+    ('bin 4x4 4x4 compartments', 'bin', {'width': 4, 'length': 4, 'compartmentsX': 4, 'compartmentsY': 4, 'scoop': True, 'tab': True}),
+    ('bin 4x4 4x4 compartments profile cutouts', 'bin', {'width': 4, 'length': 4, 'compartmentsX': 4, 'compartmentsY': 4, 'scoop': True, 'tab': True, 'profileCutouts': True}),
+    ('baseplate 3x3 light', 'baseplate', {'width': 3, 'length': 3, 'light': True}),
+    ('baseplate 3x3 full', 'baseplate', {'width': 3, 'length': 3, 'magnetCutouts': True, 'screwHoles': True, 'skeletonized': True, 'connectionHoles': True}),
+    ('baseplate 3x3 full sweep base profile', 'baseplate', {'width': 3, 'length': 3, 'magnetCutouts': True, 'screwHoles': True, 'skeletonized': True, 'connectionHoles': True, 'sweepBaseProfile': True}),
+    ('baseplate 8x8 full', 'baseplate', {'width': 8, 'length': 8, 'magnetCutouts': True, 'screwHoles': True, 'skeletonized': True, 'connectionHoles': True}),
+]
+
+COLUMNS = ['features', 'sketches', 'planes', 'timelineGroup', 'bodies', 'extrudes', 'fillets', 'chamfers', 'sweeps', 'patterns', 'combines', 'combineTools', 'timeMs']
+
+def runConfiguration(generator: str, options: dict, countApiRoundTrips: bool = False, recordApiSequence: bool = False):
+    component = benchmarkUtils.newComponent(generator)
+    session = apiProxyUtils.ApiProxySession(generator, recordApiSequence) if countApiRoundTrips or recordApiSequence else None
+    if session is not None:
+        session.start()
+        component = session.wrap(component)
+    startTime = time.perf_counter()
+    try:
+        GENERATORS[generator](component, options)
+    finally:
+        elapsed = time.perf_counter() - startTime
+        if session is not None:
+            session.stop()
+    result = benchmarkUtils.summarize(component)
+    result['timeMs'] = round(elapsed * 1000, 2)
+    if countApiRoundTrips:
+        result['apiRoundTrips'] = sum(count for [count, _] in session.calls.values())
+    if recordApiSequence:
+        result['apiTrace'] = session.toApiTrace()
+    return result
+
+def runAll(configurations: list = CONFIGURATIONS, countApiRoundTrips: bool = False):
+    results = []
+    for name, generator, options in configurations:
+        result = runConfiguration(generator, options, countApiRoundTrips)
+        result['name'] = name
+        result['generator'] = generator
+        result['options'] = options
+        results.append(result)
+    return results
+
+def printTable(results: list[dict]):
+    nameWidth = max(len(result['name']) for result in results)
+    columns = [column for column in COLUMNS + ['apiRoundTrips'] if column in results[0]]
+    print(' '.join(['configuration'.ljust(nameWidth)] + [column.rjust(len(column)) for column in columns]))
+    for result in results:
+        print(' '.join([result['name'].ljust(nameWidth)] + [str(result[column]).rjust(len(column)) for column in columns]))
+
+def main():
+    parser = argparse.ArgumentParser(description='Count Fusion 360 operations issued by the gridfinity generators')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--filter', help='only run configurations whose name contains this text')
+    parser.add_argument('--api-proxy', action='store_true', help='count api round trips through the proxy layer')
+    args = parser.parse_args()
+
+    configurations = [configuration for configuration in CONFIGURATIONS if args.filter is None or args.filter in configuration[0]]
+    results = runAll(configurations, args.api_proxy)
+    printTable(results)
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import csv
+import itertools
+import sys
+
+import runBenchmarks
+
+BIN_AXES = {
+    'width': list(range(1, 11)),
+    'length': list(range(1, 11)),
+    'compartmentsX': list(range(1, 9)),
+    'compartmentsY': list(range(1, 9)),
+    'lip': [False, True],
+    'lipNotches': [False, True],
+    'scoop': [False, True],
+    'tab': [False, True],
+}
+
+BASEPLATE_AXES = {
+    'width': list(range(1, 11)),
+    'length': list(range(1, 11)),
+    'plateType': ['light', 'full', 'skeletonized'],
+}
+
+QUICK_AXES = {
+    'width': [1, 2, 5, 10],
+    'length': [1, 2, 5, 10],
+    'compartmentsX': [1, 4, 8],
+    'compartmentsY': [1, 4, 8],
+}
+
+BASEPLATE_TYPE_OPTIONS = {
+    'light': {'light': True},
+    'full': {'magnetCutouts': True, 'screwHoles': True},
+    'skeletonized': {'magnetCutouts': True, 'screwHoles': True, 'skeletonized': True, 'connectionHoles': True},
+}
+
+RESULT_COLUMNS = ['features', 'sketches', 'planes', 'bodies', 'extrudes', 'fillets', 'chamfers', 'sweeps', 'patterns', 'combines', 'combineTools', 'timeMs']
+
+def parseValues(text: str, current: list):
+    if text is None:
+        return current
+    if '-' in text:
+        [start, end] = text.split('-')
+        return list(range(int(start), int(end) + 1))
+    return [int(value) for value in text.split(',')]
+
+def gridCells(axes: dict):
+    names = list(axes.keys())
+    for values in itertools.product(*[axes[name] for name in names]):
+        cell = dict(zip(names, values))
+        # notches only exist on a lip
+        if cell.get('lipNotches') and not cell.get('lip'):
+            continue
+        yield cell
+
+def binCellOptions(cell: dict):
+    return dict(cell)
+
+def baseplateCellOptions(cell: dict):
+    options = {'width': cell['width'], 'length': cell['length']}
+    options.update(BASEPLATE_TYPE_OPTIONS[cell['plateType']])
+    return options
+
+def sweep(generator: str, axes: dict, cellOptions, writer: csv.DictWriter, limit: int = None):
+    count = 0
+    for cell in gridCells(axes):
+        if limit is not None and count >= limit:
+            return count
+        try:
+            result = runBenchmarks.runConfiguration(generator, cellOptions(cell))
+        except runBenchmarks.InfeasibleConfiguration:
+            # the command would reject these inputs before generating anything
+            continue
+        row = {'generator': generator}
+        row.update(cell)
+        row.update({column: result[column] for column in RESULT_COLUMNS})
+        writer.writerow(row)
+        count += 1
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description='Sweep generator inputs over a grid and write operation counts per cell as csv')
+    parser.add_argument('--output', help='csv file to write, stdout by default')
+    parser.add_argument('--only', choices=['bin', 'baseplate'], help='sweep only one generator')
+    parser.add_argument('--with-base', action='store_true', help='generate bins with base and merge, not only the bin body')
+    parser.add_argument('--quick', action='store_true', help='use a coarse grid instead of the full one')
+    parser.add_argument('--widths', help='bin and baseplate widths, e.g. 1-10 or 1,2,4')
+    parser.add_argument('--lengths', help='bin and baseplate lengths, e.g. 1-10 or 1,2,4')
+    parser.add_argument('--compartments', help='compartments by X and Y, e.g. 1-8 or 1,4')
+    parser.add_argument('--limit', type=int, help='stop each sweep after this many cells')
+    args = parser.parse_args()
+
+    binAxes = dict(BIN_AXES)
+    baseplateAxes = dict(BASEPLATE_AXES)
+    if args.quick:
+        binAxes.update(QUICK_AXES)
+        baseplateAxes.update({'width': QUICK_AXES['width'], 'length': QUICK_AXES['length']})
+    for axes in [binAxes, baseplateAxes]:
+        axes['width'] = parseValues(args.widths, axes['width'])
+        axes['length'] = parseValues(args.lengths, axes['length'])
+    binAxes['compartmentsX'] = parseValues(args.compartments, binAxes['compartmentsX'])
+    binAxes['compartmentsY'] = parseValues(args.compartments, binAxes['compartmentsY'])
+
+    fieldNames = ['generator'] + list(dict.fromkeys(list(binAxes.keys()) + list(baseplateAxes.keys()))) + RESULT_COLUMNS
+    outputFile = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        writer = csv.DictWriter(outputFile, fieldnames=fieldNames)
+        writer.writeheader()
+        if args.only in [None, 'bin']:
+            sweep('bin' if args.with_base else 'binBody', binAxes, binCellOptions, writer, args.limit)
+        if args.only in [None, 'baseplate']:
+            sweep('baseplate', baseplateAxes, baseplateCellOptions, writer, args.limit)
+    finally:
+        if outputFile is not sys.stdout:
+            outputFile.close()
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,27 @@
 import adsk.core, adsk.fusion, traceback
 import os
+import dataclasses
 
 
 
 from ...lib import configUtils
+from ...lib import traceUtils
+from ...lib import apiProxyUtils
+from ...lib import profilingUtils
+from ...lib import telemetryUtils
+from ...lib import diagnosticsUtils
 from ...lib import fusion360utils as futil
 from ... import config
 from ...lib.gridfinityUtils.const import DIMENSION_DEFAULT_WIDTH_UNIT
 from ...lib.gridfinityUtils.baseplateGenerator import createGridfinityBaseplate
 from ...lib.gridfinityUtils.baseplateGeneratorInput import BaseplateGeneratorInput
 from ...lib.gridfinityUtils import const
+from ...lib.gridfinityUtils import feasibilityUtils
+from ...lib.gridfinityUtils import templateCacheUtils
 from .inputState import InputState
 from ...lib.ui.commandUiState import CommandUiState
 from ...lib.ui.unsupportedDesignTypeException import UnsupportedDesignTypeException
+from ...lib.ui.infeasibleInputException import InfeasibleInputException
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -24,6 +33,21 @@ CMD_NAME = 'Gridfinity baseplate'
 CMD_Description = 'Create gridfinity baseplate'
 
 uiState = CommandUiState(CMD_NAME)
+
+# generation tracing settings, read from config.ini on start
+isTracingEnabled = False
+isHelperTracingEnabled = True
+isApiProxyEnabled = False
+isApiTraceEnabled = False
+isTelemetryEnabled = False
+
+# generation settings, read from config.ini on start
+isSweepBaseProfileEnabled = False
+isTemplateCacheEnabled = False
+
+# spec keys that define a configuration family in the telemetry report
+TELEMETRY_FAMILY_KEYS = ['plateType', 'hasMagnetSockets', 'hasScrewHoles', 'hasConnectionHoles']
+
 # Specify that the command will be promoted to the panel.
 IS_PROMOTED = True
 
@@ -40,6 +64,7 @@ ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resource
 
 CONFIG_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'commandConfig')
 UI_INPUT_DEFAULTS_CONFIG_PATH = os.path.join(CONFIG_FOLDER_PATH, "ui_input_defaults.json")
+TRACES_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), traceUtils.TRACES_FOLDER_NAME)
 
 # Local list of event handlers used to maintain a reference so
 # they are not released and garbage collected.
@@ -125,12 +150,27 @@ def start():
     control.isPromoted = addinConfig['UI'].getboolean('is_promoted')
     # control.isPromoted = IS_PROMOTED
 
+    global isTracingEnabled, isHelperTracingEnabled, isApiProxyEnabled, isApiTraceEnabled, isTelemetryEnabled, isSweepBaseProfileEnabled, isTemplateCacheEnabled
+    isTracingEnabled = addinConfig.getboolean('TRACING', 'enabled', fallback=False)
+    isHelperTracingEnabled = addinConfig.getboolean('TRACING', 'trace_helpers', fallback=True)
+    isApiProxyEnabled = addinConfig.getboolean('TRACING', 'api_proxy', fallback=False)
+    isApiTraceEnabled = addinConfig.getboolean('TRACING', 'api_trace', fallback=False)
+    isTelemetryEnabled = addinConfig.getboolean('TELEMETRY', 'enabled', fallback=False)
+    isSweepBaseProfileEnabled = addinConfig.getboolean('GENERATION', 'sweep_base_profile', fallback=False)
+    isTemplateCacheEnabled = addinConfig.getboolean('GENERATION', 'template_cache', fallback=False)
+    if isTemplateCacheEnabled:
+        templateCacheUtils.registerDocumentEvents()
+    profilingUtils.configure(CMD_NAME, addinConfig, CONFIG_FOLDER_PATH)
+    diagnosticsUtils.configure(CMD_NAME, addinConfig, CONFIG_FOLDER_PATH)
+
     initUiState()
 
 
 # Executed when add-in is stopped.
 def stop():
     futil.log(f'{CMD_NAME} Command Stop Event')
+    diagnosticsUtils.stopTracing()
+    templateCacheUtils.clear()
     # Get the various UI elements for this command
     workspace = ui.workspaces.itemById(WORKSPACE_ID)
     panel = workspace.toolbarPanels.itemById(PANEL_ID)
@@ -155,6 +195,7 @@ def stop():
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     # General logging for debug.
     futil.log(f'{CMD_NAME} Command Created Event')
+    diagnosticsUtils.commandStarted(CMD_NAME, getDiagnosticsCounters())
     global uiState
 
     args.command.setDialogInitialSize(400, 500)
@@ -286,6 +327,7 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
 
 # This event handler is called when the user clicks the OK button in the command dialog or 
 # is immediately called after the created event not command inputs were created for the dialog.
+@profilingUtils.profiled(CMD_NAME, 'execute')
 def command_execute(args: adsk.core.CommandEventArgs):
     # General logging for debug.
     futil.log(f'{CMD_NAME} Command Execute Event')
@@ -293,6 +335,7 @@ def command_execute(args: adsk.core.CommandEventArgs):
 
 
 # This event handler is called when the command needs to compute a new preview in the graphics window.
+@profilingUtils.profiled(CMD_NAME, 'preview')
 def command_preview(args: adsk.core.CommandEventArgs):
     # General logging for debug.
     futil.log(f'{CMD_NAME} Command Preview Event')
@@ -365,25 +408,37 @@ def command_destroy(args: adsk.core.CommandEventArgs):
     global local_handlers
     local_handlers = []
     global uiState
+    diagnosticsUtils.commandFinished(CMD_NAME, getDiagnosticsCounters())
 
+def getDiagnosticsCounters():
+    return {
+        'localHandlers': len(local_handlers),
+        'registeredCommandInputs': len(uiState.commandInputs),
+    }
 
 def generateBaseplate(args: adsk.core.CommandEventArgs):
     futil.log(f'{CMD_NAME} Generating baseplate')
     inputsState = getInputsState()
 
+    if isTracingEnabled or isTelemetryEnabled:
+        traceUtils.startTrace(CMD_NAME, isTracingEnabled and isHelperTracingEnabled)
+    if isApiProxyEnabled or isApiTraceEnabled:
+        apiProxyUtils.startSession(CMD_NAME, isApiTraceEnabled)
+
+    telemetrySpec = dataclasses.asdict(inputsState)
+    succeeded = False
+    errorMessage = None
+    newCmpOcc = None
+
     try:
         des = adsk.fusion.Design.cast(app.activeProduct)
         if des.designType == 0:
             raise UnsupportedDesignTypeException('Timeline must be enabled for the generator to work, projects with disabled design history currently are not supported')
+        if isTemplateCacheEnabled:
+            templateCacheUtils.startSession(des)
         root = adsk.fusion.Component.cast(des.rootComponent)
         baseplateName = 'Gridfinity baseplate {}x{}'.format(int(inputsState.plateLength), int(inputsState.plateWidth))
 
-        # create new component
-        newCmpOcc = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(adsk.core.Matrix3D.create())
-
-        newCmpOcc.component.name = baseplateName
-        newCmpOcc.activate()
-        gridfinityBaseplateComponent: adsk.fusion.Component = newCmpOcc.component
         baseplateGeneratorInput = BaseplateGeneratorInput()
 
         baseplateGeneratorInput.baseWidth = inputsState.baseWidth
@@ -403,23 +458,62 @@ def generateBaseplate(args: adsk.core.CommandEventArgs):
         baseplateGeneratorInput.binZClearance = inputsState.verticalClearance
         baseplateGeneratorInput.hasConnectionHoles = inputsState.hasConnectionHoles
         baseplateGeneratorInput.connectionScrewHolesDiameter = inputsState.connectionHoleSize
+        baseplateGeneratorInput.isSweepBaseProfile = isSweepBaseProfileEnabled
+
+        feasibilityIssues = feasibilityUtils.checkBaseplateFeasibility(baseplateGeneratorInput)
+        for issue in feasibilityIssues:
+            futil.log(f'{CMD_NAME} Input {issue.kind}: {issue.message}')
+        if not feasibilityUtils.isFeasible(feasibilityIssues):
+            raise InfeasibleInputException(feasibilityUtils.formatIssues([issue for issue in feasibilityIssues if issue.isError]))
+
+        # create new component
+        newCmpOcc = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(adsk.core.Matrix3D.create())
 
-        baseplateBody = createGridfinityBaseplate(baseplateGeneratorInput, gridfinityBaseplateComponent)
-        baseplateBody.name = baseplateName
+        newCmpOcc.component.name = baseplateName
+        newCmpOcc.activate()
+        gridfinityBaseplateComponent: adsk.fusion.Component = apiProxyUtils.wrap(newCmpOcc.component)
+
+        with traceUtils.span('baseplate', width=inputsState.plateWidth, length=inputsState.plateLength, plateType=inputsState.plateType):
+            baseplateBody = createGridfinityBaseplate(baseplateGeneratorInput, gridfinityBaseplateComponent)
+            baseplateBody.name = baseplateName
 
         if des.designType == 1:
             # group features in timeline
-            plateGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + gridfinityBaseplateComponent.features.count + gridfinityBaseplateComponent.constructionPlanes.count + gridfinityBaseplateComponent.sketches.count)
-            plateGroup.name = baseplateName
+            with traceUtils.span('timeline group'):
+                plateGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + gridfinityBaseplateComponent.features.count + gridfinityBaseplateComponent.constructionPlanes.count + gridfinityBaseplateComponent.sketches.count)
+                plateGroup.name = baseplateName
+        succeeded = True
     except UnsupportedDesignTypeException as err:
         args.executeFailed = True
         args.executeFailedMessage = 'Design type is unsupported. Projects with disabled design history are unsupported, please enable timeline feature to proceed.'
+        errorMessage = str(err)
+        return False
+    except InfeasibleInputException as err:
+        args.executeFailed = True
+        args.executeFailedMessage = f'Baseplate can not be generated with the current inputs:\n{err}'
+        errorMessage = str(err)
         return False
     except Exception as err:
         args.executeFailed = True
         args.executeFailedMessage = getErrorMessage()
+        errorMessage = str(err)
         futil.log(f'{CMD_NAME} Error occurred, {err}, {getErrorMessage()}')
         return False
+    finally:
+        tracer = traceUtils.stopTrace(TRACES_FOLDER_PATH if isTracingEnabled else None)
+        apiProxyUtils.stopSession(TRACES_FOLDER_PATH)
+        templateCacheUtils.stopSession()
+        if isTelemetryEnabled:
+            telemetryUtils.appendRecord(CONFIG_FOLDER_PATH, telemetryUtils.createRecord(
+                CMD_NAME,
+                telemetryUtils.getEventName(args),
+                telemetryUtils.getFamily(telemetrySpec, TELEMETRY_FAMILY_KEYS),
+                telemetrySpec,
+                tracer,
+                newCmpOcc.component if newCmpOcc is not None else None,
+                succeeded,
+                errorMessage,
+            ))
 
 def initUiState():
     global uiState
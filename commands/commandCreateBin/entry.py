@@ -4,22 +4,29 @@ import math
 
 
 from ...lib import configUtils
+from ...lib import traceUtils
+from ...lib import apiProxyUtils
+from ...lib import profilingUtils
+from ...lib import telemetryUtils
+from ...lib import diagnosticsUtils
 from ...lib import fusion360utils as futil
 from ... import config
 from ...lib.gridfinityUtils import combineUtils
-from ...lib.gridfinityUtils import geometryUtils
-from ...lib.gridfinityUtils import faceUtils
-from ...lib.gridfinityUtils import shellUtils
 from ...lib.gridfinityUtils import commonUtils
 from ...lib.gridfinityUtils import const
-from ...lib.gridfinityUtils.baseGenerator import createGridfinityBase
+from ...lib.gridfinityUtils import compartmentLayoutUtils
+from ...lib.gridfinityUtils import feasibilityUtils
+from ...lib.gridfinityUtils import templateCacheUtils
+from ...lib.gridfinityUtils.baseGenerator import createGridfinityBase, createGridfinityBaseGrid
 from ...lib.gridfinityUtils.baseGeneratorInput import BaseGeneratorInput
 from ...lib.gridfinityUtils.binBodyGenerator import createGridfinityBinBody, uniformCompartments
 from ...lib.gridfinityUtils.binBodyGeneratorInput import BinBodyGeneratorInput, BinBodyCompartmentDefinition
 from ...lib.gridfinityUtils.binBodyTabGeneratorInput import BinBodyTabGeneratorInput
 from ...lib.gridfinityUtils.binBodyTabGenerator import createGridfinityBinBodyTab
+from ...lib.gridfinityUtils.binShellGenerator import shellGridfinityBin
 from ...lib.ui.commandUiState import CommandUiState
 from ...lib.ui.unsupportedDesignTypeException import UnsupportedDesignTypeException
+from ...lib.ui.infeasibleInputException import InfeasibleInputException
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -35,6 +42,23 @@ actualDimensionsTableUiState = CommandUiState(CMD_NAME)
 actualCompartmentDimensionsUiState = CommandUiState(CMD_NAME)
 commandCompartmentsTableUIState: list[CommandUiState] = []
 
+# generation tracing settings, read from config.ini on start
+isTracingEnabled = False
+isHelperTracingEnabled = True
+isApiProxyEnabled = False
+isApiTraceEnabled = False
+isTelemetryEnabled = False
+
+# generation settings, read from config.ini on start
+isShellCutoutEnabled = False
+isProfileCutoutEnabled = False
+isSingleProfileBaseEnabled = False
+isSweepBaseProfileEnabled = False
+isTemplateCacheEnabled = False
+
+# spec keys that define a configuration family in the telemetry report
+TELEMETRY_FAMILY_KEYS = ['type', 'generateBase', 'generateBody', 'lip', 'tab', 'compartmentsType']
+
 # Specify that the command will be promoted to the panel.
 IS_PROMOTED = True
 
@@ -51,6 +75,7 @@ ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resource
 
 CONFIG_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'commandConfig')
 UI_INPUT_DEFAULTS_CONFIG_PATH = os.path.join(CONFIG_FOLDER_PATH, "ui_input_defaults.json")
+TRACES_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), traceUtils.TRACES_FOLDER_NAME)
 
 # Local list of event handlers used to maintain a reference so
 # they are not released and garbage collected.
@@ -112,6 +137,7 @@ BIN_COMPARTMENTS_TABLE_ID = 'compartments_table'
 BIN_COMPARTMENTS_TABLE_ADD_ID = 'compartments_table_add'
 BIN_COMPARTMENTS_TABLE_REMOVE_ID = 'compartments_table_remove'
 BIN_COMPARTMENTS_TABLE_UNIFORM_ID = 'compartments_table_uniform'
+BIN_COMPARTMENTS_LAYOUT_INFO_ID = 'compartments_layout_info'
 BIN_TYPE_DROPDOWN_ID = 'bin_type'
 BIN_TYPE_HOLLOW = 'Hollow'
 BIN_TYPE_SHELLED = 'Shelled'
@@ -244,11 +270,29 @@ def start():
 
     # Specify if the command is promoted to the main toolbar.
     control.isPromoted = addinConfig['UI'].getboolean('is_promoted')
+
+    global isTracingEnabled, isHelperTracingEnabled, isApiProxyEnabled, isApiTraceEnabled, isTelemetryEnabled, isShellCutoutEnabled, isProfileCutoutEnabled, isSingleProfileBaseEnabled, isSweepBaseProfileEnabled, isTemplateCacheEnabled
+    isTracingEnabled = addinConfig.getboolean('TRACING', 'enabled', fallback=False)
+    isHelperTracingEnabled = addinConfig.getboolean('TRACING', 'trace_helpers', fallback=True)
+    isApiProxyEnabled = addinConfig.getboolean('TRACING', 'api_proxy', fallback=False)
+    isApiTraceEnabled = addinConfig.getboolean('TRACING', 'api_trace', fallback=False)
+    isTelemetryEnabled = addinConfig.getboolean('TELEMETRY', 'enabled', fallback=False)
+    isShellCutoutEnabled = addinConfig.getboolean('GENERATION', 'shell_cutout', fallback=False)
+    isProfileCutoutEnabled = addinConfig.getboolean('GENERATION', 'profile_cutouts', fallback=False)
+    isSingleProfileBaseEnabled = addinConfig.getboolean('GENERATION', 'single_profile_base', fallback=False)
+    isSweepBaseProfileEnabled = addinConfig.getboolean('GENERATION', 'sweep_base_profile', fallback=False)
+    isTemplateCacheEnabled = addinConfig.getboolean('GENERATION', 'template_cache', fallback=False)
+    if isTemplateCacheEnabled:
+        templateCacheUtils.registerDocumentEvents()
+    profilingUtils.configure(CMD_NAME, addinConfig, CONFIG_FOLDER_PATH)
+    diagnosticsUtils.configure(CMD_NAME, addinConfig, CONFIG_FOLDER_PATH)
     initDefaultUiState()
 
 # Executed when add-in is stopped.
 def stop():
     futil.log(f'{CMD_NAME} Command Stop Event')
+    diagnosticsUtils.stopTracing()
+    templateCacheUtils.clear()
     # Get the various UI elements for this command
     workspace = ui.workspaces.itemById(WORKSPACE_ID)
     panel = workspace.toolbarPanels.itemById(PANEL_ID)
@@ -392,6 +436,9 @@ def render_compartments_table(inputs: adsk.core.CommandInputs):
     addButton.isVisible = initiallyVisible
     removeButton.isVisible = initiallyVisible
     populateUniform.isVisible = initiallyVisible
+    layoutInfo = compartmentsGroup.children.addTextBoxCommandInput(BIN_COMPARTMENTS_LAYOUT_INFO_ID, "Layout", "", 3, True)
+    layoutInfo.isVisible = initiallyVisible
+    commandUIState.registerCommandInput(layoutInfo)
 
     append_compartments_from_state()
 
@@ -475,16 +522,19 @@ def is_all_input_valid(inputs: adsk.core.CommandInputs):
             result = result and binTabPosition.value >= 0
             result = result and binTabAngle.value >= math.radians(30) and binTabAngle.value <= math.radians(65)
         if binCompartmentGridTypeDropdownInput.selectedItem.name == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM:
+            compartments: list[BinBodyCompartmentDefinition] = []
             for i in range(1, binCompartmentsTable.rowCount):
                 posX: adsk.core.IntegerSpinnerCommandInput = binCompartmentsTable.getInputAtPosition(i, 0)
                 posY: adsk.core.IntegerSpinnerCommandInput = binCompartmentsTable.getInputAtPosition(i, 1)
                 width: adsk.core.IntegerSpinnerCommandInput = binCompartmentsTable.getInputAtPosition(i, 2)
                 length: adsk.core.IntegerSpinnerCommandInput = binCompartmentsTable.getInputAtPosition(i, 3)
+                compartments.append(BinBodyCompartmentDefinition(posX.value, posY.value, width.value, length.value))
 
-                result = result and posX.value >= 0 and (posX.value + width.value) <= compartmentsX.value
-                result = result and posY.value >= 0 and (posY.value + length.value) <= compartmentsY.value
-                result = result and width.value > 0 and (posX.value + width.value) <= compartmentsX.value
-                result = result and length.value > 0 and (posY.value + length.value) <= compartmentsY.value
+            layoutIssues = compartmentLayoutUtils.validateCompartmentLayout(compartments, compartmentsX.value, compartmentsY.value)
+            result = result and compartmentLayoutUtils.isCompartmentLayoutValid(layoutIssues)
+            layoutInfo: adsk.core.TextBoxCommandInput = inputs.itemById(BIN_COMPARTMENTS_LAYOUT_INFO_ID)
+            if layoutInfo:
+                layoutInfo.formattedText = '<br>'.join(issue.message for issue in layoutIssues) if len(layoutIssues) > 0 else 'No layout issues'
 
     return result
 
@@ -493,6 +543,7 @@ def is_all_input_valid(inputs: adsk.core.CommandInputs):
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     # General logging for debug.
     futil.log(f'{CMD_NAME} Command Created Event')
+    diagnosticsUtils.commandStarted(CMD_NAME, getDiagnosticsCounters())
     global commandUIState
     global actualDimensionsTableUiState
 
@@ -673,11 +724,13 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
 
 # This event handler is called when the user clicks the OK button in the command dialog or 
 # is immediately called after the created event not command inputs were created for the dialog.
+@profilingUtils.profiled(CMD_NAME, 'execute')
 def command_execute(args: adsk.core.CommandEventArgs):
     futil.log(f'{CMD_NAME} Command Execute Event')
     generateBin(args)
 
 # This event handler is called when the command needs to compute a new preview in the graphics window.
+@profilingUtils.profiled(CMD_NAME, 'preview')
 def command_preview(args: adsk.core.CommandEventArgs):
     futil.log(f'{CMD_NAME} Command Preview Event')
     inputs = args.command.commandInputs
@@ -775,6 +828,15 @@ def command_destroy(args: adsk.core.CommandEventArgs):
     futil.log(f'{CMD_NAME} Command Destroy Event "{args.terminationReason}"')
     global local_handlers
     local_handlers = []
+    diagnosticsUtils.commandFinished(CMD_NAME, getDiagnosticsCounters())
+
+def getDiagnosticsCounters():
+    uiStates = [commandUIState, actualDimensionsTableUiState, actualCompartmentDimensionsUiState] + commandCompartmentsTableUIState
+    return {
+        'localHandlers': len(local_handlers),
+        'compartmentsTableStates': len(commandCompartmentsTableUIState),
+        'registeredCommandInputs': sum(len(state.commandInputs) for state in uiStates),
+    }
 
 def deleteTableRow(rowToDelete: int, tableInput: adsk.core.TableCommandInput, inputState: list[CommandUiState]):
     inputState.pop(rowToDelete - 1)
@@ -823,6 +885,7 @@ def onChangeValidate():
     
     compartmentsGridType: str = commandUIState.getState(BIN_COMPARTMENTS_GRID_TYPE_ID)
     commandUIState.getInput(BIN_COMPARTMENTS_TABLE_ID).isVisible = compartmentsGridType == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM
+    commandUIState.getInput(BIN_COMPARTMENTS_LAYOUT_INFO_ID).isVisible = compartmentsGridType == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM
 
     showPreview: bool = commandUIState.getInput(SHOW_PREVIEW_INPUT).value
     commandUIState.getInput(SHOW_PREVIEW_MANUAL_INPUT).isVisible = not showPreview
@@ -874,53 +937,46 @@ def generateBin(args: adsk.core.CommandEventArgs):
     isSolid = binTypeDropdownInput.selectedItem.name == BIN_TYPE_SOLID
     isShelled = binTypeDropdownInput.selectedItem.name == BIN_TYPE_SHELLED
 
+    if isTracingEnabled or isTelemetryEnabled:
+        traceUtils.startTrace(CMD_NAME, isTracingEnabled and isHelperTracingEnabled)
+    if isApiProxyEnabled or isApiTraceEnabled:
+        apiProxyUtils.startSession(CMD_NAME, isApiTraceEnabled)
+
+    telemetrySpec = {
+        'width': bin_width.value,
+        'length': bin_length.value,
+        'height': bin_height.value,
+        'baseWidth': base_width_unit.value,
+        'baseLength': base_length_unit.value,
+        'type': binTypeDropdownInput.selectedItem.name,
+        'generateBase': bin_generate_base.value,
+        'generateBody': bin_generate_body.value,
+        'lip': with_lip.value,
+        'lipNotches': with_lip_notches.value,
+        'scoop': has_scoop.value,
+        'tab': hasTabInput.value,
+        'screwHoles': bin_screw_holes.value,
+        'magnetCutouts': bin_magnet_cutouts.value,
+        'compartmentsType': binCompartmentGridTypeDropdownInput.selectedItem.name,
+        'compartmentsX': compartmentsX.value,
+        'compartmentsY': compartmentsY.value,
+        'compartmentsCount': binCompartmentsTable.rowCount - 1,
+    }
+    succeeded = False
+    errorMessage = None
+    newCmpOcc = None
+
     try:
         des = adsk.fusion.Design.cast(app.activeProduct)
         if des.designType == 0:
             raise UnsupportedDesignTypeException('Timeline must be enabled for the generator to work, projects with disabled design history currently are not supported')
+        if isTemplateCacheEnabled:
+            templateCacheUtils.startSession(des)
         root = adsk.fusion.Component.cast(des.rootComponent)
         xyClearance = xy_clearance.value
         binName = 'Gridfinity bin {}x{}x{}'.format(int(bin_length.value), int(bin_width.value), int(bin_height.value))
 
-        # create new component
-        newCmpOcc = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(adsk.core.Matrix3D.create())
-        newCmpOcc.component.name = binName
-        newCmpOcc.activate()
-        gridfinityBinComponent: adsk.fusion.Component = newCmpOcc.component
-        features: adsk.fusion.Features = gridfinityBinComponent.features
-
-        # create base interface
-        baseGeneratorInput = BaseGeneratorInput()
-        baseGeneratorInput.originPoint = gridfinityBinComponent.originConstructionPoint.geometry
-        baseGeneratorInput.baseWidth = base_width_unit.value
-        baseGeneratorInput.baseLength = base_length_unit.value
-        baseGeneratorInput.xyClearance = xyClearance
-        baseGeneratorInput.hasScrewHoles = bin_screw_holes.value and not isShelled
-        baseGeneratorInput.hasMagnetCutouts = bin_magnet_cutouts.value and not isShelled
-        baseGeneratorInput.screwHolesDiameter = bin_screw_hole_diameter.value
-        baseGeneratorInput.magnetCutoutsDiameter = bin_magnet_cutout_diameter.value
-        baseGeneratorInput.magnetCutoutsDepth = bin_magnet_cutout_depth.value
-
-        baseBody: adsk.fusion.BRepBody
-        
-        if bin_generate_base.value:
-            baseBody = createGridfinityBase(baseGeneratorInput, gridfinityBinComponent)
-            # replicate base in rectangular pattern
-            rectangularPatternFeatures: adsk.fusion.RectangularPatternFeatures = features.rectangularPatternFeatures
-            patternInputBodies = adsk.core.ObjectCollection.create()
-            patternInputBodies.add(baseBody)
-            patternInput = rectangularPatternFeatures.createInput(patternInputBodies,
-                gridfinityBinComponent.xConstructionAxis,
-                adsk.core.ValueInput.createByReal(bin_width.value),
-                adsk.core.ValueInput.createByReal(base_width_unit.value),
-                adsk.fusion.PatternDistanceType.SpacingPatternDistanceType)
-            patternInput.directionTwoEntity = gridfinityBinComponent.yConstructionAxis
-            patternInput.quantityTwo = adsk.core.ValueInput.createByReal(bin_length.value)
-            patternInput.distanceTwo = adsk.core.ValueInput.createByReal(base_length_unit.value)
-            rectangularPattern = rectangularPatternFeatures.add(patternInput)
-
-
-        # create bin body
+        # bin body input
         binBodyInput = BinBodyGeneratorInput()
         binBodyInput.hasLip = with_lip.value
         binBodyInput.hasLipNotches = with_lip_notches.value
@@ -942,6 +998,8 @@ def generateBin(args: adsk.core.CommandEventArgs):
         binBodyInput.tabOverhangAngle = binTabAngle.value
         binBodyInput.compartmentsByX = compartmentsX.value
         binBodyInput.compartmentsByY = compartmentsY.value
+        binBodyInput.isProfileCutout = isProfileCutoutEnabled
+        binBodyInput.isSweepBaseProfile = isSweepBaseProfileEnabled
 
         if binCompartmentGridTypeDropdownInput.selectedItem.name == BIN_COMPARTMENTS_GRID_TYPE_UNIFORM:
             binBodyInput.compartments = uniformCompartments(binBodyInput.compartmentsByX, binBodyInput.compartmentsByY)
@@ -955,86 +1013,163 @@ def generateBin(args: adsk.core.CommandEventArgs):
                 depth: adsk.core.ValueCommandInput = binCompartmentsTable.getInputAtPosition(i, 4)
                 binBodyInput.compartments.append(BinBodyCompartmentDefinition(positionX.value, positionY.value, width.value, length.value, depth.value))
 
+        # base interface input
+        baseGeneratorInput = BaseGeneratorInput()
+        baseGeneratorInput.baseWidth = base_width_unit.value
+        baseGeneratorInput.baseLength = base_length_unit.value
+        baseGeneratorInput.xyClearance = xyClearance
+        baseGeneratorInput.hasScrewHoles = bin_screw_holes.value and not isShelled
+        baseGeneratorInput.hasMagnetCutouts = bin_magnet_cutouts.value and not isShelled
+        baseGeneratorInput.screwHolesDiameter = bin_screw_hole_diameter.value
+        baseGeneratorInput.magnetCutoutsDiameter = bin_magnet_cutout_diameter.value
+        baseGeneratorInput.magnetCutoutsDepth = bin_magnet_cutout_depth.value
+        baseGeneratorInput.isSweepProfile = isSweepBaseProfileEnabled
+
+        # predict fillets and tabs that can not fit before any feature is created
+        feasibilityIssues: list[feasibilityUtils.FeasibilityIssue] = []
+        if bin_generate_base.value:
+            feasibilityIssues = feasibilityIssues + feasibilityUtils.checkBaseFeasibility(baseGeneratorInput)
+        if bin_generate_body.value:
+            feasibilityIssues = feasibilityIssues + feasibilityUtils.checkBinBodyFeasibility(binBodyInput)
+        for issue in feasibilityIssues:
+            futil.log(f'{CMD_NAME} Input {issue.kind}: {issue.message}')
+        if not feasibilityUtils.isFeasible(feasibilityIssues):
+            raise InfeasibleInputException(feasibilityUtils.formatIssues([issue for issue in feasibilityIssues if issue.isError]))
+
+        # create new component
+        newCmpOcc = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(adsk.core.Matrix3D.create())
+        newCmpOcc.component.name = binName
+        newCmpOcc.activate()
+        gridfinityBinComponent: adsk.fusion.Component = apiProxyUtils.wrap(newCmpOcc.component)
+        features: adsk.fusion.Features = gridfinityBinComponent.features
+
+        # create base interface
+        baseGeneratorInput.originPoint = gridfinityBinComponent.originConstructionPoint.geometry
+
+        baseBody: adsk.fusion.BRepBody
+        
+        if bin_generate_base.value and not isSingleProfileBaseEnabled:
+            with traceUtils.span('base'):
+                baseBody = createGridfinityBase(baseGeneratorInput, gridfinityBinComponent)
+            # replicate base in rectangular pattern
+            with traceUtils.span('base pattern', width=bin_width.value, length=bin_length.value):
+                rectangularPatternFeatures: adsk.fusion.RectangularPatternFeatures = features.rectangularPatternFeatures
+                patternInputBodies = adsk.core.ObjectCollection.create()
+                patternInputBodies.add(baseBody)
+                patternInput = rectangularPatternFeatures.createInput(patternInputBodies,
+                    gridfinityBinComponent.xConstructionAxis,
+                    adsk.core.ValueInput.createByReal(bin_width.value),
+                    adsk.core.ValueInput.createByReal(base_width_unit.value),
+                    adsk.fusion.PatternDistanceType.SpacingPatternDistanceType)
+                patternInput.directionTwoEntity = gridfinityBinComponent.yConstructionAxis
+                patternInput.quantityTwo = adsk.core.ValueInput.createByReal(bin_length.value)
+                patternInput.distanceTwo = adsk.core.ValueInput.createByReal(base_length_unit.value)
+                rectangularPattern = rectangularPatternFeatures.add(patternInput)
+
+
         binBody: adsk.fusion.BRepBody
 
         if bin_generate_body.value:
-            binBody = createGridfinityBinBody(
-                binBodyInput,
-                gridfinityBinComponent,
+            with traceUtils.span('bin body', compartments=len(binBodyInput.compartments)):
+                binBody = createGridfinityBinBody(
+                    binBodyInput,
+                    gridfinityBinComponent,
+                    )
+
+        # all base cells from one sketch, joined straight into the bin body
+        if bin_generate_base.value and isSingleProfileBaseEnabled:
+            with traceUtils.span('base grid', width=bin_width.value, length=bin_length.value):
+                baseBody = createGridfinityBaseGrid(
+                    baseGeneratorInput,
+                    int(bin_width.value),
+                    int(bin_length.value),
+                    gridfinityBinComponent,
+                    binBody if bin_generate_body.value else None,
                 )
+                if bin_generate_body.value:
+                    binBody.name = binName
 
         # merge everything
-        if bin_generate_body.value and bin_generate_base.value:
-            toolBodies = adsk.core.ObjectCollection.create()
-            toolBodies.add(baseBody)
-            for body in rectangularPattern.bodies:
-                toolBodies.add(body)
-            combineFeatures = gridfinityBinComponent.features.combineFeatures
-            combineFeatureInput = combineFeatures.createInput(binBody, toolBodies)
-            combineFeatures.add(combineFeatureInput)
-            gridfinityBinComponent.bRepBodies.item(0).name = binName
+        if bin_generate_body.value and bin_generate_base.value and not isSingleProfileBaseEnabled:
+            with traceUtils.span('merge'):
+                toolBodies = adsk.core.ObjectCollection.create()
+                toolBodies.add(baseBody)
+                for body in rectangularPattern.bodies:
+                    toolBodies.add(body)
+                combineFeatures = gridfinityBinComponent.features.combineFeatures
+                combineFeatureInput = combineFeatures.createInput(binBody, toolBodies)
+                combineFeatures.add(combineFeatureInput)
+                gridfinityBinComponent.bRepBodies.item(0).name = binName
 
         if isShelled and bin_generate_body.value:
-            # face.boundingBox.maxPoint.z ~ face.boundingBox.minPoint.z => face horizontal
-            # largest horizontal face
-            horizontalFaces = [face for face in binBody.faces if geometryUtils.isHorizontal(face)]
-            topFace = faceUtils.maxByArea(horizontalFaces)
-            topFaceMinPoint = topFace.boundingBox.minPoint
-            if binBodyInput.hasLip:
-                splitBodyFeatures = features.splitBodyFeatures
-                splitBodyInput = splitBodyFeatures.createInput(
+            with traceUtils.span('shell', hasLip=binBodyInput.hasLip, hasTab=hasTabInput.value, isShellCutout=isShellCutoutEnabled):
+                binBody = shellGridfinityBin(
                     binBody,
-                    topFace,
-                    True
+                    binBodyInput,
+                    bin_generate_base.value,
+                    isShellCutoutEnabled,
+                    gridfinityBinComponent,
                 )
-                splitBodies = splitBodyFeatures.add(splitBodyInput)
-                bottomBody = min(splitBodies.bodies, key=lambda x: x.boundingBox.minPoint.z)
-                topBody = max(splitBodies.bodies, key=lambda x: x.boundingBox.minPoint.z)
-                horizontalFaces = [face for face in bottomBody.faces if geometryUtils.isHorizontal(face)]
-                topFace = faceUtils.maxByArea(horizontalFaces)
-                shellUtils.simpleShell([topFace], binBodyInput.wallThickness, gridfinityBinComponent)
-                toolBodies = adsk.core.ObjectCollection.create()
-                toolBodies.add(topBody)
-                combineAfterShellFeatureInput = combineFeatures.createInput(bottomBody, toolBodies)
-                combineFeatures.add(combineAfterShellFeatureInput)
-                binBody = gridfinityBinComponent.bRepBodies.item(0)
-            else:
-                shellUtils.simpleShell([topFace], binBodyInput.wallThickness, gridfinityBinComponent)
-            
-            if hasTabInput.value:
-                compartmentTabInput = BinBodyTabGeneratorInput()
-                tabOriginPoint = adsk.core.Point3D.create(
-                    binBodyInput.wallThickness + max(0, min(binBodyInput.tabPosition, binBodyInput.binWidth - binBodyInput.tabLength)) * binBodyInput.baseWidth,
-                    const.BIN_LIP_WALL_THICKNESS if binBodyInput.hasLip and binBodyInput.hasScoop else binBodyInput.wallThickness + binBodyInput.binLength * binBodyInput.baseLength - binBodyInput.wallThickness - binBodyInput.xyTolerance * 2,
-                    (binBodyInput.binHeight - 1) * binBodyInput.heightUnit + max(0, binBodyInput.heightUnit - const.BIN_BASE_HEIGHT),
-                )
-                compartmentTabInput.origin = tabOriginPoint
-                compartmentTabInput.length = max(0, min(binBodyInput.tabLength, binBodyInput.binWidth)) * binBodyInput.baseWidth - binBodyInput.wallThickness * 2 - binBodyInput.xyTolerance * 2
-                compartmentTabInput.width = binBodyInput.tabWidth
-                compartmentTabInput.overhangAngle = binBodyInput.tabOverhangAngle
-                compartmentTabInput.topClearance = const.BIN_TAB_TOP_CLEARANCE
-                tabBody = createGridfinityBinBodyTab(compartmentTabInput, gridfinityBinComponent)
-                combineInput = combineFeatures.createInput(tabBody, commonUtils.objectCollectionFromList([binBody]))
-                combineInput.operation = adsk.fusion.FeatureOperations.CutFeatureOperation
-                combineInput.isKeepToolBodies = True
-                combineFeature = combineFeatures.add(combineInput)
-                tabBodies = [body for body in combineFeature.bodies if body.faces != binBody.faces]
-                tabMainBody = max([body for body in tabBodies], key=lambda x: x.edges.count)
-                bodiesToRemove = [body for body in tabBodies if body is not tabMainBody]
-                for body in bodiesToRemove:
-                    gridfinityBinComponent.features.removeFeatures.add(body)
-                combineUtils.joinBodies(binBody, commonUtils.objectCollectionFromList([tabMainBody]), gridfinityBinComponent)
+                combineFeatures = gridfinityBinComponent.features.combineFeatures
+
+                if hasTabInput.value:
+                    compartmentTabInput = BinBodyTabGeneratorInput()
+                    tabOriginPoint = adsk.core.Point3D.create(
+                        binBodyInput.wallThickness + max(0, min(binBodyInput.tabPosition, binBodyInput.binWidth - binBodyInput.tabLength)) * binBodyInput.baseWidth,
+                        const.BIN_LIP_WALL_THICKNESS if binBodyInput.hasLip and binBodyInput.hasScoop else binBodyInput.wallThickness + binBodyInput.binLength * binBodyInput.baseLength - binBodyInput.wallThickness - binBodyInput.xyTolerance * 2,
+                        (binBodyInput.binHeight - 1) * binBodyInput.heightUnit + max(0, binBodyInput.heightUnit - const.BIN_BASE_HEIGHT),
+                    )
+                    compartmentTabInput.origin = tabOriginPoint
+                    compartmentTabInput.length = max(0, min(binBodyInput.tabLength, binBodyInput.binWidth)) * binBodyInput.baseWidth - binBodyInput.wallThickness * 2 - binBodyInput.xyTolerance * 2
+                    compartmentTabInput.width = binBodyInput.tabWidth
+                    compartmentTabInput.overhangAngle = binBodyInput.tabOverhangAngle
+                    compartmentTabInput.topClearance = const.BIN_TAB_TOP_CLEARANCE
+                    tabBody = createGridfinityBinBodyTab(compartmentTabInput, gridfinityBinComponent)
+                    combineInput = combineFeatures.createInput(tabBody, commonUtils.objectCollectionFromList([binBody]))
+                    combineInput.operation = adsk.fusion.FeatureOperations.CutFeatureOperation
+                    combineInput.isKeepToolBodies = True
+                    combineFeature = combineFeatures.add(combineInput)
+                    tabBodies = [body for body in combineFeature.bodies if body.faces != binBody.faces]
+                    tabMainBody = max([body for body in tabBodies], key=lambda x: x.edges.count)
+                    bodiesToRemove = [body for body in tabBodies if body is not tabMainBody]
+                    for body in bodiesToRemove:
+                        gridfinityBinComponent.features.removeFeatures.add(body)
+                    combineUtils.joinBodies(binBody, commonUtils.objectCollectionFromList([tabMainBody]), gridfinityBinComponent)
 
         # group features in timeline
-        binGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + gridfinityBinComponent.features.count + gridfinityBinComponent.constructionPlanes.count + gridfinityBinComponent.sketches.count)
-        binGroup.name = binName
+        with traceUtils.span('timeline group'):
+            binGroup = des.timeline.timelineGroups.add(newCmpOcc.timelineObject.index, newCmpOcc.timelineObject.index + gridfinityBinComponent.features.count + gridfinityBinComponent.constructionPlanes.count + gridfinityBinComponent.sketches.count)
+            binGroup.name = binName
+        succeeded = True
     except UnsupportedDesignTypeException as err:
         args.executeFailed = True
         args.executeFailedMessage = 'Design type is unsupported. Projects with disabled design history are unsupported, please enable timeline feature to proceed.'
+        errorMessage = str(err)
+        return False
+    except InfeasibleInputException as err:
+        args.executeFailed = True
+        args.executeFailedMessage = f'Bin can not be generated with the current inputs:\n{err}'
+        errorMessage = str(err)
         return False
     except Exception as err:
         args.executeFailed = True
         args.executeFailedMessage = getErrorMessage()
+        errorMessage = str(err)
         futil.log(f'{CMD_NAME} Error occurred, {err}, {getErrorMessage()}')
         return False
+    finally:
+        tracer = traceUtils.stopTrace(TRACES_FOLDER_PATH if isTracingEnabled else None)
+        apiProxyUtils.stopSession(TRACES_FOLDER_PATH)
+        templateCacheUtils.stopSession()
+        if isTelemetryEnabled:
+            telemetryUtils.appendRecord(CONFIG_FOLDER_PATH, telemetryUtils.createRecord(
+                CMD_NAME,
+                telemetryUtils.getEventName(args),
+                telemetryUtils.getFamily(telemetrySpec, TELEMETRY_FAMILY_KEYS),
+                telemetrySpec,
+                tracer,
+                newCmpOcc.component if newCmpOcc is not None else None,
+                succeeded,
+                errorMessage,
+            ))
     return True
\ No newline at end of file
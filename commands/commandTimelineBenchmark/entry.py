@@ -0,0 +1,126 @@
+import adsk.core, adsk.fusion, traceback
+import os
+
+
+from ...lib import configUtils
+from ...lib import timelineBenchmarkUtils
+from ...lib import traceUtils
+from ...lib import fusion360utils as futil
+from ... import config
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+
+# The command identity information. ***
+CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdTimelineBenchmark'
+CMD_NAME = 'Gridfinity timeline benchmark'
+CMD_Description = 'Measure timeline recompute time of generated gridfinity components'
+
+# Development tool, the button is only added when enabled in config.ini
+IS_ENABLED = False
+
+WORKSPACE_ID = 'FusionSolidEnvironment'
+PANEL_ID = 'SolidScriptsAddinsPanel'
+COMMAND_BESIDE_ID = 'ScriptsManagerCommand'
+
+CONFIG_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'commandConfig')
+TRACES_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), traceUtils.TRACES_FOLDER_NAME)
+
+# Local list of event handlers used to maintain a reference so
+# they are not released and garbage collected.
+local_handlers = []
+
+# Input ids
+TIMELINE_GROUP_DROPDOWN = 'timeline_group'
+REPEATS_INPUT = 'repeats'
+NO_GROUPS_INFO = 'no_groups_info'
+
+generatedGroups: list[adsk.fusion.TimelineGroup] = []
+
+def getErrorMessage():
+    stackTrace = traceback.format_exc()
+    return f"An unknonwn error occurred:\n{stackTrace}"
+
+# Executed when add-in is run.
+def start():
+    futil.log(f'{CMD_NAME} Command Start Event')
+    addinConfig = configUtils.readConfig(CONFIG_FOLDER_PATH)
+    global IS_ENABLED
+    # a missing section or config file means disabled, the file is never written by the add-in
+    IS_ENABLED = addinConfig.getboolean('BENCHMARK', 'enabled', fallback=False)
+    if not IS_ENABLED:
+        return
+
+    cmd_def = ui.commandDefinitions.addButtonDefinition(CMD_ID, CMD_NAME, CMD_Description)
+    futil.add_handler(cmd_def.commandCreated, command_created)
+
+    workspace = ui.workspaces.itemById(WORKSPACE_ID)
+    panel = workspace.toolbarPanels.itemById(PANEL_ID)
+    panel.controls.addCommand(cmd_def, COMMAND_BESIDE_ID, False)
+
+# Executed when add-in is stopped.
+def stop():
+    futil.log(f'{CMD_NAME} Command Stop Event')
+    if not IS_ENABLED:
+        return
+
+    workspace = ui.workspaces.itemById(WORKSPACE_ID)
+    panel = workspace.toolbarPanels.itemById(PANEL_ID)
+    command_control = panel.controls.itemById(CMD_ID)
+    command_definition = ui.commandDefinitions.itemById(CMD_ID)
+
+    if command_control:
+        command_control.deleteMe()
+
+    if command_definition:
+        command_definition.deleteMe()
+
+
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    futil.log(f'{CMD_NAME} Command Created Event')
+    global generatedGroups
+
+    inputs = args.command.commandInputs
+    des = adsk.fusion.Design.cast(app.activeProduct)
+    generatedGroups = timelineBenchmarkUtils.findGeneratedGroups(des.timeline) if des and des.designType == 1 else []
+
+    if len(generatedGroups) == 0:
+        inputs.addTextBoxCommandInput(NO_GROUPS_INFO, 'Info', 'No generated gridfinity timeline groups found in the active design', 2, True)
+    else:
+        groupDropdown = inputs.addDropDownCommandInput(TIMELINE_GROUP_DROPDOWN, 'Timeline group', adsk.core.DropDownStyles.TextListDropDownStyle)
+        for i, group in enumerate(generatedGroups):
+            groupDropdown.listItems.add(f'{group.name} ({group.count} objects)', i == len(generatedGroups) - 1)
+        inputs.addIntegerSpinnerCommandInput(REPEATS_INPUT, 'Repeats', 1, 20, 1, 1)
+
+    futil.add_handler(args.command.execute, command_execute, local_handlers=local_handlers)
+    futil.add_handler(args.command.destroy, command_destroy, local_handlers=local_handlers)
+
+
+def command_execute(args: adsk.core.CommandEventArgs):
+    futil.log(f'{CMD_NAME} Command Execute Event')
+    inputs = args.command.commandInputs
+    groupDropdown: adsk.core.DropDownCommandInput = inputs.itemById(TIMELINE_GROUP_DROPDOWN)
+    repeatsInput: adsk.core.IntegerSpinnerCommandInput = inputs.itemById(REPEATS_INPUT)
+    if groupDropdown is None or groupDropdown.selectedItem is None:
+        return
+
+    try:
+        des = adsk.fusion.Design.cast(app.activeProduct)
+        group = generatedGroups[groupDropdown.selectedItem.index]
+        result = timelineBenchmarkUtils.benchmarkTimelineGroup(des.timeline, group, repeatsInput.value)
+        reportPath = timelineBenchmarkUtils.writeReport(result, TRACES_FOLDER_PATH)
+        summary = timelineBenchmarkUtils.formatSummary(result)
+        futil.log(summary)
+        ui.messageBox(f'{summary}\n\nReport: {reportPath}', CMD_NAME)
+    except Exception as err:
+        args.executeFailed = True
+        args.executeFailedMessage = getErrorMessage()
+        futil.log(f'{CMD_NAME} Error occurred, {err}, {getErrorMessage()}')
+
+
+def command_destroy(args: adsk.core.CommandEventArgs):
+    futil.log(f'{CMD_NAME} Command Destroy Event')
+    global local_handlers, generatedGroups
+    local_handlers = []
+    generatedGroups = []
@@ -0,0 +1,283 @@
+import adsk.core, adsk.fusion, traceback
+from . import fusion360utils as futil
+import functools
+import json
+import os
+import sys
+import time
+
+API_MODULES = [adsk.core, adsk.fusion]
+API_TRACE_FORMAT = 'gridfinity-api-trace'
+API_TRACE_FORMAT_VERSION = 1
+MAX_DESCRIBED_ITEMS = 16
+
+def isApiObject(value):
+    return type(value).__module__.startswith('adsk.') and not isinstance(value, type)
+
+def describeValue(value):
+    # portable description of an api argument, api objects are reduced to their type
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, ApiProxy):
+        value = object.__getattribute__(value, '_target')
+    if type(value) in (tuple, list):
+        return [describeValue(item) for item in value[:MAX_DESCRIBED_ITEMS]]
+    return f'<{type(value).__name__}>'
+
+def callerName(depth: int):
+    frame = sys._getframe(depth + 1)
+    code = frame.f_code
+    moduleName = frame.f_globals.get('__name__', '').rsplit('.', 1)[-1]
+    return f'{moduleName}.{getattr(code, "co_qualname", code.co_name)}'
+
+class ApiProxySession:
+    def __init__(self, name: str, recordSequence: bool = False):
+        self.name = name
+        self.recordSequence = recordSequence
+        self.calls: dict[tuple[str, str, str], list] = {}
+        self.sequence: list[dict] = []
+        self.apiTime = 0
+        self.elapsedTime = 0
+        self._startTime = None
+        self._patchedAttributes: list[tuple] = []
+
+    def record(self, caller: str, kind: str, apiName: str, elapsed: float, args: list = None):
+        self.apiTime += elapsed
+        entry = self.calls.setdefault((caller, kind, apiName), [0, 0])
+        entry[0] += 1
+        entry[1] += elapsed
+        if self.recordSequence:
+            self.sequence.append({
+                'caller': caller,
+                'kind': kind,
+                'api': apiName,
+                'time': elapsed * 1000,
+                'args': [] if args is None else args,
+            })
+
+    def wrap(self, value):
+        if isinstance(value, (ApiProxy, ApiMethodProxy)):
+            return value
+        if isApiObject(value):
+            return ApiProxy(value, self)
+        if type(value) is tuple:
+            return tuple(self.wrap(item) for item in value)
+        if type(value) is list:
+            return [self.wrap(item) for item in value]
+        return value
+
+    def unwrap(self, value):
+        if isinstance(value, ApiProxy):
+            return object.__getattribute__(value, '_target')
+        if type(value) is tuple:
+            return tuple(self.unwrap(item) for item in value)
+        if type(value) is list:
+            return [self.unwrap(item) for item in value]
+        return value
+
+    def invoke(self, caller: str, apiName: str, function, args: tuple, kwargs: dict):
+        args = self.unwrap(args)
+        kwargs = {key: self.unwrap(value) for key, value in kwargs.items()}
+        startTime = time.perf_counter()
+        result = function(*args, **kwargs)
+        elapsed = time.perf_counter() - startTime
+        description = [describeValue(arg) for arg in args] + [{key: describeValue(value)} for key, value in kwargs.items()] if self.recordSequence else None
+        self.record(caller, 'call', apiName, elapsed, description)
+        return self.wrap(result)
+
+    def _patchStaticMethods(self):
+        # objects created by static constructors like ObjectCollection.create() are passed back into the api,
+        # so they have to be proxies as well and proxies passed into them have to be unwrapped
+        session = self
+        for module in API_MODULES:
+            for cls in list(vars(module).values()):
+                if not isinstance(cls, type) or cls.__name__.startswith('_'):
+                    continue
+                for name, attribute in list(vars(cls).items()):
+                    if not isinstance(attribute, (staticmethod, classmethod)):
+                        continue
+                    function = attribute.__func__
+                    apiName = f'{cls.__name__}.{name}'
+                    def patched(*args, function=function, apiName=apiName, **kwargs):
+                        return session.invoke(callerName(1), apiName, function, args, kwargs)
+                    functools.update_wrapper(patched, function)
+                    self._patchedAttributes.append((cls, name, attribute))
+                    setattr(cls, name, type(attribute)(patched))
+
+    def _restoreStaticMethods(self):
+        for cls, name, attribute in reversed(self._patchedAttributes):
+            setattr(cls, name, attribute)
+        self._patchedAttributes = []
+
+    def start(self):
+        self._patchStaticMethods()
+        self._startTime = time.perf_counter()
+
+    def stop(self):
+        self.elapsedTime = time.perf_counter() - self._startTime
+        self._restoreStaticMethods()
+
+    def summary(self, top: int = 50):
+        byCaller: dict[str, dict] = {}
+        byApi: dict[str, dict] = {}
+        for (caller, kind, apiName), [count, elapsed] in self.calls.items():
+            callerEntry = byCaller.setdefault(caller, {'caller': caller, 'gets': 0, 'sets': 0, 'calls': 0, 'apiTime': 0})
+            callerEntry[kind + 's'] += count
+            callerEntry['apiTime'] += elapsed
+            apiEntry = byApi.setdefault(apiName, {'api': apiName, 'kind': kind, 'count': 0, 'apiTime': 0})
+            apiEntry['count'] += count
+            apiEntry['apiTime'] += elapsed
+        return {
+            'name': self.name,
+            'totalTime': self.elapsedTime,
+            'apiTime': self.apiTime,
+            'pythonTime': self.elapsedTime - self.apiTime,
+            'roundTrips': sum(count for [count, _] in self.calls.values()),
+            'byCaller': sorted(byCaller.values(), key=lambda x: x['gets'] + x['sets'] + x['calls'], reverse=True)[:top],
+            'byApi': sorted(byApi.values(), key=lambda x: x['count'], reverse=True)[:top],
+        }
+
+    def write(self, folderPath: str):
+        if not os.path.exists(folderPath):
+            os.makedirs(folderPath)
+        fileName = '{}_api_{}.json'.format(''.join(c if c.isalnum() else '_' for c in self.name), time.strftime('%Y%m%d-%H%M%S'))
+        reportPath = os.path.join(folderPath, fileName)
+        with open(reportPath, 'w') as reportFile:
+            json.dump(self.summary(), reportFile, indent=True)
+        return reportPath
+
+    def toApiTrace(self):
+        return {
+            'format': API_TRACE_FORMAT,
+            'formatVersion': API_TRACE_FORMAT_VERSION,
+            'name': self.name,
+            'recordedAt': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'totalTime': self.elapsedTime * 1000,
+            'apiTime': self.apiTime * 1000,
+            'events': self.sequence,
+        }
+
+    def writeApiTrace(self, folderPath: str):
+        if not os.path.exists(folderPath):
+            os.makedirs(folderPath)
+        fileName = '{}_apitrace_{}.json'.format(''.join(c if c.isalnum() else '_' for c in self.name), time.strftime('%Y%m%d-%H%M%S'))
+        tracePath = os.path.join(folderPath, fileName)
+        with open(tracePath, 'w') as traceFile:
+            json.dump(self.toApiTrace(), traceFile)
+        return tracePath
+
+class ApiMethodProxy:
+    __slots__ = ('_method', '_apiName', '_session')
+
+    def __init__(self, method, apiName: str, session: ApiProxySession):
+        self._method = method
+        self._apiName = apiName
+        self._session = session
+
+    def __call__(self, *args, **kwargs):
+        return self._session.invoke(callerName(1), self._apiName, self._method, args, kwargs)
+
+class ApiProxy:
+    __slots__ = ('_target', '_session')
+
+    def __init__(self, target, session: ApiProxySession):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_session', session)
+
+    def __getattr__(self, name: str):
+        target = object.__getattribute__(self, '_target')
+        session: ApiProxySession = object.__getattribute__(self, '_session')
+        apiName = f'{type(target).__name__}.{name}'
+        startTime = time.perf_counter()
+        value = getattr(target, name)
+        elapsed = time.perf_counter() - startTime
+        if callable(value) and not isApiObject(value):
+            return ApiMethodProxy(value, apiName, session)
+        session.record(callerName(1), 'get', apiName, elapsed)
+        return session.wrap(value)
+
+    def __setattr__(self, name: str, value):
+        target = object.__getattribute__(self, '_target')
+        session: ApiProxySession = object.__getattribute__(self, '_session')
+        startTime = time.perf_counter()
+        setattr(target, name, session.unwrap(value))
+        elapsed = time.perf_counter() - startTime
+        session.record(callerName(1), 'set', f'{type(target).__name__}.{name}', elapsed, [describeValue(value)] if session.recordSequence else None)
+
+    def __iter__(self):
+        return self._iterate(callerName(1))
+
+    def _iterate(self, caller: str):
+        target = object.__getattribute__(self, '_target')
+        session: ApiProxySession = object.__getattribute__(self, '_session')
+        apiName = f'{type(target).__name__}.item'
+        iterator = iter(target)
+        while True:
+            startTime = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                session.record(caller, 'call', apiName, time.perf_counter() - startTime)
+            yield session.wrap(item)
+
+    def __len__(self):
+        target = object.__getattribute__(self, '_target')
+        session: ApiProxySession = object.__getattribute__(self, '_session')
+        return session.invoke(callerName(1), f'{type(target).__name__}.count', len, (target,), {})
+
+    def __getitem__(self, index):
+        target = object.__getattribute__(self, '_target')
+        session: ApiProxySession = object.__getattribute__(self, '_session')
+        return session.invoke(callerName(1), f'{type(target).__name__}.item', type(target).__getitem__, (target, index), {})
+
+    def __bool__(self):
+        return bool(object.__getattribute__(self, '_target'))
+
+    def __eq__(self, other):
+        session: ApiProxySession = object.__getattribute__(self, '_session')
+        return object.__getattribute__(self, '_target') == session.unwrap(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(object.__getattribute__(self, '_target'))
+
+    def __repr__(self):
+        return f'ApiProxy({object.__getattribute__(self, "_target")!r})'
+
+activeSession: ApiProxySession = None
+
+def startSession(name: str, recordSequence: bool = False):
+    global activeSession
+    activeSession = ApiProxySession(name, recordSequence)
+    activeSession.start()
+    return activeSession
+
+def stopSession(folderPath: str):
+    global activeSession
+    if activeSession is None:
+        return None
+    session = activeSession
+    activeSession = None
+    session.stop()
+    summary = session.summary(10)
+    futil.log(f'{session.name}: {summary["roundTrips"]} api round trips, api time {summary["apiTime"]:.3f}s, python time {summary["pythonTime"]:.3f}s')
+    for entry in summary['byCaller']:
+        futil.log(f'    {entry["caller"]}: {entry["gets"]} gets, {entry["calls"]} calls, {entry["sets"]} sets, {entry["apiTime"]:.3f}s')
+    try:
+        if session.recordSequence:
+            futil.log(f'{session.name}: api trace written to {session.writeApiTrace(folderPath)}')
+        return session.write(folderPath)
+    except Exception as err:
+        futil.log(f'Couldn\'t write api report to {folderPath}, error: {err}')
+        return None
+
+def wrap(value):
+    if activeSession is None:
+        return value
+    return activeSession.wrap(value)
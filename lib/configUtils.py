@@ -9,6 +9,11 @@ CONFIG_FILE_NAME = 'config.ini'
 def getDefaultConfig():
     config = configparser.ConfigParser()
     config['UI'] = {'IS_PROMOTED': 'yes'}
+    config['TRACING'] = {'ENABLED': 'no', 'TRACE_HELPERS': 'yes', 'API_PROXY': 'no', 'API_TRACE': 'no'}
+    config['PROFILING'] = {'ENABLED': 'no', 'PROFILE_PREVIEW': 'yes', 'TOP': '40', 'SORT_BY': 'cumulative'}
+    config['TELEMETRY'] = {'ENABLED': 'no'}
+    config['DIAGNOSTICS'] = {'ENABLED': 'no', 'TRACE_MEMORY': 'yes', 'FRAMES': '1', 'TOP': '10'}
+    config['GENERATION'] = {'SHELL_CUTOUT': 'no', 'PROFILE_CUTOUTS': 'no', 'SINGLE_PROFILE_BASE': 'no', 'SWEEP_BASE_PROFILE': 'no', 'TEMPLATE_CACHE': 'no'}
     return config
 
 def readConfig(path: str):
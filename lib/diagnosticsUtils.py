@@ -0,0 +1,117 @@
+import adsk.core, adsk.fusion, traceback
+from . import fusion360utils as futil
+from .fusion360utils import event_utils
+import configparser
+import datetime
+import gc
+import json
+import os
+import tracemalloc
+
+DIAGNOSTICS_FILE_NAME = 'diagnostics.jsonl'
+ADDIN_ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# diagnostics settings and session state per command name, filled from config.ini on command start
+settings: dict[str, dict] = {}
+sessions: dict[str, dict] = {}
+
+def configure(commandName: str, addinConfig: configparser.ConfigParser, configFolderPath: str):
+    settings[commandName] = {
+        'enabled': addinConfig.getboolean('DIAGNOSTICS', 'enabled', fallback=False),
+        'traceMemory': addinConfig.getboolean('DIAGNOSTICS', 'trace_memory', fallback=True),
+        'frames': addinConfig.getint('DIAGNOSTICS', 'frames', fallback=1),
+        'top': addinConfig.getint('DIAGNOSTICS', 'top', fallback=10),
+        'folderPath': configFolderPath,
+    }
+
+def isDiagnosticsEnabled(commandName: str):
+    commandSettings = settings.get(commandName)
+    return commandSettings is not None and commandSettings['enabled']
+
+def countHandlers():
+    # handler objects that are still alive, whether anything in the add-in still lists them or not
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if type(obj).__name__ == 'Handler' and type(obj).__module__ == event_utils.__name__)
+
+def takeSnapshot(commandSettings: dict):
+    if not commandSettings['traceMemory']:
+        return None
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(commandSettings['frames'])
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(True, os.path.join(ADDIN_ROOT_PATH, '*')),
+        tracemalloc.Filter(False, os.path.abspath(__file__)),
+    ])
+
+def collectCounters(counters: dict[str, int]):
+    return {
+        'liveHandlers': countHandlers(),
+        'globalHandlers': len(event_utils._handlers),
+        **counters,
+    }
+
+def commandStarted(commandName: str, counters: dict[str, int]):
+    if not isDiagnosticsEnabled(commandName):
+        return
+    commandSettings = settings[commandName]
+    session = sessions.setdefault(commandName, {'invocations': 0, 'baseline': None, 'baselineCounters': None})
+    session['startSnapshot'] = takeSnapshot(commandSettings)
+    session['startCounters'] = collectCounters(counters)
+
+def topGrowth(snapshot: tracemalloc.Snapshot, previous: tracemalloc.Snapshot, top: int):
+    if snapshot is None or previous is None:
+        return [], 0
+    stats = snapshot.compare_to(previous, 'lineno')
+    growth = sum(stat.size_diff for stat in stats)
+    return [{
+        'location': f'{os.path.relpath(stat.traceback[0].filename, ADDIN_ROOT_PATH)}:{stat.traceback[0].lineno}',
+        'sizeDiff': stat.size_diff,
+        'countDiff': stat.count_diff,
+    } for stat in stats[:top] if stat.size_diff != 0], growth
+
+def commandFinished(commandName: str, counters: dict[str, int]):
+    if not isDiagnosticsEnabled(commandName) or 'startCounters' not in sessions.get(commandName, {}):
+        return None
+    commandSettings = settings[commandName]
+    session = sessions[commandName]
+    session['invocations'] += 1
+    snapshot = takeSnapshot(commandSettings)
+    endCounters = collectCounters(counters)
+    if session['baseline'] is None and session['baselineCounters'] is None:
+        # first finished command is the baseline, imports and caches are allocated during the first run
+        session['baseline'] = snapshot
+        session['baselineCounters'] = endCounters
+
+    commandTop, commandGrowth = topGrowth(snapshot, session['startSnapshot'], commandSettings['top'])
+    sessionTop, sessionGrowth = topGrowth(snapshot, session['baseline'], commandSettings['top'])
+    report = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'command': commandName,
+        'invocation': session['invocations'],
+        'counters': endCounters,
+        'commandCountersGrowth': {key: value - session['startCounters'].get(key, 0) for key, value in endCounters.items()},
+        'sessionCountersGrowth': {key: value - session['baselineCounters'].get(key, 0) for key, value in endCounters.items()},
+        'commandMemoryGrowth': commandGrowth,
+        'sessionMemoryGrowth': sessionGrowth,
+        'commandTop': commandTop,
+        'sessionTop': sessionTop,
+    }
+    del session['startSnapshot']
+    del session['startCounters']
+
+    futil.log(f'{commandName} diagnostics after {report["invocation"]} invocation(s): counters {report["counters"]}, growth since first run {report["sessionCountersGrowth"]}, memory growth {commandGrowth / 1024:.1f} KiB this run, {sessionGrowth / 1024:.1f} KiB since first run')
+    for stat in sessionTop:
+        futil.log(f'    {stat["location"]}: {stat["sizeDiff"] / 1024:+.1f} KiB, {stat["countDiff"]:+d} blocks')
+    try:
+        if not os.path.exists(commandSettings['folderPath']):
+            os.makedirs(commandSettings['folderPath'])
+        with open(os.path.join(commandSettings['folderPath'], DIAGNOSTICS_FILE_NAME), 'a') as diagnosticsFile:
+            diagnosticsFile.write(json.dumps(report) + '\n')
+    except Exception as err:
+        futil.log(f'{commandName} couldn\'t write diagnostics, error: {err}')
+    return report
+
+def stopTracing():
+    sessions.clear()
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
@@ -1,11 +1,13 @@
 import adsk.core, adsk.fusion, traceback
 import os
+import math
+import copy
 
 
 from .const import BIN_CORNER_FILLET_RADIUS, DEFAULT_FILTER_TOLERANCE, DIMENSION_PRINT_HELPER_GROOVE_DEPTH
 from .sketchUtils import createRectangle, filterCirclesByRadius
 from ...lib.gridfinityUtils.baseGeneratorInput import BaseGeneratorInput
-from . import sketchUtils, const, edgeUtils, commonUtils, combineUtils, faceUtils, extrudeUtils, shapeUtils
+from . import sketchUtils, const, edgeUtils, commonUtils, combineUtils, faceUtils, extrudeUtils, shapeUtils, patternUtils, templateCacheUtils
 from ...lib import fusion360utils as futil
 from ... import config
 
@@ -49,79 +51,16 @@ def createCircleAtPointSketch(
 
     return circleSketch
 
-def createGridfinityBase(
+def createBaseHoleCutouts(
     input: BaseGeneratorInput,
+    baseBottomPlane: adsk.fusion.BRepFace,
     targetComponent: adsk.fusion.Component,
-):
-    actual_base_width = input.baseWidth - input.xyClearance * 2.0
-    actual_base_length = input.baseLength - input.xyClearance * 2.0
-    features: adsk.fusion.Features = targetComponent.features
-    extrudeFeatures: adsk.fusion.ExtrudeFeatures = features.extrudeFeatures
-    baseConstructionPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
-    baseConstructionPlaneInput.setByOffset(targetComponent.xYConstructionPlane, adsk.core.ValueInput.createByReal(input.originPoint.z))
-    baseConstructionPlane = targetComponent.constructionPlanes.add(baseConstructionPlaneInput)
-    # create rectangle for the base
-    sketches: adsk.fusion.Sketches = targetComponent.sketches
-    basePlateSketch: adsk.fusion.Sketch = sketches.add(baseConstructionPlane)
-    rectangleOrigin = basePlateSketch.modelToSketchSpace(input.originPoint)
-    createRectangle(actual_base_width, actual_base_length,rectangleOrigin, basePlateSketch)
-
-    # extrude top section
-    topSectionExtrudeDepth = adsk.core.ValueInput.createByReal(const.BIN_BASE_TOP_SECTION_HEIGH)
-    topSectionExtrudeInput = extrudeFeatures.createInput(basePlateSketch.profiles.item(0),
-        adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-    topSectionExtrudeExtent = adsk.fusion.DistanceExtentDefinition.create(topSectionExtrudeDepth)
-    topSectionExtrudeInput.setOneSideExtent(topSectionExtrudeExtent,
-        adsk.fusion.ExtentDirections.NegativeExtentDirection,
-        adsk.core.ValueInput.createByReal(0))
-    topSectionExtrudeFeature = extrudeFeatures.add(topSectionExtrudeInput)
-    baseBody = topSectionExtrudeFeature.bodies.item(0)
-    baseBody.name = 'base'
-
-    # fillet on corners
-    filletFeatures: adsk.fusion.FilletFeatures = features.filletFeatures
-    filletInput = filletFeatures.createInput()
-    filletInput.isRollingBallCorner = True
-    fillet_edges = edgeUtils.selectEdgesByLength(baseBody.faces, const.BIN_BASE_TOP_SECTION_HEIGH, const.DEFAULT_FILTER_TOLERANCE)
-    filletInput.edgeSetInputs.addConstantRadiusEdgeSet(fillet_edges, adsk.core.ValueInput.createByReal(BIN_CORNER_FILLET_RADIUS), True)
-    filletFeatures.add(filletInput)
-
-    # chamfer top section
-    chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
-    chamferInput = chamferFeatures.createInput2()
-    chamfer_edges = adsk.core.ObjectCollection.create()
-    # use one edge for chamfer, the rest will be automatically detected with tangent chain condition
-    chamfer_edges.add(topSectionExtrudeFeature.endFaces.item(0).edges.item(0))
-    chamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(chamfer_edges,
-        topSectionExtrudeDepth,
-        True)
-    chamferFeatures.add(chamferInput)
-
-    # extrude mid/bottom section
-    baseBottomExtrude = extrudeUtils.simpleDistanceExtrude(
-        topSectionExtrudeFeature.endFaces.item(0),
-        adsk.fusion.FeatureOperations.JoinFeatureOperation,
-        const.BIN_BASE_MID_SECTION_HEIGH + const.BIN_BASE_BOTTOM_SECTION_HEIGH,
-        adsk.fusion.ExtentDirections.PositiveExtentDirection,
-        [baseBody],
-        targetComponent
-    )
-
-    if input.hasBottomChamfer:
-        # chamfer bottom section
-        chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
-        chamferInput = chamferFeatures.createInput2()
-        chamfer_edges = commonUtils.objectCollectionFromList(faceUtils.getBottomFace(baseBottomExtrude.bodies.item(0)).edges)
-        chamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(chamfer_edges,
-            adsk.core.ValueInput.createByReal(const.BIN_BASE_BOTTOM_SECTION_HEIGH),
-            True)
-        chamferFeatures.add(chamferInput)
-    
+) -> list[adsk.fusion.BRepBody]:
+    # screw holes and magnet sockets of one base cell, in all four corners
     # screw holes
-    rectangularPatternFeatures: adsk.fusion.RectangularPatternFeatures = features.rectangularPatternFeatures
+    rectangularPatternFeatures: adsk.fusion.RectangularPatternFeatures = targetComponent.features.rectangularPatternFeatures
     cutoutBodies = adsk.core.ObjectCollection.create()
 
-    baseBottomPlane = baseBottomExtrude.endFaces.item(0)
     baseHoleCenterPoint = adsk.core.Point3D.create(
         const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance,
         const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance,
@@ -182,7 +121,7 @@ def createGridfinityBase(
             cutoutBodies.add(grooveBody)
 
 
-    if input.hasScrewHoles or input.hasMagnetCutouts:
+    if cutoutBodies.count > 0:
         if cutoutBodies.count > 1:
             joinFeature = combineUtils.joinBodies(cutoutBodies.item(0), commonUtils.objectCollectionFromList(list(cutoutBodies)[1:]), targetComponent)
             cutoutBodies = commonUtils.objectCollectionFromList(joinFeature.bodies)
@@ -197,67 +136,335 @@ def createGridfinityBase(
         patternInput.quantityTwo = adsk.core.ValueInput.createByReal(2)
         patternInput.distanceTwo = adsk.core.ValueInput.createByReal(patternSpacingY)
         patternFeature = rectangularPatternFeatures.add(patternInput)
-        combineUtils.cutBody(baseBody, commonUtils.objectCollectionFromList(list(cutoutBodies) + list(patternFeature.bodies)), targetComponent)
+        return list(cutoutBodies) + list(patternFeature.bodies)
+    return []
 
-    return baseBody
+def createGridfinityBase(
+    input: BaseGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+):
+    if input.isSweepProfile:
+        return createGridfinityBaseSweep(input, targetComponent)
+    actual_base_width = input.baseWidth - input.xyClearance * 2.0
+    actual_base_length = input.baseLength - input.xyClearance * 2.0
+    features: adsk.fusion.Features = targetComponent.features
+    extrudeFeatures: adsk.fusion.ExtrudeFeatures = features.extrudeFeatures
+    baseConstructionPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
+    baseConstructionPlaneInput.setByOffset(targetComponent.xYConstructionPlane, adsk.core.ValueInput.createByReal(input.originPoint.z))
+    baseConstructionPlane = targetComponent.constructionPlanes.add(baseConstructionPlaneInput)
+    # create rectangle for the base
+    sketches: adsk.fusion.Sketches = targetComponent.sketches
+    basePlateSketch: adsk.fusion.Sketch = sketches.add(baseConstructionPlane)
+    rectangleOrigin = basePlateSketch.modelToSketchSpace(input.originPoint)
+    createRectangle(actual_base_width, actual_base_length,rectangleOrigin, basePlateSketch)
 
-def createBaseWithClearance(input: BaseGeneratorInput, targetComponent: adsk.fusion.Component):
-    features = targetComponent.features
-    # create base
-    baseBody = createGridfinityBase(input, targetComponent)
+    # extrude top section
+    topSectionExtrudeDepth = adsk.core.ValueInput.createByReal(input.topSectionHeight + input.topBandHeight)
+    topSectionExtrudeInput = extrudeFeatures.createInput(basePlateSketch.profiles.item(0),
+        adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
+    topSectionExtrudeExtent = adsk.fusion.DistanceExtentDefinition.create(topSectionExtrudeDepth)
+    topSectionExtrudeInput.setOneSideExtent(topSectionExtrudeExtent,
+        adsk.fusion.ExtentDirections.NegativeExtentDirection,
+        adsk.core.ValueInput.createByReal(0))
+    topSectionExtrudeFeature = extrudeFeatures.add(topSectionExtrudeInput)
+    baseBody = topSectionExtrudeFeature.bodies.item(0)
+    baseBody.name = 'base'
 
-    # offset side faces
-    offsetFacesInput = features.offsetFeatures.createInput(
-        commonUtils.objectCollectionFromList([face for face in list(baseBody.faces) if not faceUtils.isZNormal(face)]),
-        adsk.core.ValueInput.createByReal(0),
-        adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
-        False
+    # fillet on corners
+    filletFeatures: adsk.fusion.FilletFeatures = features.filletFeatures
+    filletInput = filletFeatures.createInput()
+    filletInput.isRollingBallCorner = True
+    fillet_edges = edgeUtils.selectEdgesByLength(baseBody.faces, input.topSectionHeight + input.topBandHeight, const.DEFAULT_FILTER_TOLERANCE)
+    filletInput.edgeSetInputs.addConstantRadiusEdgeSet(fillet_edges, adsk.core.ValueInput.createByReal(input.cornerFilletRadius), True)
+    filletFeatures.add(filletInput)
+
+    # chamfer top section
+    chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
+    chamferInput = chamferFeatures.createInput2()
+    chamfer_edges = adsk.core.ObjectCollection.create()
+    # use one edge for chamfer, the rest will be automatically detected with tangent chain condition
+    chamfer_edges.add(topSectionExtrudeFeature.endFaces.item(0).edges.item(0))
+    chamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(chamfer_edges,
+        adsk.core.ValueInput.createByReal(input.topSectionHeight),
+        True)
+    chamferFeatures.add(chamferInput)
+
+    # extrude mid/bottom section
+    baseBottomExtrude = extrudeUtils.simpleDistanceExtrude(
+        topSectionExtrudeFeature.endFaces.item(0),
+        adsk.fusion.FeatureOperations.JoinFeatureOperation,
+        input.midSectionHeight + input.bottomSectionHeight,
+        adsk.fusion.ExtentDirections.PositiveExtentDirection,
+        [baseBody],
+        targetComponent
     )
-    offsetFacesFeature = features.offsetFeatures.add(offsetFacesInput)
-    offsetFacesFeature.name = "bin base side faces"
-
-    # original solid body might be included into feature bodies array, find created surfaces using isSolid flag
-    offsetSurfaceBodies = [body for body in list(offsetFacesFeature.bodies) if not body.isSolid][0]
-    offsetSurfaceBodies.name = "bin base side faces"
-
-    extentEdge = faceUtils.getTopHorizontalEdge(offsetSurfaceBodies.edges)
-    extendClearanceSurfaceFeatureInput = features.extendFeatures.createInput(
-        commonUtils.objectCollectionFromList([extentEdge]),
-        adsk.core.ValueInput.createByReal(input.xyClearance * 2),
-        adsk.fusion.SurfaceExtendTypes.NaturalSurfaceExtendType,
-        True
+
+    if input.hasBottomChamfer and input.bottomSectionHeight > const.DEFAULT_FILTER_TOLERANCE:
+        # chamfer bottom section
+        chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
+        chamferInput = chamferFeatures.createInput2()
+        chamfer_edges = commonUtils.objectCollectionFromList(faceUtils.getBottomFace(baseBottomExtrude.bodies.item(0)).edges)
+        chamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(chamfer_edges,
+            adsk.core.ValueInput.createByReal(input.bottomSectionHeight),
+            True)
+        chamferFeatures.add(chamferInput)
+    
+    if input.hasScrewHoles or input.hasMagnetCutouts:
+        combineUtils.cutBody(
+            baseBody,
+            commonUtils.objectCollectionFromList(createBaseHoleCutouts(input, baseBottomExtrude.endFaces.item(0), targetComponent)),
+            targetComponent,
+        )
+
+    return baseBody
+
+def getBaseProfileCutawayPoints(input: BaseGeneratorInput) -> list[tuple[float, float]]:
+    # (inset from the outer wall, depth below the top) corners of the area the stepped profile removes from a straight wall,
+    # top band, 45 degree top section, vertical mid section and optional 45 degree bottom section
+    topBandHeight = input.topBandHeight
+    topDepth = topBandHeight + input.topSectionHeight
+    midDepth = topDepth + input.midSectionHeight
+    baseHeight = midDepth + input.bottomSectionHeight
+    points = [(0, topBandHeight), (input.topSectionHeight, topDepth)]
+    if input.hasBottomChamfer and input.bottomSectionHeight > const.DEFAULT_FILTER_TOLERANCE:
+        points = points + [(input.topSectionHeight, midDepth), (input.topSectionHeight + input.bottomSectionHeight, baseHeight)]
+    else:
+        points.append((input.topSectionHeight, baseHeight))
+    points.append((0, baseHeight))
+    return points
+
+def createBaseProfileSketch(
+    input: BaseGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.Sketch:
+    # cutaway profile drawn across the middle of the front wall, perpendicular to it
+    profileX = input.originPoint.x + (input.baseWidth - input.xyClearance * 2.0) / 2
+    profilePlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
+    profilePlaneInput.setByOffset(targetComponent.yZConstructionPlane, adsk.core.ValueInput.createByReal(profileX))
+    profilePlane = targetComponent.constructionPlanes.add(profilePlaneInput)
+    profileSketch: adsk.fusion.Sketch = targetComponent.sketches.add(profilePlane)
+    profileSketch.name = "base profile"
+    lines: adsk.fusion.SketchLines = profileSketch.sketchCurves.sketchLines
+    sketchPoints = [profileSketch.modelToSketchSpace(adsk.core.Point3D.create(
+        profileX,
+        input.originPoint.y + inset,
+        input.originPoint.z - depth,
+    )) for [inset, depth] in getBaseProfileCutawayPoints(input)]
+    firstLine = lines.addByTwoPoints(sketchPoints[0], sketchPoints[1])
+    previousLine = firstLine
+    for point in sketchPoints[2:]:
+        previousLine = lines.addByTwoPoints(previousLine.endSketchPoint, point)
+    lines.addByTwoPoints(previousLine.endSketchPoint, firstLine.startSketchPoint)
+    return profileSketch
+
+def createGridfinityBaseSweep(
+    input: BaseGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.BRepBody:
+    # the footprint with rounded corners is extruded to the full base height and the stepped profile
+    # is swept around the same rounded outline, two features instead of extrudes, fillet and chamfers
+    actualBaseWidth = input.baseWidth - input.xyClearance * 2.0
+    actualBaseLength = input.baseLength - input.xyClearance * 2.0
+    baseHeight = input.topBandHeight + input.topSectionHeight + input.midSectionHeight + input.bottomSectionHeight
+    features: adsk.fusion.Features = targetComponent.features
+    baseConstructionPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
+    baseConstructionPlaneInput.setByOffset(targetComponent.xYConstructionPlane, adsk.core.ValueInput.createByReal(input.originPoint.z))
+    baseConstructionPlane = targetComponent.constructionPlanes.add(baseConstructionPlaneInput)
+    baseSketch: adsk.fusion.Sketch = targetComponent.sketches.add(baseConstructionPlane)
+    baseSketch.name = "base outline"
+    outlineLines = sketchUtils.createRoundedRectangle(
+        actualBaseWidth,
+        actualBaseLength,
+        baseSketch.modelToSketchSpace(input.originPoint),
+        input.cornerFilletRadius,
+        baseSketch,
     )
-    extendFeature = features.extendFeatures.add(extendClearanceSurfaceFeatureInput)
-
-    # thicken faces to add clearance
-    thickenFaces = commonUtils.objectCollectionFromList(offsetFacesFeature.faces, extendFeature.faces);
-    thickenFeatureInput = features.thickenFeatures.createInput(
-        thickenFaces,
-        adsk.core.ValueInput.createByReal(input.xyClearance),
-        False,
+
+    baseExtrude = extrudeUtils.simpleDistanceExtrude(
+        baseSketch.profiles.item(0),
         adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
-        False,
-    )
-    thickenFeaure = features.thickenFeatures.add(thickenFeatureInput)
-    thickenFeaure.name = "clearance"
-    thickenFeaure.bodies.item(0).name = "bin base clearance layer"
-    features.removeFeatures.add(offsetSurfaceBodies)
-
-    # thickened body would go beyond the bottom face, use bounding box to make bottom flat
-    clearanceBoundingBox = extrudeUtils.createBoxAtPoint(
-        input.baseWidth,
-        input.baseLength,
-        -const.BIN_BASE_HEIGHT,
+        baseHeight,
+        adsk.fusion.ExtentDirections.NegativeExtentDirection,
+        [],
         targetComponent,
-        adsk.core.Point3D.create(input.originPoint.x - input.xyClearance, input.originPoint.y - input.xyClearance, input.originPoint.z),
-        )
-    clearanceBoundingBox.name = "clearance bounding box"
-    clearanceBoundingBox.bodies.item(0).name = "clearance bounding box"
-    combineFeatureInput = features.combineFeatures.createInput(
-        thickenFeaure.bodies.item(0),
-        commonUtils.objectCollectionFromList(clearanceBoundingBox.bodies)
     )
-    combineFeatureInput.operation = adsk.fusion.FeatureOperations.IntersectFeatureOperation
-    features.combineFeatures.add(combineFeatureInput)
-    combineUtils.joinBodies(baseBody, commonUtils.objectCollectionFromList(thickenFeaure.bodies), targetComponent)
-    return baseBody
\ No newline at end of file
+    baseBody = baseExtrude.bodies.item(0)
+    baseBody.name = 'base'
+
+    profileSketch = createBaseProfileSketch(input, targetComponent)
+    sweepFeatures: adsk.fusion.SweepFeatures = features.sweepFeatures
+    sweepInput = sweepFeatures.createInput(
+        profileSketch.profiles.item(0),
+        features.createPath(outlineLines.item(0), True),
+        adsk.fusion.FeatureOperations.CutFeatureOperation,
+    )
+    sweepInput.orientation = adsk.fusion.SweepOrientationTypes.PerpendicularOrientationType
+    sweepInput.participantBodies = [baseBody]
+    sweepFeatures.add(sweepInput)
+
+    if input.hasScrewHoles or input.hasMagnetCutouts:
+        combineUtils.cutBody(
+            baseBody,
+            commonUtils.objectCollectionFromList(createBaseHoleCutouts(input, faceUtils.getBottomFace(baseBody), targetComponent)),
+            targetComponent,
+        )
+
+    return baseBody
+
+def joinBaseCells(
+    cellsExtrude: adsk.fusion.ExtrudeFeature,
+    baseBody: adsk.fusion.BRepBody,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.BRepBody:
+    # a new body extrude of separate footprints gives a body per cell, they are kept as lumps of a single base body
+    if not baseBody is None:
+        return baseBody
+    baseBody = cellsExtrude.bodies.item(0)
+    baseBody.name = 'base'
+    if cellsExtrude.bodies.count > 1:
+        combineUtils.joinBodies(baseBody, commonUtils.objectCollectionFromList(list(cellsExtrude.bodies)[1:]), targetComponent)
+    return baseBody
+
+def createGridfinityBaseGrid(
+    input: BaseGeneratorInput,
+    countX: int,
+    countY: int,
+    targetComponent: adsk.fusion.Component,
+    targetBody: adsk.fusion.BRepBody = None,
+    cellSpacing: tuple[float, float] = None,
+) -> adsk.fusion.BRepBody:
+    # all cells are drawn as rounded footprints in one sketch and every section is extruded once for all of them,
+    # the 45 degree sections are tapered extrudes, so no fillet or chamfer feature is needed,
+    # with targetBody the cells are joined into it, otherwise they end up as lumps of a single base body
+    actualBaseWidth = input.baseWidth - input.xyClearance * 2.0
+    actualBaseLength = input.baseLength - input.xyClearance * 2.0
+    [spacingX, spacingY] = (input.baseWidth, input.baseLength) if cellSpacing is None else cellSpacing
+    baseConstructionPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
+    baseConstructionPlaneInput.setByOffset(targetComponent.xYConstructionPlane, adsk.core.ValueInput.createByReal(input.originPoint.z))
+    baseConstructionPlane = targetComponent.constructionPlanes.add(baseConstructionPlaneInput)
+    hasBottomChamfer = input.hasBottomChamfer and input.bottomSectionHeight > const.DEFAULT_FILTER_TOLERANCE
+
+    cells = [(x, y) for x in range(countX) for y in range(countY)]
+    cellGroups = [cells]
+    if actualBaseWidth >= spacingX - const.DEFAULT_FILTER_TOLERANCE or actualBaseLength >= spacingY - const.DEFAULT_FILTER_TOLERANCE:
+        # footprints sharing a side would be merged and tapered as one outline,
+        # alternating cells only meet at their rounded corners, so each half is extruded on its own
+        cellGroups = [group for group in [[cell for cell in cells if sum(cell) % 2 == parity] for parity in range(2)] if len(group) > 0]
+
+    groupBodies: list[adsk.fusion.BRepBody] = []
+    for cellGroup in cellGroups:
+        # with several groups each one becomes a body of its own, they are joined once all sections are built
+        baseBody = targetBody if len(cellGroups) == 1 else None
+        baseGridSketch: adsk.fusion.Sketch = targetComponent.sketches.add(baseConstructionPlane)
+        baseGridSketch.name = "base cells"
+        for [x, y] in cellGroup:
+            sketchUtils.createRoundedRectangle(
+                actualBaseWidth,
+                actualBaseLength,
+                baseGridSketch.modelToSketchSpace(adsk.core.Point3D.create(
+                    input.originPoint.x + x * spacingX,
+                    input.originPoint.y + y * spacingY,
+                    input.originPoint.z,
+                )),
+                input.cornerFilletRadius,
+                baseGridSketch,
+            )
+
+        sectionStart = commonUtils.objectCollectionFromList(baseGridSketch.profiles)
+        sectionDirection = adsk.fusion.ExtentDirections.NegativeExtentDirection
+        if input.topBandHeight > const.DEFAULT_FILTER_TOLERANCE:
+            topBandExtrude = extrudeUtils.simpleDistanceExtrude(
+                sectionStart,
+                adsk.fusion.FeatureOperations.NewBodyFeatureOperation if baseBody is None else adsk.fusion.FeatureOperations.JoinFeatureOperation,
+                input.topBandHeight,
+                sectionDirection,
+                [] if baseBody is None else [baseBody],
+                targetComponent,
+            )
+            baseBody = joinBaseCells(topBandExtrude, baseBody, targetComponent)
+            sectionStart = commonUtils.objectCollectionFromList(topBandExtrude.endFaces)
+            sectionDirection = adsk.fusion.ExtentDirections.PositiveExtentDirection
+
+        # negative taper narrows the section towards its end
+        topSectionExtrude = extrudeUtils.simpleDistanceExtrude(
+            sectionStart,
+            adsk.fusion.FeatureOperations.NewBodyFeatureOperation if baseBody is None else adsk.fusion.FeatureOperations.JoinFeatureOperation,
+            input.topSectionHeight,
+            sectionDirection,
+            [] if baseBody is None else [baseBody],
+            targetComponent,
+            math.radians(-45),
+        )
+        baseBody = joinBaseCells(topSectionExtrude, baseBody, targetComponent)
+
+        baseBottomExtrude = extrudeUtils.simpleDistanceExtrude(
+            commonUtils.objectCollectionFromList(topSectionExtrude.endFaces),
+            adsk.fusion.FeatureOperations.JoinFeatureOperation,
+            input.midSectionHeight if hasBottomChamfer else input.midSectionHeight + input.bottomSectionHeight,
+            adsk.fusion.ExtentDirections.PositiveExtentDirection,
+            [baseBody],
+            targetComponent,
+        )
+        if hasBottomChamfer:
+            baseBottomExtrude = extrudeUtils.simpleDistanceExtrude(
+                commonUtils.objectCollectionFromList(baseBottomExtrude.endFaces),
+                adsk.fusion.FeatureOperations.JoinFeatureOperation,
+                input.bottomSectionHeight,
+                adsk.fusion.ExtentDirections.PositiveExtentDirection,
+                [baseBody],
+                targetComponent,
+                math.radians(-45),
+            )
+        groupBodies.append(baseBody)
+
+    baseBody = groupBodies[0] if targetBody is None else targetBody
+    otherGroupBodies = [body for body in groupBodies if not body is baseBody]
+    if len(otherGroupBodies) > 0:
+        combineUtils.joinBodies(baseBody, commonUtils.objectCollectionFromList(otherGroupBodies), targetComponent)
+
+    if input.hasScrewHoles or input.hasMagnetCutouts:
+        holeCutouts = createBaseHoleCutouts(input, faceUtils.getBottomFace(baseBody), targetComponent)
+        if countX > 1 or countY > 1:
+            holeCutoutsPattern = patternUtils.recPattern(
+                commonUtils.objectCollectionFromList(holeCutouts),
+                (targetComponent.xConstructionAxis, targetComponent.yConstructionAxis),
+                (spacingX, spacingY),
+                (countX, countY),
+                targetComponent,
+            )
+            holeCutouts = holeCutouts + list(holeCutoutsPattern.bodies)
+        combineUtils.cutBody(baseBody, commonUtils.objectCollectionFromList(holeCutouts), targetComponent)
+
+    return baseBody
+
+def createBaseWithClearance(
+    input: BaseGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+    countX: int = 1,
+    countY: int = 1,
+):
+    # the base grown by xyClearance on every side face, clipped to the original height,
+    # built directly from an outward offset profile instead of offsetting and thickening the base faces,
+    # several cells are built together as one body, still spaced by the original base size,
+    # with an active template session later calls with the same settings get a moved copy of the first body
+    templateKey = ('base with clearance', countX, countY, templateCacheUtils.inputKey(input, ['_originPoint']))
+    templateBody = templateCacheUtils.placeTemplate(templateKey, input.originPoint, targetComponent)
+    if not templateBody is None:
+        return templateBody
+    clearance = input.xyClearance
+    # 45 degree faces move by clearance * sqrt(2) horizontally, vertical ones by clearance,
+    # so the grown top chamfer meets the outer wall clearance * (sqrt(2) - 1) below the top
+    topBandHeight = clearance * (math.sqrt(2) - 1)
+    clearanceInput = copy.copy(input)
+    clearanceInput.originPoint = adsk.core.Point3D.create(input.originPoint.x - clearance, input.originPoint.y - clearance, input.originPoint.z)
+    clearanceInput.baseWidth = input.baseWidth + clearance * 2
+    clearanceInput.baseLength = input.baseLength + clearance * 2
+    clearanceInput.cornerFilletRadius = input.cornerFilletRadius + clearance
+    clearanceInput.topBandHeight = input.topBandHeight + topBandHeight
+    clearanceInput.bottomSectionHeight = max(0, input.bottomSectionHeight - topBandHeight)
+    if countX > 1 or countY > 1:
+        baseBody = createGridfinityBaseGrid(clearanceInput, countX, countY, targetComponent, None, (input.baseWidth, input.baseLength))
+    else:
+        baseBody = createGridfinityBase(clearanceInput, targetComponent)
+    templateCacheUtils.storeTemplate(templateKey, input.originPoint, baseBody)
+    return baseBody
@@ -1,6 +1,6 @@
 import adsk.core, adsk.fusion, traceback
 
-from .const import DIMENSION_MAGNET_CUTOUT_DEPTH, DIMENSION_MAGNET_CUTOUT_DIAMETER, DIMENSION_SCREW_HOLE_DIAMETER
+from .const import DIMENSION_MAGNET_CUTOUT_DEPTH, DIMENSION_MAGNET_CUTOUT_DIAMETER, DIMENSION_SCREW_HOLE_DIAMETER, BIN_BASE_TOP_SECTION_HEIGH, BIN_BASE_MID_SECTION_HEIGH, BIN_BASE_BOTTOM_SECTION_HEIGH, BIN_CORNER_FILLET_RADIUS
 
 class BaseGeneratorInput():
     def __init__(self):
@@ -10,6 +10,14 @@ class BaseGeneratorInput():
         self.screwHolesDiameter = DIMENSION_SCREW_HOLE_DIAMETER
         self.magnetCutoutsDiameter = DIMENSION_MAGNET_CUTOUT_DIAMETER
         self.magnetCutoutsDepth = DIMENSION_MAGNET_CUTOUT_DEPTH
+        self.topSectionHeight = BIN_BASE_TOP_SECTION_HEIGH
+        self.midSectionHeight = BIN_BASE_MID_SECTION_HEIGH
+        self.bottomSectionHeight = BIN_BASE_BOTTOM_SECTION_HEIGH
+        self.cornerFilletRadius = BIN_CORNER_FILLET_RADIUS
+        # vertical band above the top chamfer, used by the clearance base
+        self.topBandHeight = 0
+        # sweep the stepped profile around the footprint instead of filleting and chamfering extrudes
+        self.isSweepProfile = False
 
     @property
     def originPoint(self) -> adsk.core.Point3D:
@@ -89,4 +97,52 @@ class BaseGeneratorInput():
 
     @magnetCutoutsDepth.setter
     def magnetCutoutsDepth(self, value: float):
-        self._magnetCutoutsDepth = value
\ No newline at end of file
+        self._magnetCutoutsDepth = value
+
+    @property
+    def topSectionHeight(self) -> float:
+        return self._topSectionHeight
+
+    @topSectionHeight.setter
+    def topSectionHeight(self, value: float):
+        self._topSectionHeight = value
+
+    @property
+    def midSectionHeight(self) -> float:
+        return self._midSectionHeight
+
+    @midSectionHeight.setter
+    def midSectionHeight(self, value: float):
+        self._midSectionHeight = value
+
+    @property
+    def bottomSectionHeight(self) -> float:
+        return self._bottomSectionHeight
+
+    @bottomSectionHeight.setter
+    def bottomSectionHeight(self, value: float):
+        self._bottomSectionHeight = value
+
+    @property
+    def cornerFilletRadius(self) -> float:
+        return self._cornerFilletRadius
+
+    @cornerFilletRadius.setter
+    def cornerFilletRadius(self, value: float):
+        self._cornerFilletRadius = value
+
+    @property
+    def topBandHeight(self) -> float:
+        return self._topBandHeight
+
+    @topBandHeight.setter
+    def topBandHeight(self, value: float):
+        self._topBandHeight = value
+
+    @property
+    def isSweepProfile(self) -> bool:
+        return self._isSweepProfile
+
+    @isSweepProfile.setter
+    def isSweepProfile(self, value: bool):
+        self._isSweepProfile = value
@@ -13,6 +13,7 @@ def createGridfinityBaseplate(input: BaseplateGeneratorInput, targetComponent: a
     cutoutInput.baseWidth = input.baseWidth
     cutoutInput.baseLength = input.baseLength
     cutoutInput.xyClearance = input.xyClearance
+    cutoutInput.isSweepProfile = input.isSweepBaseProfile
     baseBody = baseGenerator.createBaseWithClearance(cutoutInput, targetComponent)
 
     cuttingTools: list[adsk.fusion.BRepBody] = [baseBody]
@@ -283,10 +284,9 @@ def createGridfinityBaseplate(input: BaseplateGeneratorInput, targetComponent: a
 
 
     # cut everything
-    toolBodies = commonUtils.objectCollectionFromList(cuttingTools)
-    finalCut = combineUtils.cutBody(
+    finalCut = combineUtils.cutBodyReduced(
         binInterfaceBody,
-        toolBodies,
+        cuttingTools,
         targetComponent,
     )
     finalCut.name = "final baseplate cut"
@@ -15,6 +15,7 @@ class BaseplateGeneratorInput():
         self.xyClearance = const.BIN_XY_CLEARANCE
         self.binZClearance = const.BASEPLATE_BIN_Z_CLEARANCE
         self.connectionScrewHolesDiameter = const.DIMENSION_PLATE_CONNECTION_SCREW_HOLE_DIAMETER
+        self.isSweepBaseProfile = False
 
     @property
     def baseWidth(self) -> float:
@@ -151,3 +152,11 @@ class BaseplateGeneratorInput():
     @magnetCutoutsDepth.setter
     def magnetCutoutsDepth(self, value: float):
         self._magnetCutoutsDepth = value
+
+    @property
+    def isSweepBaseProfile(self) -> bool:
+        return self._isSweepBaseProfile
+
+    @isSweepBaseProfile.setter
+    def isSweepBaseProfile(self, value: bool):
+        self._isSweepBaseProfile = value
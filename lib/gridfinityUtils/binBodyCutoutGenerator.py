@@ -5,7 +5,7 @@ import math
 from ...lib.gridfinityUtils import geometryUtils
 from ...lib import fusion360utils as futil
 from ...lib.gridfinityUtils import filletUtils
-from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils
+from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils, bodyUtils
 from .baseGeneratorInput import BaseGeneratorInput
 from .binBodyCutoutGeneratorInput import BinBodyCutoutGeneratorInput
 from ... import config
@@ -25,6 +25,8 @@ def createGridfinityBinBodyCutout(
     input: BinBodyCutoutGeneratorInput,
     targetComponent: adsk.fusion.Component,
 ):
+    if input.isProfileCutout:
+        return createGridfinityBinBodyProfileCutouts([input], targetComponent)[0]
 
     cutoutPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
     cutoutPlaneInput.setByOffset(
@@ -52,31 +54,27 @@ def createGridfinityBinBodyCutout(
     innerCutoutBody = innerCutout.bodies.item(0)
     innerCutoutBody.name = 'inner cutout'
 
-    # scoop
+    # scoop first, the vertical fillet then ends on the rounded scoop face
     if input.hasScoop:
         [innerCutoutScoopFace, innerCutoputScoopOppositeFace] = getInnerCutoutScoopFace(innerCutoutBody)
         scoopEdge = faceUtils.getBottomHorizontalEdge(innerCutoutScoopFace.edges)
-        scoopMaxRadius = min(input.scoopMaxRadius, input.height) if min(input.scoopMaxRadius, input.height) >= input.filletRadius else input.filletRadius
         filletUtils.createFillet(
             [scoopEdge],
-            scoopMaxRadius,
+            getScoopRadius(input),
             False,
             targetComponent
         )
-    # fillet inner cutout
-    [innerCutoutScoopFace, innerCutoputScoopOppositeFace] = getInnerCutoutScoopFace(innerCutoutBody)
-    innerCutoutVerticalFaces = faceUtils.getVerticalEdges(innerCutoutBody.faces)
     filletUtils.createFillet(
-        innerCutoutVerticalFaces,
+        faceUtils.getVerticalEdges(innerCutoutBody.faces),
         input.filletRadius,
         True,
         targetComponent
     )
     if input.hasBottomFillet:
-        # recalculate faces after fillet
+        # after the vertical fillet the tangent chain of the bottom edge runs around the rounded corners
+        # and along both side bottom edges, so it needs its own feature
         [innerCutoutScoopFace, innerCutoputScoopOppositeFace] = getInnerCutoutScoopFace(innerCutoutBody)
         scoopOppositeEdge = faceUtils.getBottomHorizontalEdge(innerCutoputScoopOppositeFace.edges)
-
         filletUtils.createFillet(
             [scoopOppositeEdge],
             input.filletRadius,
@@ -85,3 +83,288 @@ def createGridfinityBinBodyCutout(
         )
 
     return innerCutoutBody
+
+
+def getCutoutTemplateKey(input: BinBodyCutoutGeneratorInput):
+    # everything that defines the cutout shape, the origin only moves it
+    return (
+        round(input.width, 6),
+        round(input.length, 6),
+        round(input.height, 6),
+        input.hasScoop,
+        round(input.scoopMaxRadius, 6),
+        round(input.filletRadius, 6),
+        input.hasBottomFillet,
+    )
+
+def isCutoutOverlapping(
+    first: BinBodyCutoutGeneratorInput,
+    second: BinBodyCutoutGeneratorInput,
+):
+    # touching rectangles count as overlapping, their profiles would merge in a shared sketch
+    return first.origin.x <= second.origin.x + second.width + const.DEFAULT_FILTER_TOLERANCE \
+        and second.origin.x <= first.origin.x + first.width + const.DEFAULT_FILTER_TOLERANCE \
+        and first.origin.y <= second.origin.y + second.length + const.DEFAULT_FILTER_TOLERANCE \
+        and second.origin.y <= first.origin.y + first.length + const.DEFAULT_FILTER_TOLERANCE
+
+def hasOverlappingCutouts(inputs: list[BinBodyCutoutGeneratorInput]):
+    return any(isCutoutOverlapping(first, second) for index, first in enumerate(inputs) for second in inputs[index + 1:])
+
+def getCutoutBodies(
+    bodies: list[adsk.fusion.BRepBody],
+    inputs: list[BinBodyCutoutGeneratorInput],
+) -> list[adsk.fusion.BRepBody]:
+    # every input is paired with the extruded body that contains the center of its rectangle
+    cutoutBodies: list[adsk.fusion.BRepBody] = []
+    for input in inputs:
+        centerX = input.origin.x + input.width / 2
+        centerY = input.origin.y + input.length / 2
+        cutoutBody = next(body for body in bodies
+            if body.boundingBox.minPoint.x <= centerX <= body.boundingBox.maxPoint.x
+            and body.boundingBox.minPoint.y <= centerY <= body.boundingBox.maxPoint.y)
+        cutoutBody.name = 'inner cutout'
+        cutoutBodies.append(cutoutBody)
+    return cutoutBodies
+
+def createSeparateBinBodyCutouts(
+    inputs: list[BinBodyCutoutGeneratorInput],
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    # overlapping custom compartments merge into one profile in a shared sketch, so each is built on its own,
+    # every distinct cutout is built once, repeats are copies of it moved into place,
+    # a copy and a move are cheaper than a plane, a sketch, an extrude and the fillets of another cutout
+    templates: dict[tuple, tuple[BinBodyCutoutGeneratorInput, adsk.fusion.BRepBody]] = {}
+    cutoutBodies: list[adsk.fusion.BRepBody] = []
+    for input in inputs:
+        templateKey = getCutoutTemplateKey(input)
+        if templateKey in templates:
+            [templateInput, templateBody] = templates[templateKey]
+            cutoutBodies.append(bodyUtils.copyBody(
+                templateBody,
+                templateInput.origin.vectorTo(input.origin),
+                targetComponent,
+            ))
+        else:
+            cutoutBody = createGridfinityBinBodyCutout(input, targetComponent)
+            templates[templateKey] = (input, cutoutBody)
+            cutoutBodies.append(cutoutBody)
+    return cutoutBodies
+
+def createGridfinityBinBodyCutouts(
+    inputs: list[BinBodyCutoutGeneratorInput],
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    # cutouts starting at the same height with the same depth share one sketch, one extrude and one fillet per step,
+    # returned bodies are in the order of inputs
+    if len(inputs) == 1:
+        return [createGridfinityBinBodyCutout(inputs[0], targetComponent)]
+
+    if hasOverlappingCutouts(inputs):
+        return createSeparateBinBodyCutouts(inputs, targetComponent)
+
+    if inputs[0].isProfileCutout:
+        return createGridfinityBinBodyProfileCutouts(inputs, targetComponent)
+
+    cutoutPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
+    cutoutPlaneInput.setByOffset(
+        targetComponent.xYConstructionPlane,
+        adsk.core.ValueInput.createByReal(inputs[0].origin.z)
+    )
+    cutoutConstructionPlane = targetComponent.constructionPlanes.add(cutoutPlaneInput)
+    innerCutoutSketch: adsk.fusion.Sketch = targetComponent.sketches.add(cutoutConstructionPlane)
+    innerCutoutSketch.name = "inner cutouts sketch"
+    for input in inputs:
+        sketchUtils.createRectangle(
+            input.width,
+            input.length,
+            adsk.core.Point3D.create(input.origin.x, input.origin.y, 0),
+            innerCutoutSketch,
+        )
+
+    innerCutouts = extrudeUtils.simpleDistanceExtrude(
+        commonUtils.objectCollectionFromList(innerCutoutSketch.profiles),
+        adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
+        inputs[0].height,
+        adsk.fusion.ExtentDirections.NegativeExtentDirection,
+        [],
+        targetComponent,
+    )
+    # cutouts do not overlap or touch here, so every profile ends up as a separate body
+    innerCutoutBodies = getCutoutBodies(list(innerCutouts.bodies), inputs)
+
+    # scoops of all cutouts in one feature ahead of the vertical fillet, same order as the single cutout
+    cutoutFillets = filletUtils.FilletEdgeSets()
+    scoopMaxRadius = getScoopRadius(inputs[0])
+    for input, innerCutoutBody in zip(inputs, innerCutoutBodies):
+        if input.hasScoop:
+            [innerCutoutScoopFace, innerCutoputScoopOppositeFace] = getInnerCutoutScoopFace(innerCutoutBody)
+            cutoutFillets.add([faceUtils.getBottomHorizontalEdge(innerCutoutScoopFace.edges)], scoopMaxRadius, False)
+    cutoutFillets.commit(targetComponent)
+    # vertical edges of all cutouts, picked after the scoop fillet
+    for input, innerCutoutBody in zip(inputs, innerCutoutBodies):
+        cutoutFillets.add(faceUtils.getVerticalEdges(innerCutoutBody.faces), input.filletRadius, True)
+    cutoutFillets.commit(targetComponent)
+    # bottom edges of all cutouts in a second feature, picked after the vertical fillet for the same tangent chain
+    for input, innerCutoutBody in zip(inputs, innerCutoutBodies):
+        if input.hasBottomFillet:
+            [innerCutoutScoopFace, innerCutoputScoopOppositeFace] = getInnerCutoutScoopFace(innerCutoutBody)
+            cutoutFillets.add([faceUtils.getBottomHorizontalEdge(innerCutoputScoopOppositeFace.edges)], input.filletRadius, True)
+    cutoutFillets.commit(targetComponent)
+
+    return innerCutoutBodies
+
+def getScoopRadius(input: BinBodyCutoutGeneratorInput):
+    return min(input.scoopMaxRadius, input.height) if min(input.scoopMaxRadius, input.height) >= input.filletRadius else input.filletRadius
+
+def createCornerFilletProfile(
+    corner: adsk.core.Point3D,
+    direction: adsk.core.Vector3D,
+    radius: float,
+    sketch: adsk.fusion.Sketch,
+):
+    # material left in a bottom corner by a fillet of the given radius, direction is horizontal and points from the wall into the cutout
+    lines: adsk.fusion.SketchLines = sketch.sketchCurves.sketchLines
+    arcs: adsk.fusion.SketchArcs = sketch.sketchCurves.sketchArcs
+    wallLine = lines.addByTwoPoints(
+        sketch.modelToSketchSpace(corner),
+        sketch.modelToSketchSpace(adsk.core.Point3D.create(corner.x, corner.y, corner.z + radius)),
+    )
+    bottomLine = lines.addByTwoPoints(
+        wallLine.startSketchPoint,
+        sketch.modelToSketchSpace(adsk.core.Point3D.create(corner.x + direction.x * radius, corner.y + direction.y * radius, corner.z)),
+    )
+    arcMidPointOffset = radius * (1 - math.sqrt(2) / 2)
+    arcs.addByThreePoints(
+        wallLine.endSketchPoint,
+        sketch.modelToSketchSpace(adsk.core.Point3D.create(
+            corner.x + direction.x * arcMidPointOffset,
+            corner.y + direction.y * arcMidPointOffset,
+            corner.z + arcMidPointOffset,
+        )),
+        bottomLine.endSketchPoint,
+    )
+
+def cutCornerFilletProfiles(
+    groups: list[tuple[list[int], list[tuple[adsk.core.Point3D, adsk.core.Vector3D, float]]]],
+    innerCutoutBodies: list[adsk.fusion.BRepBody],
+    extrudeDistances: list[float],
+    sketch: adsk.fusion.Sketch,
+    targetComponent: adsk.fusion.Component,
+):
+    # groups are (cutout indexes, corners as (corner, direction into the cutout, radius)), groups sharing a corner share its profile,
+    # every group extrudes its own profiles along the sketch normal and only cuts its own cutouts
+    drawnCorners: set[tuple] = set()
+    for [corner, direction, radius] in [corner for [indexes, corners] in groups for corner in corners]:
+        cornerKey = (round(corner.x, 6), round(corner.y, 6), direction.x, direction.y, round(radius, 6))
+        if not cornerKey in drawnCorners:
+            drawnCorners.add(cornerKey)
+            createCornerFilletProfile(corner, direction, radius, sketch)
+
+    for [indexes, corners], extrudeDistance in zip(groups, extrudeDistances):
+        # a point just inside every corner profile picks it from the shared sketch
+        profiles = [sketchUtils.getProfileAtPoint(
+            sketch,
+            adsk.core.Point3D.create(
+                corner.x + direction.x * radius / 4,
+                corner.y + direction.y * radius / 4,
+                corner.z + radius / 4,
+            ),
+        ) for [corner, direction, radius] in corners]
+        extrudeUtils.simpleDistanceExtrude(
+            commonUtils.objectCollectionFromList(profiles),
+            adsk.fusion.FeatureOperations.CutFeatureOperation,
+            extrudeDistance,
+            adsk.fusion.ExtentDirections.PositiveExtentDirection,
+            [innerCutoutBodies[index] for index in indexes],
+            targetComponent,
+        )
+
+def createGridfinityBinBodyProfileCutouts(
+    inputs: list[BinBodyCutoutGeneratorInput],
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    # vertical edges are rounded by sketch fillets, scoop and bottom fillets are cut by side profiles
+    # extruded along X through all cutouts of a row at once and along Y through all cutouts of a column,
+    # no fillet features are created, where the front and side roundings meet the corner is not blended
+    cutoutPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
+    cutoutPlaneInput.setByOffset(
+        targetComponent.xYConstructionPlane,
+        adsk.core.ValueInput.createByReal(inputs[0].origin.z)
+    )
+    cutoutConstructionPlane = targetComponent.constructionPlanes.add(cutoutPlaneInput)
+    innerCutoutSketch: adsk.fusion.Sketch = targetComponent.sketches.add(cutoutConstructionPlane)
+    innerCutoutSketch.name = "inner cutouts sketch"
+    for input in inputs:
+        sketchUtils.createRoundedRectangle(
+            input.width,
+            input.length,
+            adsk.core.Point3D.create(input.origin.x, input.origin.y, 0),
+            input.filletRadius,
+            innerCutoutSketch,
+        )
+
+    innerCutouts = extrudeUtils.simpleDistanceExtrude(
+        commonUtils.objectCollectionFromList(innerCutoutSketch.profiles),
+        adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
+        inputs[0].height,
+        adsk.fusion.ExtentDirections.NegativeExtentDirection,
+        [],
+        targetComponent,
+    )
+    innerCutoutBodies = getCutoutBodies(list(innerCutouts.bodies), inputs)
+
+    bottomZ = inputs[0].origin.z - inputs[0].height
+
+    # cutouts with the same Y extent are one row, all rows share one side profile sketch on the YZ plane
+    # and are cut along X, so no offset plane is needed
+    rows: dict[tuple, list[int]] = {}
+    for index, input in enumerate(inputs):
+        if input.hasScoop or input.hasBottomFillet:
+            rowKey = (round(input.origin.y, 6), round(input.length, 6), input.hasScoop, input.hasBottomFillet)
+            rows.setdefault(rowKey, []).append(index)
+    if len(rows) > 0:
+        rowGroups = []
+        for rowIndexes in rows.values():
+            rowInput = inputs[rowIndexes[0]]
+            corners = []
+            if rowInput.hasScoop:
+                corners.append((adsk.core.Point3D.create(0, rowInput.origin.y, bottomZ), adsk.core.Vector3D.create(0, 1, 0), getScoopRadius(rowInput)))
+            if rowInput.hasBottomFillet:
+                corners.append((adsk.core.Point3D.create(0, rowInput.origin.y + rowInput.length, bottomZ), adsk.core.Vector3D.create(0, -1, 0), rowInput.filletRadius))
+            rowGroups.append((rowIndexes, corners))
+        rowProfileSketch: adsk.fusion.Sketch = targetComponent.sketches.add(targetComponent.yZConstructionPlane)
+        rowProfileSketch.name = "inner cutout side profiles"
+        cutCornerFilletProfiles(
+            rowGroups,
+            innerCutoutBodies,
+            [max(inputs[index].origin.x + inputs[index].width for index in rowIndexes) for rowIndexes in rows.values()],
+            rowProfileSketch,
+            targetComponent,
+        )
+
+    # like the tangent chain of the bottom fillet on the fillet path, the bottom fillet also rounds the bottom edges
+    # along the left and right walls, cutouts with the same X extent are one column cut along Y from the XZ plane
+    columns: dict[tuple, list[int]] = {}
+    for index, input in enumerate(inputs):
+        if input.hasBottomFillet:
+            columnKey = (round(input.origin.x, 6), round(input.width, 6), round(input.filletRadius, 6))
+            columns.setdefault(columnKey, []).append(index)
+    if len(columns) > 0:
+        columnGroups = []
+        for columnIndexes in columns.values():
+            columnInput = inputs[columnIndexes[0]]
+            columnGroups.append((columnIndexes, [
+                (adsk.core.Point3D.create(columnInput.origin.x, 0, bottomZ), adsk.core.Vector3D.create(1, 0, 0), columnInput.filletRadius),
+                (adsk.core.Point3D.create(columnInput.origin.x + columnInput.width, 0, bottomZ), adsk.core.Vector3D.create(-1, 0, 0), columnInput.filletRadius),
+            ]))
+        columnProfileSketch: adsk.fusion.Sketch = targetComponent.sketches.add(targetComponent.xZConstructionPlane)
+        columnProfileSketch.name = "inner cutout front profiles"
+        cutCornerFilletProfiles(
+            columnGroups,
+            innerCutoutBodies,
+            [max(inputs[index].origin.y + inputs[index].length for index in columnIndexes) for columnIndexes in columns.values()],
+            columnProfileSketch,
+            targetComponent,
+        )
+
+    return innerCutoutBodies
@@ -5,8 +5,8 @@ import copy
 
 from .const import BIN_COMPARTMENT_BOTTOM_THICKNESS, BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS, BIN_CONNECTION_RECESS_DEPTH, BIN_CORNER_FILLET_RADIUS, BIN_TAB_EDGE_FILLET_RADIUS
 from ...lib import fusion360utils as futil
-from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils, filletUtils, geometryUtils
-from .binBodyCutoutGenerator import createGridfinityBinBodyCutout
+from . import const, combineUtils, faceUtils, commonUtils, sketchUtils, extrudeUtils, baseGenerator, edgeUtils, filletUtils, geometryUtils, patternUtils
+from .binBodyCutoutGenerator import createGridfinityBinBodyCutout, createGridfinityBinBodyCutouts
 from .binBodyCutoutGeneratorInput import BinBodyCutoutGeneratorInput
 from .baseGeneratorInput import BaseGeneratorInput
 from .binBodyGeneratorInput import BinBodyGeneratorInput, BinBodyCompartmentDefinition
@@ -26,6 +26,16 @@ def uniformCompartments(countX, countY):
             compartments.append(BinBodyCompartmentDefinition(i, j, 1, 1))
     return compartments
 
+def isUniformGrid(compartments: list[BinBodyCompartmentDefinition], countX: int, countY: int):
+    # every cell of the grid covered by exactly one 1x1 compartment of the same depth
+    if len(compartments) != countX * countY or len(compartments) < 2:
+        return False
+    cells = set((compartment.positionX, compartment.positionY) for compartment in compartments)
+    return len(cells) == countX * countY \
+        and all(compartment.width == 1 and compartment.length == 1 for compartment in compartments) \
+        and all(0 <= compartment.positionX < countX and 0 <= compartment.positionY < countY for compartment in compartments) \
+        and len(set(compartment.depth for compartment in compartments)) == 1
+
 def createGridfinityBinBody(
     input: BinBodyGeneratorInput,
     targetComponent: adsk.fusion.Component,
@@ -50,12 +60,12 @@ def createGridfinityBinBody(
     bodiesToMerge: list[adsk.fusion.BRepBody] = []
     bodiesToSubtract: list[adsk.fusion.BRepBody] = []
 
-    # round corners
-    filletUtils.filletEdgesByLength(
+    # round corners, committed together with the lip bottom chamfer box fillet
+    bodyFillets = filletUtils.FilletEdgeSets()
+    bodyFillets.addEdgesByLength(
         binBodyExtrude.faces,
         BIN_CORNER_FILLET_RADIUS,
         binBodyTotalHeight,
-        targetComponent,
     )
 
     if input.hasLip:
@@ -70,6 +80,7 @@ def createGridfinityBinBody(
         lipInput.binLength = input.binLength
         lipInput.binWidth = input.binWidth
         lipInput.hasLipNotches = input.hasLipNotches
+        lipInput.isSweepBaseProfile = input.isSweepBaseProfile
         lipInput.xyTolerance = input.xyTolerance
         lipInput.origin = lipOriginPoint
         lipBody = createGridfinityBinBodyLip(lipInput, targetComponent)
@@ -87,27 +98,25 @@ def createGridfinityBinBody(
                     lipOriginPoint.z,
                 )
             )
-            filletUtils.filletEdgesByLength(
+            bodyFillets.addEdgesByLength(
                 lipBottomChamferExtrude.faces,
                 lipBottomChamferSize,
                 lipBottomChamferSize,
-                targetComponent,
             )
+            bodyFillets.commit(targetComponent)
             lipBottomChamferExtrudeTopFace = faceUtils.getTopFace(lipBottomChamferExtrude.bodies.item(0))
             scoopSideEdge = min([edge for edge in lipBottomChamferExtrudeTopFace.edges if geometryUtils.isCollinearToX(edge)], key=lambda x: x.boundingBox.minPoint.y)
 
             edgesToChamfer = list(scoopSideEdge.tangentiallyConnectedEdges)[3:] if input.hasScoop else scoopSideEdge.tangentiallyConnectedEdges
-            chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
-            bottomLipChamferInput = chamferFeatures.createInput2()
-            bottomLipChamferEdges = commonUtils.objectCollectionFromList(edgesToChamfer)
-            bottomLipChamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(
-                bottomLipChamferEdges,
-                adsk.core.ValueInput.createByReal(lipBottomChamferSize),
-                False)
-            chamferFeatures.add(bottomLipChamferInput)
+            bottomLipChamfer = filletUtils.ChamferEdgeSets()
+            bottomLipChamfer.add(list(edgesToChamfer), lipBottomChamferSize, False)
+            bottomLipChamfer.commit(targetComponent)
             combineUtils.cutBody(lipBody, commonUtils.objectCollectionFromList(lipBottomChamferExtrude.bodies), targetComponent)
 
         bodiesToMerge.append(lipBody)
+    if bodyFillets.edgeCount > 0:
+        # not yet committed together with the lip bottom chamfer box
+        bodyFillets.commit(targetComponent)
 
     if not input.isSolid:
         compartmentsMinX = input.wallThickness
@@ -121,7 +130,13 @@ def createGridfinityBinBody(
         compartmentWidthUnit = (totalCompartmentsWidth - (input.compartmentsByX - 1) * input.wallThickness) / input.compartmentsByX
         compartmentLengthUnit = (totalCompartmentsLength - (input.compartmentsByY - 1) * input.wallThickness) / input.compartmentsByY
 
-        for compartment in input.compartments:
+        # uniform grid only needs the first compartment, the rest are pattern copies of it
+        isUniform = isUniformGrid(input.compartments, input.compartmentsByX, input.compartmentsByY)
+        compartmentsToCreate = [min(input.compartments, key=lambda x: (x.positionX, x.positionY))] if isUniform else input.compartments
+
+        # compartments of the same depth are cut out of one sketch
+        compartmentsByDepth: dict[float, list[tuple[BinBodyCutoutGeneratorInput, BinBodyTabGeneratorInput]]] = {}
+        for compartment in compartmentsToCreate:
             compartmentX = compartmentsMinX + compartment.positionX * (compartmentWidthUnit + input.wallThickness)
             compartmentY = compartmentsMinY + compartment.positionY * (compartmentLengthUnit + input.wallThickness)
             compartmentOriginPoint = adsk.core.Point3D.create(
@@ -145,7 +160,7 @@ def createGridfinityBinBody(
             compartmentTabInput.overhangAngle = input.tabOverhangAngle
             compartmentTabInput.topClearance = const.BIN_TAB_TOP_CLEARANCE
 
-            [compartmentMerges, compartmentCuts] = createCompartment(
+            compartmentCutoutInput = createCompartmentCutoutInput(
                 input.wallThickness,
                 compartmentOriginPoint,
                 compartmentWidth,
@@ -153,13 +168,46 @@ def createGridfinityBinBody(
                 compartmentDepth,
                 input.hasScoop,
                 input.scoopMaxRadius,
-                input.hasTab,
-                compartmentTabInput,
-                targetComponent,
+                True,
+                input.isProfileCutout,
             )
+            compartmentsByDepth.setdefault(compartmentDepth, []).append((compartmentCutoutInput, compartmentTabInput))
+
+        for depthCompartments in compartmentsByDepth.values():
+            compartmentCuts = createGridfinityBinBodyCutouts([cutoutInput for [cutoutInput, _] in depthCompartments], targetComponent)
+            compartmentMerges = []
+            if input.hasTab:
+                compartmentMerges = createCompartmentTabs(
+                    [cutoutInput for [cutoutInput, _] in depthCompartments],
+                    [tabInput for [_, tabInput] in depthCompartments],
+                    compartmentCuts,
+                    targetComponent,
+                )
             bodiesToSubtract = bodiesToSubtract + compartmentCuts
             bodiesToMerge = bodiesToMerge + compartmentMerges
 
+        if isUniform:
+            patternDistances = (compartmentWidthUnit + input.wallThickness, compartmentLengthUnit + input.wallThickness)
+            patternQuantities = (input.compartmentsByX, input.compartmentsByY)
+            patternDirections = (targetComponent.xConstructionAxis, targetComponent.yConstructionAxis)
+            cutoutsPattern = patternUtils.recPattern(
+                commonUtils.objectCollectionFromList(compartmentCuts),
+                patternDirections,
+                patternDistances,
+                patternQuantities,
+                targetComponent,
+            )
+            bodiesToSubtract = bodiesToSubtract + list(cutoutsPattern.bodies)
+            if len(compartmentMerges) > 0:
+                tabsPattern = patternUtils.recPattern(
+                    commonUtils.objectCollectionFromList(compartmentMerges),
+                    patternDirections,
+                    patternDistances,
+                    patternQuantities,
+                    targetComponent,
+                )
+                bodiesToMerge = bodiesToMerge + list(tabsPattern.bodies)
+
         if len(input.compartments) > 1:
             compartmentsTopClearance = createCompartmentCutout(
                 input.wallThickness,
@@ -175,26 +223,27 @@ def createGridfinityBinBody(
                 0,
                 False,
                 targetComponent,
+                input.isProfileCutout,
             )
             bodiesToSubtract.append(compartmentsTopClearance)
 
     if len(bodiesToSubtract) > 0:
-        combineUtils.cutBody(
+        combineUtils.cutBodyReduced(
             binBody,
-            commonUtils.objectCollectionFromList(bodiesToSubtract),
+            bodiesToSubtract,
             targetComponent
         )
     if len(bodiesToMerge) > 0:
-        combineUtils.joinBodies(
+        combineUtils.joinBodiesReduced(
             binBody,
-            commonUtils.objectCollectionFromList(bodiesToMerge),
+            bodiesToMerge,
             targetComponent
         )
 
     return binBody
 
 
-def createCompartmentCutout(
+def createCompartmentCutoutInput(
         wallThickness: float,
         originPoint: adsk.core.Point3D,
         width: float,
@@ -203,8 +252,8 @@ def createCompartmentCutout(
         hasScoop: bool,
         scoopMaxRadius: float,
         hasBottomFillet: bool,
-        targetComponent: adsk.fusion.Component,
-    ) -> adsk.fusion.BRepBody:
+        isProfileCutout: bool = False,
+    ) -> BinBodyCutoutGeneratorInput:
 
     innerCutoutFilletRadius = max(const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS, const.BIN_CORNER_FILLET_RADIUS - wallThickness)
     innerCutoutInput = BinBodyCutoutGeneratorInput()
@@ -216,10 +265,10 @@ def createCompartmentCutout(
     innerCutoutInput.scoopMaxRadius = scoopMaxRadius
     innerCutoutInput.filletRadius = innerCutoutFilletRadius
     innerCutoutInput.hasBottomFillet = hasBottomFillet
+    innerCutoutInput.isProfileCutout = isProfileCutout
+    return innerCutoutInput
 
-    return createGridfinityBinBodyCutout(innerCutoutInput, targetComponent)
-
-def createCompartment(
+def createCompartmentCutout(
         wallThickness: float,
         originPoint: adsk.core.Point3D,
         width: float,
@@ -227,15 +276,12 @@ def createCompartment(
         depth: float,
         hasScoop: bool,
         scoopMaxRadius: float,
-        hasTab: bool,
-        tabInput: BinBodyTabGeneratorInput,
+        hasBottomFillet: bool,
         targetComponent: adsk.fusion.Component,
-    ) -> tuple[list[adsk.fusion.BRepBody], list[adsk.fusion.BRepBody]]:
-
-    bodiesToMerge: list[adsk.fusion.BRepBody] = []
-    bodiesToSubtract: list[adsk.fusion.BRepBody] = []
+        isProfileCutout: bool = False,
+    ) -> adsk.fusion.BRepBody:
 
-    innerCutoutBody = createCompartmentCutout(
+    innerCutoutInput = createCompartmentCutoutInput(
         wallThickness,
         originPoint,
         width,
@@ -243,21 +289,63 @@ def createCompartment(
         depth,
         hasScoop,
         scoopMaxRadius,
-        True,
-        targetComponent,
+        hasBottomFillet,
+        isProfileCutout,
     )
-    bodiesToSubtract.append(innerCutoutBody)
-        
-    # label tab
-    if hasTab:
-        tabBody = createGridfinityBinBodyTab(tabInput, targetComponent)
+    return createGridfinityBinBodyCutout(innerCutoutInput, targetComponent)
 
-        intersectTabInput = targetComponent.features.combineFeatures.createInput(
-            tabBody,
-            commonUtils.objectCollectionFromList([innerCutoutBody]),
-            )
-        intersectTabInput.operation = adsk.fusion.FeatureOperations.IntersectFeatureOperation
-        intersectTabInput.isKeepToolBodies = True
-        intersectTabFeature = targetComponent.features.combineFeatures.add(intersectTabInput)
-        bodiesToMerge = bodiesToMerge + [body for body in list(intersectTabFeature.bodies) if not body.revisionId == innerCutoutBody.revisionId]
-    return (bodiesToMerge, bodiesToSubtract)
\ No newline at end of file
+def createCompartmentTabs(
+        cutoutInputs: list[BinBodyCutoutGeneratorInput],
+        tabInputs: list[BinBodyTabGeneratorInput],
+        innerCutoutBodies: list[adsk.fusion.BRepBody],
+        targetComponent: adsk.fusion.Component,
+    ) -> list[adsk.fusion.BRepBody]:
+    # compartments in the same row whose tab spans the full compartment width share one long tab,
+    # it is intersected with all their cutouts in one combine, so the walls between them are dropped
+    rowTabs: dict[tuple, list[int]] = {}
+    for index, [cutoutInput, tabInput] in enumerate(zip(cutoutInputs, tabInputs)):
+        isTabCoveringCutout = tabInput.origin.x <= cutoutInput.origin.x + const.DEFAULT_FILTER_TOLERANCE \
+            and tabInput.origin.x + tabInput.length >= cutoutInput.origin.x + cutoutInput.width - const.DEFAULT_FILTER_TOLERANCE
+        rowKey = (round(tabInput.origin.y, 6), round(cutoutInput.height, 6)) if isTabCoveringCutout else (index,)
+        rowTabs.setdefault(rowKey, []).append(index)
+
+    # rounded edges of all tabs share one fillet feature
+    tabFillets = filletUtils.FilletEdgeSets()
+    rowTabBodies: list[tuple[adsk.fusion.BRepBody, list[adsk.fusion.BRepBody]]] = []
+    for rowIndexes in rowTabs.values():
+        firstTabInput = tabInputs[rowIndexes[0]]
+        rowTabInput = BinBodyTabGeneratorInput()
+        rowTabInput.origin = adsk.core.Point3D.create(
+            min(tabInputs[index].origin.x for index in rowIndexes),
+            firstTabInput.origin.y,
+            firstTabInput.origin.z,
+        )
+        rowTabInput.length = max(tabInputs[index].origin.x + tabInputs[index].length for index in rowIndexes) - rowTabInput.origin.x
+        rowTabInput.width = firstTabInput.width
+        rowTabInput.overhangAngle = firstTabInput.overhangAngle
+        rowTabInput.topClearance = firstTabInput.topClearance
+        rowTabBodies.append((
+            createGridfinityBinBodyTab(rowTabInput, targetComponent, tabFillets),
+            [innerCutoutBodies[index] for index in rowIndexes],
+        ))
+    tabFillets.commit(targetComponent)
+
+    compartmentMerges: list[adsk.fusion.BRepBody] = []
+    for tabBody, rowCutoutBodies in rowTabBodies:
+        compartmentMerges = compartmentMerges + intersectCompartmentTab(tabBody, rowCutoutBodies, targetComponent)
+    return compartmentMerges
+
+def intersectCompartmentTab(
+        tabBody: adsk.fusion.BRepBody,
+        innerCutoutBodies: list[adsk.fusion.BRepBody],
+        targetComponent: adsk.fusion.Component,
+    ) -> list[adsk.fusion.BRepBody]:
+    intersectTabInput = targetComponent.features.combineFeatures.createInput(
+        tabBody,
+        commonUtils.objectCollectionFromList(innerCutoutBodies),
+        )
+    intersectTabInput.operation = adsk.fusion.FeatureOperations.IntersectFeatureOperation
+    intersectTabInput.isKeepToolBodies = True
+    intersectTabFeature = targetComponent.features.combineFeatures.add(intersectTabInput)
+    cutoutRevisionIds = [body.revisionId for body in innerCutoutBodies]
+    return [body for body in list(intersectTabFeature.bodies) if not body.revisionId in cutoutRevisionIds]
@@ -66,6 +66,8 @@ class BinBodyGeneratorInput():
         self.compartments = [BinBodyCompartmentDefinition()]
         self.compartmentsByX = 1
         self.compartmentsByY = 1
+        self.isProfileCutout = False
+        self.isSweepBaseProfile = False
 
     @property
     def baseWidth(self) -> float:
@@ -234,3 +236,19 @@ class BinBodyGeneratorInput():
     @compartments.setter
     def compartments(self, value: list[BinBodyCompartmentDefinition]):
         self._compartments = value
+
+    @property
+    def isProfileCutout(self) -> bool:
+        return self._isProfileCutout
+
+    @isProfileCutout.setter
+    def isProfileCutout(self, value: bool):
+        self._isProfileCutout = value
+
+    @property
+    def isSweepBaseProfile(self) -> bool:
+        return self._isSweepBaseProfile
+
+    @isSweepBaseProfile.setter
+    def isSweepBaseProfile(self, value: bool):
+        self._isSweepBaseProfile = value
@@ -40,12 +40,12 @@ def createGridfinityBinBodyLip(
 
     bodiesToSubtract: list[adsk.fusion.BRepBody] = []
 
-    # round corners
-    filletUtils.filletEdgesByLength(
+    # round corners, filleted together with the middle cutout corners
+    lipFillets = filletUtils.FilletEdgeSets()
+    lipFillets.addEdgesByLength(
         lipBodyExtrude.faces,
         BIN_CORNER_FILLET_RADIUS,
         lipBodyHeight,
-        targetComponent,
     )
 
     lipCutoutBodies: list[adsk.fusion.BRepBody] = []
@@ -62,23 +62,12 @@ def createGridfinityBinBodyLip(
         lipCutoutInput.baseLength = input.baseLength
         lipCutoutInput.xyClearance = input.xyTolerance
         lipCutoutInput.hasBottomChamfer = False
-        lipCutout = baseGenerator.createBaseWithClearance(lipCutoutInput, targetComponent)
+        lipCutoutInput.isSweepProfile = input.isSweepBaseProfile
+        # one body for all cells, the notches are left between the cell outlines
+        lipCutout = baseGenerator.createBaseWithClearance(lipCutoutInput, targetComponent, input.binWidth, input.binLength)
         lipCutout.name = "lip cutout"
         lipCutoutBodies.append(lipCutout)
 
-        patternInputBodies = adsk.core.ObjectCollection.create()
-        patternInputBodies.add(lipCutout)
-        patternInput = features.rectangularPatternFeatures.createInput(patternInputBodies,
-            targetComponent.xConstructionAxis,
-            adsk.core.ValueInput.createByReal(input.binWidth),
-            adsk.core.ValueInput.createByReal(input.baseWidth),
-            adsk.fusion.PatternDistanceType.SpacingPatternDistanceType)
-        patternInput.directionTwoEntity = targetComponent.yConstructionAxis
-        patternInput.quantityTwo = adsk.core.ValueInput.createByReal(input.binLength)
-        patternInput.distanceTwo = adsk.core.ValueInput.createByReal(input.baseLength)
-        rectangularPattern = features.rectangularPatternFeatures.add(patternInput)
-        lipCutoutBodies = lipCutoutBodies + list(rectangularPattern.bodies)
-
         lipMiddleCutoutOrigin = adsk.core.Point3D.create(
             input.origin.x + input.wallThickness,
             input.origin.y + input.wallThickness,
@@ -91,11 +80,10 @@ def createGridfinityBinBodyLip(
             targetComponent,
             lipMiddleCutoutOrigin,
         )
-        filletUtils.filletEdgesByLength(
+        lipFillets.addEdgesByLength(
             lipMidCutout.faces,
             const.BIN_CORNER_FILLET_RADIUS - input.wallThickness,
             lipBodyHeight,
-            targetComponent,
         )
         bodiesToSubtract.append(lipMidCutout.bodies.item(0))
 
@@ -106,10 +94,13 @@ def createGridfinityBinBodyLip(
         lipCutoutInput.baseLength = input.baseLength * input.binLength
         lipCutoutInput.xyClearance = input.xyTolerance
         lipCutoutInput.hasBottomChamfer = False
+        lipCutoutInput.isSweepProfile = input.isSweepBaseProfile
         lipCutout = baseGenerator.createBaseWithClearance(lipCutoutInput, targetComponent)
         lipCutout.name = "lip cutout"
         lipCutoutBodies.append(lipCutout)
 
+    lipFillets.commit(targetComponent)
+
     if const.BIN_LIP_TOP_RECESS_HEIGHT > const.DEFAULT_FILTER_TOLERANCE:
         lipCutoutConstructionPlane = targetComponent.constructionPlanes.add(lipCutoutPlaneInput)
         lipCutoutConstructionPlane.name = "top lip edge plane"
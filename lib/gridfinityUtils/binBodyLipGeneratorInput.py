@@ -7,6 +7,7 @@ class BinBodyLipGeneratorInput():
         self.wallThickness = const.BIN_LIP_WALL_THICKNESS
         self.hasLip = False
         self.hasLipNotches = False
+        self.isSweepBaseProfile = False
 
     @property
     def baseWidth(self) -> float:
@@ -70,4 +71,12 @@ class BinBodyLipGeneratorInput():
 
     @origin.setter
     def origin(self, value: adsk.core.Point3D):
-        self._originUnit = value
\ No newline at end of file
+        self._originUnit = value
+
+    @property
+    def isSweepBaseProfile(self) -> bool:
+        return self._isSweepBaseProfile
+
+    @isSweepBaseProfile.setter
+    def isSweepBaseProfile(self, value: bool):
+        self._isSweepBaseProfile = value
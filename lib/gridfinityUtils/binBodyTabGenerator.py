@@ -27,7 +27,9 @@ def getInnerCutoutScoopFace(
 def createGridfinityBinBodyTab(
     input: BinBodyTabGeneratorInput,
     targetComponent: adsk.fusion.Component,
+    tabFillets: filletUtils.FilletEdgeSets = None,
 ):
+    # with tabFillets the rounded edge is only collected, the caller commits the fillet for all tabs at once
 
     tabProfilePlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
     tabProfilePlaneInput.setByOffset(
@@ -108,6 +110,9 @@ def createGridfinityBinBodyTab(
 
     tabTopFace = faceUtils.getTopFace(tabBody)
     roundedEdge = min([edge for edge in tabTopFace.edges if geometryUtils.isCollinearToX(edge)], key=lambda x: x.boundingBox.minPoint.y)
+    if tabFillets is not None:
+        tabFillets.add([roundedEdge], BIN_TAB_EDGE_FILLET_RADIUS, False)
+        return tabBody
     fillet = filletUtils.createFillet(
         [roundedEdge],
         BIN_TAB_EDGE_FILLET_RADIUS,
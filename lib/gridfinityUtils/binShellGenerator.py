@@ -0,0 +1,139 @@
+import adsk.core, adsk.fusion, traceback
+import os
+import math
+
+from . import const, combineUtils, faceUtils, commonUtils, extrudeUtils, baseGenerator, geometryUtils, sketchUtils, shellUtils
+from .baseGeneratorInput import BaseGeneratorInput
+from .binBodyGeneratorInput import BinBodyGeneratorInput
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+def getShellCutoutBaseSections(wallThickness: float):
+    # inward offset of the stepped base profile by wallThickness, measured from wallThickness above the base top,
+    # 45 degree sections move by wallThickness * sqrt(2) horizontally, vertical ones by wallThickness
+    chamferOffset = wallThickness * (2 - math.sqrt(2))
+    topSectionHeight = const.BIN_BASE_TOP_SECTION_HEIGH + chamferOffset
+    bottomSectionHeight = max(0, const.BIN_BASE_BOTTOM_SECTION_HEIGH - chamferOffset)
+    midSectionHeight = const.BIN_BASE_HEIGHT - topSectionHeight - bottomSectionHeight
+    if midSectionHeight < const.DEFAULT_FILTER_TOLERANCE:
+        return None
+    return (topSectionHeight, midSectionHeight, bottomSectionHeight)
+
+def isShellCutoutSupported(wallThickness: float):
+    return wallThickness < const.BIN_CORNER_FILLET_RADIUS and not getShellCutoutBaseSections(wallThickness) is None
+
+def createGridfinityBinShellCutout(
+    input: BinBodyGeneratorInput,
+    hasBase: bool,
+    targetComponent: adsk.fusion.Component,
+    ) -> list[adsk.fusion.BRepBody]:
+    # the volume a shell feature would remove, built directly: the body interior and, with a base, the interior of every base cell
+    binBodyTotalHeight = (input.binHeight - 1) * input.heightUnit + max(0, input.heightUnit - const.BIN_BASE_HEIGHT)
+    actualBodyWidth = (input.baseWidth * input.binWidth) - input.xyTolerance * 2.0
+    actualBodyLength = (input.baseLength * input.binLength) - input.xyTolerance * 2.0
+    cutoutBodies: list[adsk.fusion.BRepBody] = []
+
+    # corners are rounded in the sketch, so the interior needs no fillet feature
+    bodyCutoutPlaneInput: adsk.fusion.ConstructionPlaneInput = targetComponent.constructionPlanes.createInput()
+    bodyCutoutPlaneInput.setByOffset(
+        targetComponent.xYConstructionPlane,
+        adsk.core.ValueInput.createByReal(input.wallThickness)
+    )
+    bodyCutoutPlane = targetComponent.constructionPlanes.add(bodyCutoutPlaneInput)
+    bodyCutoutSketch: adsk.fusion.Sketch = targetComponent.sketches.add(bodyCutoutPlane)
+    bodyCutoutSketch.name = "shell cutout sketch"
+    sketchUtils.createRoundedRectangle(
+        actualBodyWidth - input.wallThickness * 2,
+        actualBodyLength - input.wallThickness * 2,
+        bodyCutoutSketch.modelToSketchSpace(adsk.core.Point3D.create(input.wallThickness, input.wallThickness, input.wallThickness)),
+        const.BIN_CORNER_FILLET_RADIUS - input.wallThickness,
+        bodyCutoutSketch,
+    )
+    bodyCutout = extrudeUtils.simpleDistanceExtrude(
+        bodyCutoutSketch.profiles.item(0),
+        adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
+        binBodyTotalHeight - input.wallThickness,
+        adsk.fusion.ExtentDirections.PositiveExtentDirection,
+        [],
+        targetComponent,
+    )
+    bodyCutoutBody = bodyCutout.bodies.item(0)
+    bodyCutoutBody.name = "shell cutout"
+    cutoutBodies.append(bodyCutoutBody)
+
+    if hasBase:
+        [topSectionHeight, midSectionHeight, bottomSectionHeight] = getShellCutoutBaseSections(input.wallThickness)
+        topInset = input.wallThickness * (math.sqrt(2) - 1)
+        baseCutoutInput = BaseGeneratorInput()
+        baseCutoutInput.originPoint = adsk.core.Point3D.create(topInset, topInset, input.wallThickness)
+        baseCutoutInput.baseWidth = input.baseWidth - topInset * 2
+        baseCutoutInput.baseLength = input.baseLength - topInset * 2
+        baseCutoutInput.xyClearance = input.xyTolerance
+        baseCutoutInput.topSectionHeight = topSectionHeight
+        baseCutoutInput.midSectionHeight = midSectionHeight
+        baseCutoutInput.bottomSectionHeight = bottomSectionHeight
+        baseCutoutInput.hasBottomChamfer = bottomSectionHeight > const.DEFAULT_FILTER_TOLERANCE
+        baseCutoutInput.cornerFilletRadius = const.BIN_CORNER_FILLET_RADIUS - topInset
+        baseCutoutInput.isSweepProfile = input.isSweepBaseProfile
+        if input.binWidth > 1 or input.binLength > 1 or not input.isSweepBaseProfile:
+            # all cells from one sketch, each section extruded once and joined straight into the interior,
+            # still spaced by the full base size, so the cut takes a single tool body
+            baseGenerator.createGridfinityBaseGrid(
+                baseCutoutInput,
+                input.binWidth,
+                input.binLength,
+                targetComponent,
+                bodyCutoutBody,
+                (input.baseWidth, input.baseLength),
+            )
+        else:
+            baseCutoutBody = baseGenerator.createGridfinityBase(baseCutoutInput, targetComponent)
+            baseCutoutBody.name = "shell base cutout"
+            cutoutBodies.append(baseCutoutBody)
+
+    return cutoutBodies
+
+def shellGridfinityBin(
+    binBody: adsk.fusion.BRepBody,
+    input: BinBodyGeneratorInput,
+    hasBase: bool,
+    isShellCutout: bool,
+    targetComponent: adsk.fusion.Component,
+    ) -> adsk.fusion.BRepBody:
+    # isShellCutout subtracts a directly built interior in one combine instead of running a shell feature
+    if isShellCutout and isShellCutoutSupported(input.wallThickness):
+        combineUtils.cutBody(
+            binBody,
+            commonUtils.objectCollectionFromList(createGridfinityBinShellCutout(input, hasBase, targetComponent)),
+            targetComponent,
+        )
+        return binBody
+
+    features: adsk.fusion.Features = targetComponent.features
+    combineFeatures: adsk.fusion.CombineFeatures = features.combineFeatures
+    # face.boundingBox.maxPoint.z ~ face.boundingBox.minPoint.z => face horizontal
+    # largest horizontal face
+    horizontalFaces = [face for face in binBody.faces if geometryUtils.isHorizontal(face)]
+    topFace = faceUtils.maxByArea(horizontalFaces)
+    if input.hasLip:
+        splitBodyFeatures = features.splitBodyFeatures
+        splitBodyInput = splitBodyFeatures.createInput(
+            binBody,
+            topFace,
+            True
+        )
+        splitBodies = splitBodyFeatures.add(splitBodyInput)
+        bottomBody = min(splitBodies.bodies, key=lambda x: x.boundingBox.minPoint.z)
+        topBody = max(splitBodies.bodies, key=lambda x: x.boundingBox.minPoint.z)
+        horizontalFaces = [face for face in bottomBody.faces if geometryUtils.isHorizontal(face)]
+        topFace = faceUtils.maxByArea(horizontalFaces)
+        shellUtils.simpleShell([topFace], input.wallThickness, targetComponent)
+        toolBodies = adsk.core.ObjectCollection.create()
+        toolBodies.add(topBody)
+        combineAfterShellFeatureInput = combineFeatures.createInput(bottomBody, toolBodies)
+        combineFeatures.add(combineAfterShellFeatureInput)
+        binBody = targetComponent.bRepBodies.item(0)
+    else:
+        shellUtils.simpleShell([topFace], input.wallThickness, targetComponent)
+    return binBody
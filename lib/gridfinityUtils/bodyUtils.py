@@ -0,0 +1,29 @@
+import adsk.core, adsk.fusion, traceback
+import os
+
+from . import commonUtils
+
+def moveBodies(
+    bodies: list[adsk.fusion.BRepBody],
+    translation: adsk.core.Vector3D,
+    targetComponent: adsk.fusion.Component,
+    ):
+    moveFeatures: adsk.fusion.MoveFeatures = targetComponent.features.moveFeatures
+    moveInput = moveFeatures.createInput2(commonUtils.objectCollectionFromList(bodies))
+    moveInput.defineAsTranslateXYZ(
+        adsk.core.ValueInput.createByReal(translation.x),
+        adsk.core.ValueInput.createByReal(translation.y),
+        adsk.core.ValueInput.createByReal(translation.z),
+        True,
+    )
+    return moveFeatures.add(moveInput)
+
+def copyBody(
+    body: adsk.fusion.BRepBody,
+    translation: adsk.core.Vector3D,
+    targetComponent: adsk.fusion.Component,
+    ) -> adsk.fusion.BRepBody:
+    copyPasteFeature = targetComponent.features.copyPasteBodies.add(body)
+    bodyCopy = copyPasteFeature.bodies.item(0)
+    bodyCopy.name = body.name
+    return moveBodies([bodyCopy], translation, targetComponent).bodies.item(0)
@@ -1,10 +1,17 @@
 import math
+import time
 import adsk.core, adsk.fusion, traceback
 import os
 
 from .const import DEFAULT_FILTER_TOLERANCE
 
 from .geometryUtils import boundingBoxVolume
+from . import commonUtils
+
+# tool sets smaller than this go into one combine, larger ones are first unioned in batches
+REDUCTION_MIN_TOOL_COUNT = 32
+REDUCTION_INITIAL_BATCH_SIZE = 8
+REDUCTION_MAX_BATCH_SIZE = 64
 
 def cutBody(
     targetBody: adsk.fusion.BRepBodies,
@@ -35,3 +42,92 @@ def joinBodies(
     combineInput.operation = adsk.fusion.FeatureOperations.JoinFeatureOperation
     combineFeature = targetComponent.features.combineFeatures.add(combineInput)
     return combineFeature
+
+class AdaptiveBatchSize:
+    # halves the batch when the time per tool body of a combine grows, doubles it when the time per tool body drops
+    def __init__(self, size: int = REDUCTION_INITIAL_BATCH_SIZE, minSize: int = 2, maxSize: int = REDUCTION_MAX_BATCH_SIZE):
+        self.size = size
+        self.minSize = minSize
+        self.maxSize = maxSize
+        self.lastTimePerTool: float = None
+        self.history: list[tuple[int, float]] = []
+
+    def record(self, toolCount: int, seconds: float):
+        self.history.append((toolCount, seconds))
+        timePerTool = seconds / max(1, toolCount)
+        if self.lastTimePerTool is not None and self.lastTimePerTool > 0:
+            if timePerTool > self.lastTimePerTool * 1.5:
+                self.size = max(self.minSize, self.size // 2)
+            elif timePerTool < self.lastTimePerTool * 0.75:
+                self.size = min(self.maxSize, self.size * 2)
+        self.lastTimePerTool = timePerTool
+
+def mortonKey(x: int, y: int):
+    key = 0
+    for bit in range(16):
+        key |= ((x >> bit) & 1) << (2 * bit) | ((y >> bit) & 1) << (2 * bit + 1)
+    return key
+
+def sortBodiesSpatially(bodies: list[adsk.fusion.BRepBody]):
+    # z-order of bounding box centers in XY, so every batch unions bodies that are close to each other
+    if len(bodies) < 3:
+        return list(bodies)
+    centers = []
+    for body in bodies:
+        boundingBox = body.boundingBox
+        centers.append(((boundingBox.minPoint.x + boundingBox.maxPoint.x) / 2, (boundingBox.minPoint.y + boundingBox.maxPoint.y) / 2))
+    minX = min(center[0] for center in centers)
+    minY = min(center[1] for center in centers)
+    extent = max(max(center[0] for center in centers) - minX, max(center[1] for center in centers) - minY, DEFAULT_FILTER_TOLERANCE)
+    keys = [mortonKey(int((x - minX) / extent * 65535), int((y - minY) / extent * 65535)) for [x, y] in centers]
+    return [body for [_, _, body] in sorted(zip(keys, range(len(bodies)), bodies), key=lambda x: (x[0], x[1]))]
+
+def reduceToolBodies(
+    toolBodies: list[adsk.fusion.BRepBody],
+    batchSize: AdaptiveBatchSize,
+    targetComponent: adsk.fusion.Component,
+    ) -> list[adsk.fusion.BRepBody]:
+    # unions tool bodies in spatially grouped batches until no more than one batch is left
+    tools = sortBodiesSpatially(toolBodies)
+    while len(tools) > batchSize.size:
+        reducedTools: list[adsk.fusion.BRepBody] = []
+        index = 0
+        while index < len(tools):
+            batch = tools[index:index + batchSize.size]
+            index = index + len(batch)
+            if len(batch) > 1:
+                startTime = time.perf_counter()
+                joinBodies(batch[0], commonUtils.objectCollectionFromList(batch[1:]), targetComponent)
+                batchSize.record(len(batch) - 1, time.perf_counter() - startTime)
+            reducedTools.append(batch[0])
+        tools = reducedTools
+    return tools
+
+def combineReduced(
+    targetBody: adsk.fusion.BRepBody,
+    toolBodies: list[adsk.fusion.BRepBody],
+    operation: adsk.fusion.FeatureOperations,
+    targetComponent: adsk.fusion.Component,
+    batchSize: AdaptiveBatchSize = None,
+    ):
+    if len(toolBodies) >= REDUCTION_MIN_TOOL_COUNT:
+        toolBodies = reduceToolBodies(toolBodies, batchSize if batchSize is not None else AdaptiveBatchSize(), targetComponent)
+    combineInput = targetComponent.features.combineFeatures.createInput(targetBody, commonUtils.objectCollectionFromList(toolBodies))
+    combineInput.operation = operation
+    return targetComponent.features.combineFeatures.add(combineInput)
+
+def cutBodyReduced(
+    targetBody: adsk.fusion.BRepBody,
+    toolBodies: list[adsk.fusion.BRepBody],
+    targetComponent: adsk.fusion.Component,
+    batchSize: AdaptiveBatchSize = None,
+    ):
+    return combineReduced(targetBody, toolBodies, adsk.fusion.FeatureOperations.CutFeatureOperation, targetComponent, batchSize)
+
+def joinBodiesReduced(
+    targetBody: adsk.fusion.BRepBody,
+    toolBodies: list[adsk.fusion.BRepBody],
+    targetComponent: adsk.fusion.Component,
+    batchSize: AdaptiveBatchSize = None,
+    ):
+    return combineReduced(targetBody, toolBodies, adsk.fusion.FeatureOperations.JoinFeatureOperation, targetComponent, batchSize)
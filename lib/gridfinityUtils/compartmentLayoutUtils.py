@@ -0,0 +1,88 @@
+from .binBodyGeneratorInput import BinBodyCompartmentDefinition
+
+LAYOUT_ISSUE_OUT_OF_BOUNDS = 'out of bounds'
+LAYOUT_ISSUE_EMPTY = 'empty'
+LAYOUT_ISSUE_OVERLAP = 'overlap'
+LAYOUT_ISSUE_GAP = 'gap'
+
+class CompartmentLayoutIssue():
+    def __init__(self, kind: str, message: str, compartmentIndex: int = None, isError: bool = True):
+        self.kind = kind
+        self.message = message
+        # index in the compartments list, None for issues of the whole layout
+        self.compartmentIndex = compartmentIndex
+        self.isError = isError
+
+    def __repr__(self):
+        return f'CompartmentLayoutIssue({self.kind!r}, {self.message!r}, {self.compartmentIndex!r})'
+
+def rowMask(positionX: int, width: int):
+    return ((1 << width) - 1) << positionX
+
+def maskCells(mask: int):
+    cells = []
+    x = 0
+    while mask:
+        if mask & 1:
+            cells.append(x)
+        mask >>= 1
+        x += 1
+    return cells
+
+def formatCells(cells: list[tuple[int, int]], limit: int = 6):
+    formatted = ', '.join(f'({x}, {y})' for [x, y] in cells[:limit])
+    return formatted + (f' and {len(cells) - limit} more' if len(cells) > limit else '')
+
+def validateCompartmentLayout(
+    compartments: list[BinBodyCompartmentDefinition],
+    countX: int,
+    countY: int,
+    ) -> list[CompartmentLayoutIssue]:
+    # every grid row is an int bitmask of occupied cells, a compartment covers the same mask in each of its rows,
+    # so overlaps and gaps are a handful of bitwise operations per row instead of a per cell comparison of every pair
+    issues: list[CompartmentLayoutIssue] = []
+    fullRowMask = rowMask(0, countX)
+    occupancy = [0] * countY
+    owners: list[list[tuple[int, int]]] = [[] for _ in range(countY)]
+
+    for index, compartment in enumerate(compartments):
+        if compartment.width < 1 or compartment.length < 1:
+            issues.append(CompartmentLayoutIssue(LAYOUT_ISSUE_EMPTY, f'Compartment {index + 1}: width and length must be at least 1', index))
+            continue
+        if compartment.positionX < 0 or compartment.positionY < 0 \
+            or compartment.positionX + compartment.width > countX \
+            or compartment.positionY + compartment.length > countY:
+            issues.append(CompartmentLayoutIssue(
+                LAYOUT_ISSUE_OUT_OF_BOUNDS,
+                f'Compartment {index + 1}: cells x {compartment.positionX}..{compartment.positionX + compartment.width - 1}, y {compartment.positionY}..{compartment.positionY + compartment.length - 1} are outside of the {countX}x{countY} grid',
+                index,
+            ))
+            continue
+
+        mask = rowMask(compartment.positionX, compartment.width)
+        overlappingCells: list[tuple[int, int]] = []
+        overlappingCompartments: set[int] = set()
+        for y in range(compartment.positionY, compartment.positionY + compartment.length):
+            overlap = occupancy[y] & mask
+            if overlap:
+                overlappingCells = overlappingCells + [(x, y) for x in maskCells(overlap)]
+                overlappingCompartments.update(owner for [owner, ownerMask] in owners[y] if ownerMask & overlap)
+            occupancy[y] |= mask
+            owners[y].append((index, mask))
+        if len(overlappingCells) > 0:
+            # overlapping compartments merge into one, the documented way to build L and T shaped compartments
+            issues.append(CompartmentLayoutIssue(
+                LAYOUT_ISSUE_OVERLAP,
+                f'Compartment {index + 1} overlaps compartment {", ".join(str(owner + 1) for owner in sorted(overlappingCompartments))} at cells {formatCells(overlappingCells)}, they will be merged',
+                index,
+                False,
+            ))
+
+    emptyCells = [(x, y) for y in range(countY) for x in maskCells(~occupancy[y] & fullRowMask)]
+    if len(emptyCells) > 0 and len(compartments) > 0:
+        # uncovered cells are left solid, allowed but rarely intended
+        issues.append(CompartmentLayoutIssue(LAYOUT_ISSUE_GAP, f'Cells {formatCells(emptyCells)} are not covered by any compartment and will stay solid', None, False))
+    return issues
+
+def isCompartmentLayoutValid(issues: list[CompartmentLayoutIssue]):
+    return not any(issue.isError for issue in issues)
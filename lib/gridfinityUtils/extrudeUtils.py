@@ -10,6 +10,7 @@ def simpleDistanceExtrude(
     direction: adsk.fusion.ExtentDirections,
     participantBodies: list[adsk.fusion.BRepBody],
     targetComponent: adsk.fusion.Component,
+    taperAngle: float = 0,
     ):
     features: adsk.fusion.Features = targetComponent.features
     extrudeFeatures: adsk.fusion.ExtrudeFeatures = features.extrudeFeatures
@@ -19,7 +20,7 @@ def simpleDistanceExtrude(
     extrudeInput.setOneSideExtent(
         extrudeExtent,
         direction,
-        adsk.core.ValueInput.createByReal(0),
+        adsk.core.ValueInput.createByReal(taperAngle),
     )
     extrudeFeature = extrudeFeatures.add(extrudeInput)
     return extrudeFeature
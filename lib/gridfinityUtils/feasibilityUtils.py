@@ -0,0 +1,150 @@
+import math
+
+from . import const, compartmentLayoutUtils
+from .baseGeneratorInput import BaseGeneratorInput
+from .baseplateGeneratorInput import BaseplateGeneratorInput
+from .binBodyGeneratorInput import BinBodyGeneratorInput
+
+FEASIBILITY_ISSUE_REJECTED = 'rejected'
+FEASIBILITY_ISSUE_CLAMPED = 'clamped'
+
+# fillets and chamfers are kept at least this far from consuming the whole face they are placed on
+FEASIBILITY_MARGIN = 0.01
+
+class FeasibilityIssue():
+    def __init__(self, kind: str, message: str, isError: bool = True):
+        self.kind = kind
+        self.message = message
+        self.isError = isError
+
+    def __repr__(self):
+        return f'FeasibilityIssue({self.kind!r}, {self.message!r})'
+
+def rejected(message: str):
+    return FeasibilityIssue(FEASIBILITY_ISSUE_REJECTED, message)
+
+def clamped(message: str):
+    return FeasibilityIssue(FEASIBILITY_ISSUE_CLAMPED, message, False)
+
+def formatLength(value: float):
+    # internal units are cm, the dialogs show mm
+    return f'{value * 10:.2f}mm'
+
+def isFeasible(issues: list[FeasibilityIssue]):
+    return not any(issue.isError for issue in issues)
+
+def formatIssues(issues: list[FeasibilityIssue]):
+    return '\n'.join(issue.message for issue in issues)
+
+def getBinBodyTotalHeight(input: BinBodyGeneratorInput):
+    return (input.binHeight - 1) * input.heightUnit + max(0, input.heightUnit - const.BIN_BASE_HEIGHT)
+
+def getCompartmentCutoutFilletRadius(input: BinBodyGeneratorInput):
+    return max(const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS, const.BIN_CORNER_FILLET_RADIUS - input.wallThickness)
+
+def getCompartmentSizes(input: BinBodyGeneratorInput) -> list[tuple[float, float, float]]:
+    # width, length and depth of every compartment cutout, same arithmetic as createGridfinityBinBody
+    actualBodyWidth = (input.baseWidth * input.binWidth) - input.xyTolerance * 2.0
+    actualBodyLength = (input.baseLength * input.binLength) - input.xyTolerance * 2.0
+    binBodyTotalHeight = getBinBodyTotalHeight(input)
+    compartmentsMinY = const.BIN_LIP_WALL_THICKNESS if input.hasLip and input.hasScoop else input.wallThickness
+    totalCompartmentsWidth = actualBodyWidth - input.wallThickness * 2
+    totalCompartmentsLength = actualBodyLength - input.wallThickness - compartmentsMinY
+    compartmentWidthUnit = (totalCompartmentsWidth - (input.compartmentsByX - 1) * input.wallThickness) / input.compartmentsByX
+    compartmentLengthUnit = (totalCompartmentsLength - (input.compartmentsByY - 1) * input.wallThickness) / input.compartmentsByY
+    return [(
+        compartmentWidthUnit * compartment.width + (compartment.width - 1) * input.wallThickness,
+        compartmentLengthUnit * compartment.length + (compartment.length - 1) * input.wallThickness,
+        min(binBodyTotalHeight - const.BIN_COMPARTMENT_BOTTOM_THICKNESS, compartment.depth),
+    ) for compartment in input.compartments]
+
+def checkBinBodyFeasibility(input: BinBodyGeneratorInput) -> list[FeasibilityIssue]:
+    # predicts fillets and tabs that can not fit before any feature is created,
+    # scoop radius and tab width are clamped in place, everything else is rejected
+    issues: list[FeasibilityIssue] = []
+    if input.isSolid:
+        return issues
+
+    if input.compartmentsByX < 1 or input.compartmentsByY < 1:
+        issues.append(rejected('Compartments grid must have at least one compartment in each direction'))
+        return issues
+    # only empty and out of grid compartments are errors, overlapping ones are merged into one cutout
+    layoutIssues = compartmentLayoutUtils.validateCompartmentLayout(input.compartments, input.compartmentsByX, input.compartmentsByY)
+    issues = issues + [rejected(issue.message) for issue in layoutIssues if issue.isError]
+    if not isFeasible(issues):
+        return issues
+
+    filletRadius = getCompartmentCutoutFilletRadius(input)
+    compartmentSizes = getCompartmentSizes(input)
+    for index, [width, length, depth] in enumerate(compartmentSizes):
+        if min(width, length) <= filletRadius * 2 + FEASIBILITY_MARGIN:
+            issues.append(rejected(f'Compartment {index + 1} is {formatLength(width)} x {formatLength(length)}, too small for the {formatLength(filletRadius)} bottom fillet, reduce the wall thickness or the number of compartments'))
+        elif depth <= filletRadius + FEASIBILITY_MARGIN:
+            issues.append(rejected(f'Compartment {index + 1} is {formatLength(max(0, depth))} deep, too shallow for the {formatLength(filletRadius)} bottom fillet, increase the bin height'))
+    if not isFeasible(issues):
+        return issues
+
+    if input.hasScoop:
+        # the scoop must stay below the top edge and leave room for the bottom fillet on the opposite wall
+        maxScoopRadius = min(min(depth, length - filletRadius) for [_, length, depth] in compartmentSizes) - FEASIBILITY_MARGIN
+        if input.scoopMaxRadius > maxScoopRadius and maxScoopRadius >= filletRadius:
+            issues.append(clamped(f'Scoop radius reduced from {formatLength(input.scoopMaxRadius)} to {formatLength(maxScoopRadius)} to fit the smallest compartment'))
+            input.scoopMaxRadius = maxScoopRadius
+
+    if input.hasTab:
+        if input.tabOverhangAngle <= 0 or input.tabOverhangAngle >= math.radians(90):
+            issues.append(rejected('Tab overhang angle must be between 0 and 90 degrees'))
+            return issues
+        # same offsets as createGridfinityBinBodyTab, the tab must fit the compartment both horizontally and vertically
+        tabFilletOffset = const.BIN_TAB_EDGE_FILLET_RADIUS / math.tan((math.radians(90) - input.tabOverhangAngle) / 2)
+        maxActualTabWidth = min(
+            min(length, (depth - const.BIN_TAB_TOP_CLEARANCE) * math.tan(input.tabOverhangAngle)) for [_, length, depth] in compartmentSizes
+        ) - FEASIBILITY_MARGIN
+        maxTabWidth = maxActualTabWidth - tabFilletOffset
+        if input.tabWidth > maxTabWidth:
+            if maxTabWidth <= FEASIBILITY_MARGIN:
+                issues.append(rejected('Label tab does not fit the smallest compartment, increase the bin height or reduce the number of compartments'))
+            else:
+                issues.append(clamped(f'Tab width reduced from {formatLength(input.tabWidth)} to {formatLength(maxTabWidth)} to fit the smallest compartment'))
+                input.tabWidth = maxTabWidth
+    return issues
+
+def checkBaseFeasibility(input: BaseGeneratorInput) -> list[FeasibilityIssue]:
+    issues: list[FeasibilityIssue] = []
+    baseHeight = input.topSectionHeight + input.midSectionHeight + input.bottomSectionHeight
+    if min(input.baseWidth, input.baseLength) - input.xyClearance * 2 <= input.cornerFilletRadius * 2:
+        issues.append(rejected(f'Base unit must be larger than {formatLength(input.cornerFilletRadius * 2 + input.xyClearance * 2)}'))
+    # the top chamfer runs around the filleted corners, the bottom chamfer around what is left of them
+    if input.topSectionHeight >= input.cornerFilletRadius - FEASIBILITY_MARGIN:
+        issues.append(rejected(f'Base top section {formatLength(input.topSectionHeight)} does not fit the {formatLength(input.cornerFilletRadius)} corner fillet'))
+    elif input.hasBottomChamfer and input.bottomSectionHeight >= input.cornerFilletRadius - input.topSectionHeight - FEASIBILITY_MARGIN:
+        issues.append(rejected(f'Base bottom section {formatLength(input.bottomSectionHeight)} does not fit the {formatLength(input.cornerFilletRadius)} corner fillet'))
+
+    # holes start at the bottom face, which is inset by both chamfers
+    holeMaxRadius = const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance - input.topSectionHeight - (input.bottomSectionHeight if input.hasBottomChamfer else 0)
+    if input.hasMagnetCutouts:
+        if input.magnetCutoutsDepth >= baseHeight - FEASIBILITY_MARGIN:
+            issues.append(rejected(f'Magnet cutout depth {formatLength(input.magnetCutoutsDepth)} must be less than the {formatLength(baseHeight)} base height'))
+        if input.magnetCutoutsDiameter / 2 >= holeMaxRadius:
+            issues.append(rejected(f'Magnet cutout diameter must be less than {formatLength(holeMaxRadius * 2)}'))
+        if input.hasScrewHoles and input.screwHolesDiameter >= input.magnetCutoutsDiameter:
+            issues.append(rejected('Screw hole diameter must be less than the magnet cutout diameter'))
+    elif input.hasScrewHoles and input.screwHolesDiameter / 2 >= holeMaxRadius:
+        issues.append(rejected(f'Screw hole diameter must be less than {formatLength(holeMaxRadius * 2)}'))
+    return issues
+
+def checkBaseplateFeasibility(input: BaseplateGeneratorInput) -> list[FeasibilityIssue]:
+    issues: list[FeasibilityIssue] = []
+    if not input.hasExtendedBottom:
+        return issues
+    if input.hasMagnetCutouts and input.magnetCutoutsDepth >= input.bottomExtensionHeight - FEASIBILITY_MARGIN:
+        issues.append(rejected(f'Magnet socket depth {formatLength(input.magnetCutoutsDepth)} must be less than the {formatLength(input.bottomExtensionHeight)} bottom thickness'))
+    if input.hasScrewHoles:
+        screwHeadHeight = const.DIMENSION_SCREW_HEAD_CUTOUT_OFFSET_HEIGHT + (input.screwHeadCutoutDiameter - input.screwHolesDiameter) / 2
+        if input.screwHeadCutoutDiameter <= input.screwHolesDiameter:
+            issues.append(rejected('Screw head cutout diameter must be larger than the screw hole diameter'))
+        elif screwHeadHeight >= input.bottomExtensionHeight - FEASIBILITY_MARGIN:
+            issues.append(rejected(f'Screw head cutout is {formatLength(screwHeadHeight)} deep and does not fit the {formatLength(input.bottomExtensionHeight)} bottom thickness'))
+    if input.hasSkeletonizedBottom and input.hasConnectionHoles and input.connectionScrewHolesDiameter >= input.bottomExtensionHeight - FEASIBILITY_MARGIN:
+        issues.append(rejected(f'Connection hole diameter must be less than the {formatLength(input.bottomExtensionHeight)} bottom thickness'))
+    return issues
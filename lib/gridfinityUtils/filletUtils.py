@@ -62,4 +62,83 @@ def createChamfer(
         edges,
         adsk.core.ValueInput.createByReal(distance),
         True)
-    return chamferFeatures.add(chamferInput)
\ No newline at end of file
+    return chamferFeatures.add(chamferInput)
+
+class FilletEdgeSets:
+    # edges collected from any number of bodies, committed as one fillet feature with one edge set per radius
+    def __init__(self):
+        self.edgeSets: dict[tuple[float, bool], tuple[float, list[adsk.fusion.BRepEdge]]] = {}
+
+    @property
+    def edgeCount(self) -> int:
+        return sum(len(edges) for [_, edges] in self.edgeSets.values())
+
+    def add(
+        self,
+        edges: list[adsk.fusion.BRepEdge],
+        radius: float,
+        isTangentChain: bool,
+    ):
+        [_, edgeSet] = self.edgeSets.setdefault((round(radius, 6), isTangentChain), (radius, []))
+        edgeSet.extend(edges)
+
+    def addEdgesByLength(
+        self,
+        faces: adsk.fusion.BRepFaces,
+        radius: float,
+        filterEdgeLength: float,
+    ):
+        self.add(
+            list(edgeUtils.selectEdgesByLength(faces, filterEdgeLength, const.DEFAULT_FILTER_TOLERANCE)),
+            radius,
+            True,
+        )
+
+    def commit(self, targetComponent: adsk.fusion.Component):
+        # nothing collected means no feature, collected edges are cleared so the collector can be reused
+        if self.edgeCount == 0:
+            return None
+        features: adsk.fusion.Features = targetComponent.features
+        filletFeatures: adsk.fusion.FilletFeatures = features.filletFeatures
+        filletInput = filletFeatures.createInput()
+        filletInput.isRollingBallCorner = True
+        filletInput.isTangentChain = True
+        for [isTangentChain, [radius, edges]] in [(key[1], value) for key, value in self.edgeSets.items() if len(value[1]) > 0]:
+            filletInput.edgeSetInputs.addConstantRadiusEdgeSet(
+                commonUtils.objectCollectionFromList(edges),
+                adsk.core.ValueInput.createByReal(radius),
+                isTangentChain)
+        self.edgeSets = {}
+        return filletFeatures.add(filletInput)
+
+class ChamferEdgeSets:
+    # same as FilletEdgeSets for equal distance chamfers
+    def __init__(self):
+        self.edgeSets: dict[tuple[float, bool], tuple[float, list[adsk.fusion.BRepEdge]]] = {}
+
+    @property
+    def edgeCount(self) -> int:
+        return sum(len(edges) for [_, edges] in self.edgeSets.values())
+
+    def add(
+        self,
+        edges: list[adsk.fusion.BRepEdge],
+        distance: float,
+        isTangentChain: bool,
+    ):
+        [_, edgeSet] = self.edgeSets.setdefault((round(distance, 6), isTangentChain), (distance, []))
+        edgeSet.extend(edges)
+
+    def commit(self, targetComponent: adsk.fusion.Component):
+        if self.edgeCount == 0:
+            return None
+        features: adsk.fusion.Features = targetComponent.features
+        chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
+        chamferInput = chamferFeatures.createInput2()
+        for [isTangentChain, [distance, edges]] in [(key[1], value) for key, value in self.edgeSets.items() if len(value[1]) > 0]:
+            chamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(
+                commonUtils.objectCollectionFromList(edges),
+                adsk.core.ValueInput.createByReal(distance),
+                isTangentChain)
+        self.edgeSets = {}
+        return chamferFeatures.add(chamferInput)
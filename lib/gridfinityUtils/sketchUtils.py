@@ -54,6 +54,45 @@ def createRectangle(
         adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
         rectangleLines.item(1).endSketchPoint.geometry)
 
+def createRoundedRectangle(
+    width: float,
+    length: float,
+    startPoint: adsk.core.Point3D,
+    radius: float,
+    sketch: adsk.fusion.Sketch,
+):
+    # corners are rounded by sketch fillets, extruding the profile gives rounded vertical edges without a fillet feature
+    constraints: adsk.fusion.GeometricConstraints = sketch.geometricConstraints
+    lines: adsk.fusion.SketchLines = sketch.sketchCurves.sketchLines
+    arcs: adsk.fusion.SketchArcs = sketch.sketchCurves.sketchArcs
+    rectangleLines = lines.addTwoPointRectangle(
+        startPoint,
+        adsk.core.Point3D.create(startPoint.x + width, startPoint.y + length, 0)
+    )
+    constraints.addHorizontal(rectangleLines.item(0))
+    constraints.addVertical(rectangleLines.item(1))
+    constraints.addHorizontal(rectangleLines.item(2))
+    constraints.addVertical(rectangleLines.item(3))
+    for i in range(4):
+        firstLine = rectangleLines.item(i)
+        secondLine = rectangleLines.item((i + 1) % 4)
+        arcs.addFillet(
+            firstLine,
+            firstLine.endSketchPoint.geometry,
+            secondLine,
+            secondLine.startSketchPoint.geometry,
+            radius,
+        )
+    return rectangleLines
+
+def getProfileAtPoint(
+    sketch: adsk.fusion.Sketch,
+    point: adsk.core.Point3D,
+) -> adsk.fusion.Profile:
+    # profile whose bounding box contains a model space point lying on the sketch plane
+    sketchPoint = sketch.modelToSketchSpace(point)
+    return next(profile for profile in sketch.profiles if profile.boundingBox.contains(sketchPoint))
+
 def filterCirclesByRadius(
     radius: float,
     tolerance: float,
@@ -0,0 +1,79 @@
+import adsk.core, adsk.fusion, traceback
+
+from ...lib import fusion360utils as futil
+
+app = adsk.core.Application.get()
+
+# (document, {template key: (temporary body, origin)}) per open design, documents are compared with ==
+designTemplates: list[tuple[adsk.core.Document, dict]] = []
+# templates of the design being generated, None when no session is active or caching is disabled
+activeTemplates: dict = None
+isDocumentEventRegistered = False
+
+def onDocumentClosing(args: adsk.core.DocumentEventArgs):
+    global designTemplates
+    designTemplates = [(document, templates) for document, templates in designTemplates if not document == args.document]
+
+def registerDocumentEvents():
+    # both commands share the store, the close handler is added once
+    global isDocumentEventRegistered
+    if not isDocumentEventRegistered:
+        futil.add_handler(app.documentClosing, onDocumentClosing, name='template cache document closing')
+        isDocumentEventRegistered = True
+
+def clear():
+    global designTemplates, activeTemplates, isDocumentEventRegistered
+    designTemplates = []
+    activeTemplates = None
+    isDocumentEventRegistered = False
+
+def getDesignTemplates(design: adsk.fusion.Design) -> dict:
+    document = design.parentDocument
+    for templateDocument, templates in designTemplates:
+        if templateDocument == document:
+            return templates
+    templates = {}
+    designTemplates.append((document, templates))
+    return templates
+
+def startSession(design: adsk.fusion.Design):
+    global activeTemplates
+    activeTemplates = getDesignTemplates(design)
+    return activeTemplates
+
+def stopSession():
+    global activeTemplates
+    activeTemplates = None
+
+def inputKey(input, excludedNames: list[str] = None):
+    # every generator input setting except the placement, floats are rounded so equal dialog values give equal keys
+    return tuple(sorted(
+        (name, round(value, 6) if isinstance(value, float) else value)
+        for name, value in vars(input).items() if excludedNames is None or not name in excludedNames
+    ))
+
+def storeTemplate(key: tuple, origin: adsk.core.Point3D, body: adsk.fusion.BRepBody):
+    if activeTemplates is None or key in activeTemplates:
+        return
+    temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+    activeTemplates[key] = (temporaryBRep.copy(body), (origin.x, origin.y, origin.z))
+
+def placeTemplate(key: tuple, origin: adsk.core.Point3D, targetComponent: adsk.fusion.Component) -> adsk.fusion.BRepBody:
+    # a moved copy of the stored body, added to the design as a single base feature, None when nothing is stored
+    if activeTemplates is None or not key in activeTemplates:
+        return None
+    [templateBody, [templateX, templateY, templateZ]] = activeTemplates[key]
+    temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+    body = temporaryBRep.copy(templateBody)
+    transform = adsk.core.Matrix3D.create()
+    transform.translation = adsk.core.Vector3D.create(origin.x - templateX, origin.y - templateY, origin.z - templateZ)
+    temporaryBRep.transform(body, transform)
+
+    design: adsk.fusion.Design = targetComponent.parentDesign
+    if design.designType == adsk.fusion.DesignTypes.DirectDesignType:
+        return targetComponent.bRepBodies.add(body)
+    baseFeature = targetComponent.features.baseFeatures.add()
+    baseFeature.startEdit()
+    targetComponent.bRepBodies.add(body, baseFeature)
+    baseFeature.finishEdit()
+    return baseFeature.bodies.item(0)
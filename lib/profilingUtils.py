@@ -0,0 +1,69 @@
+import adsk.core, adsk.fusion, traceback
+from . import fusion360utils as futil
+import configparser
+import cProfile
+import functools
+import io
+import os
+import pstats
+import time
+
+PROFILES_FOLDER_NAME = 'profiles'
+
+# profiling settings per command name, filled from config.ini on command start
+settings: dict[str, dict] = {}
+
+def configure(commandName: str, addinConfig: configparser.ConfigParser, configFolderPath: str):
+    settings[commandName] = {
+        'enabled': addinConfig.getboolean('PROFILING', 'enabled', fallback=False),
+        'profilePreview': addinConfig.getboolean('PROFILING', 'profile_preview', fallback=True),
+        'top': addinConfig.getint('PROFILING', 'top', fallback=40),
+        'sortBy': addinConfig.get('PROFILING', 'sort_by', fallback='cumulative'),
+        'folderPath': os.path.join(configFolderPath, PROFILES_FOLDER_NAME),
+    }
+
+def isProfilingEnabled(commandName: str, eventName: str):
+    commandSettings = settings.get(commandName)
+    if commandSettings is None or not commandSettings['enabled']:
+        return False
+    return eventName != 'preview' or commandSettings['profilePreview']
+
+def writeProfile(profiler: cProfile.Profile, name: str, commandSettings: dict):
+    folderPath = commandSettings['folderPath']
+    if not os.path.exists(folderPath):
+        os.makedirs(folderPath)
+    timestamp = time.time()
+    baseName = '{}_{}{:03d}'.format(
+        ''.join(c if c.isalnum() else '_' for c in name),
+        time.strftime('%Y%m%d-%H%M%S', time.localtime(timestamp)),
+        int(timestamp * 1000) % 1000,
+    )
+    statsPath = os.path.join(folderPath, baseName + '.pstats')
+    profiler.dump_stats(statsPath)
+
+    summary = io.StringIO()
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats(commandSettings['sortBy']).print_stats(commandSettings['top'])
+    with open(os.path.join(folderPath, baseName + '.txt'), 'w') as summaryFile:
+        summaryFile.write(summary.getvalue())
+    return statsPath
+
+def profiled(commandName: str, eventName: str):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(args):
+            if not isProfilingEnabled(commandName, eventName):
+                return function(args)
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                return function(args)
+            finally:
+                profiler.disable()
+                try:
+                    statsPath = writeProfile(profiler, f'{commandName} {eventName}', settings[commandName])
+                    futil.log(f'{commandName} profile written to {statsPath}')
+                except Exception as err:
+                    futil.log(f'{commandName} couldn\'t write profile, error: {err}')
+        return wrapper
+    return decorator
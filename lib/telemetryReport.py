@@ -0,0 +1,116 @@
+# Builds a static html page out of telemetry.jsonl files written by the commands.
+# Doesn't depend on adsk so it can be run outside of Fusion:
+#   python lib/telemetryReport.py commands/*/commandConfig/telemetry.jsonl --output report.html
+import argparse
+import html
+import json
+import math
+
+PERCENTILES = [50, 90, 95]
+
+def readRecords(paths: list[str]):
+    records = []
+    for path in paths:
+        with open(path) as telemetryFile:
+            for line in telemetryFile:
+                line = line.strip()
+                if len(line) > 0:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+    return records
+
+def percentile(values: list[float], percent: float):
+    if len(values) == 0:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * percent / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def versionKey(version: str):
+    return [int(part) if part.isdigit() else 0 for part in str(version).split('.')]
+
+def summarize(records: list[dict]):
+    groups: dict[tuple, list[dict]] = {}
+    for record in records:
+        key = (record.get('command', ''), record.get('family', ''), record.get('event', ''), record.get('version', ''))
+        groups.setdefault(key, []).append(record)
+
+    rows = []
+    for (command, family, event, version), groupRecords in groups.items():
+        succeeded = [record for record in groupRecords if record.get('succeeded')]
+        times = [record['totalTime'] for record in succeeded]
+        stageTimes: dict[str, list[float]] = {}
+        for record in succeeded:
+            for stage, duration in record.get('stages', {}).items():
+                stageTimes.setdefault(stage, []).append(duration)
+        features = [record['counts']['features'] for record in succeeded if 'features' in record.get('counts', {})]
+        rows.append({
+            'command': command,
+            'family': family,
+            'event': event,
+            'version': version,
+            'runs': len(groupRecords),
+            'failures': len(groupRecords) - len(succeeded),
+            'percentiles': {p: percentile(times, p) for p in PERCENTILES},
+            'max': max(times) if len(times) > 0 else None,
+            'features': percentile(features, 50),
+            'stages': {stage: percentile(durations, 50) for stage, durations in stageTimes.items()},
+        })
+    return sorted(rows, key=lambda x: (x['command'], x['family'], x['event'], versionKey(x['version'])))
+
+def formatMs(value: float):
+    return '' if value is None else f'{value:.0f}'
+
+def renderHtml(rows: list[dict], recordCount: int):
+    headers = ['Command', 'Configuration family', 'Event', 'Version', 'Runs', 'Failures'] \
+        + [f'p{p} ms' for p in PERCENTILES] + ['max ms', 'Features', 'Median stage times, ms']
+    lines = [
+        '<!DOCTYPE html>',
+        '<html><head><meta charset="utf-8"><title>Gridfinity generator telemetry</title>',
+        '<style>body{font-family:sans-serif;font-size:13px}table{border-collapse:collapse}'
+        'td,th{border:1px solid #ccc;padding:3px 6px;text-align:left;vertical-align:top}'
+        'td.number{text-align:right}tr.regression td{background:#fdd}</style>',
+        '</head><body>',
+        f'<h1>Gridfinity generator telemetry</h1><p>{recordCount} records, p50 rows slower than the previous version by more than 20% are highlighted.</p>',
+        '<table><tr>' + ''.join(f'<th>{html.escape(header)}</th>' for header in headers) + '</tr>',
+    ]
+    previous: dict[tuple, float] = {}
+    for row in rows:
+        key = (row['command'], row['family'], row['event'])
+        median = row['percentiles'][50]
+        isRegression = median is not None and key in previous and previous[key] is not None and median > previous[key] * 1.2
+        previous[key] = median
+        stages = '<br>'.join(f'{html.escape(stage)}: {formatMs(duration)}' for stage, duration in row['stages'].items())
+        cells = [
+            html.escape(row['command']),
+            html.escape(row['family']),
+            html.escape(row['event']),
+            html.escape(str(row['version'])),
+        ]
+        numbers = [str(row['runs']), str(row['failures'])] + [formatMs(row['percentiles'][p]) for p in PERCENTILES] \
+            + [formatMs(row['max']), formatMs(row['features'])]
+        lines.append(
+            f'<tr class="{"regression" if isRegression else ""}">'
+            + ''.join(f'<td>{cell}</td>' for cell in cells)
+            + ''.join(f'<td class="number">{number}</td>' for number in numbers)
+            + f'<td>{stages}</td></tr>'
+        )
+    lines.append('</table></body></html>')
+    return '\n'.join(lines)
+
+def writeReport(telemetryPaths: list[str], outputPath: str):
+    records = readRecords(telemetryPaths)
+    with open(outputPath, 'w') as reportFile:
+        reportFile.write(renderHtml(summarize(records), len(records)))
+    return outputPath
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render generation telemetry as a static html report')
+    parser.add_argument('telemetry', nargs='+', help='telemetry.jsonl files')
+    parser.add_argument('--output', default='telemetry-report.html', help='html file to write')
+    args = parser.parse_args()
+    print(writeReport(args.telemetry, args.output))
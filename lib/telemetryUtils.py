@@ -0,0 +1,77 @@
+import adsk.core, adsk.fusion, traceback
+from . import fusion360utils as futil
+from . import traceUtils
+import datetime
+import json
+import os
+
+TELEMETRY_FILE_NAME = 'telemetry.jsonl'
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'GridfinityGenerator.manifest')
+
+addinVersion: str = None
+
+def getAddinVersion():
+    global addinVersion
+    if addinVersion is None:
+        try:
+            with open(MANIFEST_PATH) as manifestFile:
+                addinVersion = json.load(manifestFile)['version']
+        except:
+            addinVersion = 'unknown'
+    return addinVersion
+
+def getEventName(args: adsk.core.CommandEventArgs):
+    try:
+        return args.firingEvent.name
+    except:
+        return 'unknown'
+
+def getFamily(spec: dict, familyKeys: list[str]):
+    return ', '.join(f'{key}={spec[key]}' for key in familyKeys if key in spec)
+
+def createRecord(
+    commandName: str,
+    eventName: str,
+    family: str,
+    spec: dict,
+    tracer: traceUtils.Tracer,
+    component: adsk.fusion.Component,
+    succeeded: bool,
+    error: str = None,
+    ):
+    counts = {}
+    if component is not None:
+        try:
+            counts = {
+                'features': component.features.count,
+                'sketches': component.sketches.count,
+                'constructionPlanes': component.constructionPlanes.count,
+                'bodies': component.bRepBodies.count,
+            }
+        except:
+            counts = {}
+    generatorTimes = tracer.durations('generator') if tracer is not None else {}
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'version': getAddinVersion(),
+        'command': commandName,
+        'event': eventName,
+        'family': family,
+        'spec': spec,
+        'succeeded': succeeded,
+        'error': error,
+        'totalTime': sum(generatorTimes.values()),
+        'stages': tracer.durations('stage') if tracer is not None else {},
+        'counts': counts,
+    }
+
+def appendRecord(folderPath: str, record: dict):
+    try:
+        if not os.path.exists(folderPath):
+            os.makedirs(folderPath)
+        with open(os.path.join(folderPath, TELEMETRY_FILE_NAME), 'a') as telemetryFile:
+            telemetryFile.write(json.dumps(record, default=str) + '\n')
+        return True
+    except Exception as err:
+        futil.log(f'Couldn\'t write telemetry record to {folderPath}, error: {err}')
+        return False
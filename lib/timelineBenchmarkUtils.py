@@ -0,0 +1,72 @@
+import adsk.core, adsk.fusion, traceback
+from . import fusion360utils as futil
+import csv
+import os
+import time
+
+GENERATED_GROUP_PREFIX = 'Gridfinity'
+
+def findGeneratedGroups(timeline: adsk.fusion.Timeline):
+    return [group for group in timeline.timelineGroups if group.name.startswith(GENERATED_GROUP_PREFIX)]
+
+def timelineObjectType(timelineObject: adsk.fusion.TimelineObject):
+    try:
+        return timelineObject.entity.objectType.split('::')[-1]
+    except:
+        return 'Unknown'
+
+def benchmarkTimelineGroup(timeline: adsk.fusion.Timeline, group: adsk.fusion.TimelineGroup, repeats: int = 1):
+    timelineObjects = [group.item(i) for i in range(group.count)]
+    objectTimes = [0] * len(timelineObjects)
+    totalTime = 0
+    markerPosition = timeline.markerPosition
+    try:
+        for _ in range(repeats):
+            # whole group in a single roll forward, what users pay on document open or edits above the group
+            timelineObjects[0].rollTo(True)
+            startTime = time.perf_counter()
+            timelineObjects[-1].rollTo(False)
+            totalTime += time.perf_counter() - startTime
+
+            # one object at a time, marker right after the previous object is right before the next one
+            timelineObjects[0].rollTo(True)
+            for i, timelineObject in enumerate(timelineObjects):
+                startTime = time.perf_counter()
+                timelineObject.rollTo(False)
+                objectTimes[i] += time.perf_counter() - startTime
+    finally:
+        timeline.markerPosition = markerPosition
+
+    return {
+        'group': group.name,
+        'repeats': repeats,
+        'totalTime': totalTime / repeats,
+        'objects': [{
+            'index': timelineObject.index,
+            'name': timelineObject.name,
+            'type': timelineObjectType(timelineObject),
+            'time': objectTimes[i] / repeats,
+        } for i, timelineObject in enumerate(timelineObjects)],
+    }
+
+def writeReport(result: dict, folderPath: str):
+    if not os.path.exists(folderPath):
+        os.makedirs(folderPath)
+    fileName = '{}_timeline_{}.csv'.format(''.join(c if c.isalnum() else '_' for c in result['group']), time.strftime('%Y%m%d-%H%M%S'))
+    reportPath = os.path.join(folderPath, fileName)
+    with open(reportPath, 'w', newline='') as reportFile:
+        writer = csv.DictWriter(reportFile, fieldnames=['index', 'name', 'type', 'time'])
+        writer.writeheader()
+        writer.writerows(result['objects'])
+    return reportPath
+
+def formatSummary(result: dict, top: int = 10):
+    objectsTotal = sum(obj['time'] for obj in result['objects'])
+    lines = [
+        f'{result["group"]}: {len(result["objects"])} timeline objects, averaged over {result["repeats"]} run(s)',
+        f'Group roll forward: {result["totalTime"] * 1000:.0f} ms, sum of single objects: {objectsTotal * 1000:.0f} ms',
+        f'Slowest objects:',
+    ]
+    for obj in sorted(result['objects'], key=lambda x: x['time'], reverse=True)[:top]:
+        lines.append(f'    {obj["name"]} ({obj["type"]}): {obj["time"] * 1000:.1f} ms')
+    return '\n'.join(lines)
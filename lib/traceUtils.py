@@ -0,0 +1,131 @@
+import adsk.core, adsk.fusion, traceback
+from . import fusion360utils as futil
+import contextlib
+import json
+import os
+import sys
+import time
+
+TRACES_FOLDER_NAME = 'traces'
+GRIDFINITY_UTILS_PATH = os.path.normcase(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gridfinityUtils'))
+
+class Tracer:
+    def __init__(self, name: str, traceHelpers: bool = True):
+        self.name = name
+        self.traceHelpers = traceHelpers
+        self.events: list[dict] = []
+        self._startTime = time.perf_counter()
+        self._openSpans: list[tuple] = []
+        self._openCalls: dict[int, float] = {}
+        self._previousProfileFunction = None
+
+    def timestamp(self):
+        return (time.perf_counter() - self._startTime) * 1000000
+
+    def addEvent(self, name: str, category: str, startTime: float, duration: float, args: dict = None):
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': startTime,
+            'dur': duration,
+            'pid': os.getpid(),
+            'tid': 0,
+            'args': {} if args is None else args,
+        })
+
+    def begin(self, name: str, category: str = 'stage', **args):
+        self._openSpans.append((name, category, self.timestamp(), args))
+
+    def end(self):
+        name, category, startTime, args = self._openSpans.pop()
+        self.addEvent(name, category, startTime, self.timestamp() - startTime, args)
+
+    def start(self):
+        self.begin(self.name, 'generator')
+        if self.traceHelpers and sys.getprofile() is not None:
+            # cProfile or a debugger already owns the profile hook, replacing it would break them
+            futil.log('Profile hook is in use, helper calls won\'t be traced')
+            self.traceHelpers = False
+        if self.traceHelpers:
+            self._previousProfileFunction = sys.getprofile()
+            sys.setprofile(self._profile)
+
+    def stop(self):
+        if self.traceHelpers:
+            sys.setprofile(self._previousProfileFunction)
+        while len(self._openSpans) > 0:
+            self.end()
+
+    def _profile(self, frame, event: str, arg):
+        if event == 'call':
+            code = frame.f_code
+            # comprehensions, lambdas and input data holders only add noise to the trace
+            if code.co_name.startswith('<') or code.co_filename.endswith('Input.py'):
+                return
+            if os.path.normcase(code.co_filename).startswith(GRIDFINITY_UTILS_PATH):
+                self._openCalls[id(frame)] = self.timestamp()
+        elif event == 'return':
+            startTime = self._openCalls.pop(id(frame), None)
+            if startTime is not None:
+                code = frame.f_code
+                moduleName = os.path.splitext(os.path.basename(code.co_filename))[0]
+                self.addEvent(f'{moduleName}.{getattr(code, "co_qualname", code.co_name)}', 'helper', startTime, self.timestamp() - startTime)
+
+    def durations(self, category: str):
+        result: dict[str, float] = {}
+        for event in self.events:
+            if event['cat'] == category:
+                result[event['name']] = result.get(event['name'], 0) + event['dur'] / 1000
+        return result
+
+    def toChromeTrace(self):
+        return {
+            'traceEvents': sorted(self.events, key=lambda x: (x['ts'], -x['dur'])),
+            'displayTimeUnit': 'ms',
+            'otherData': {'name': self.name},
+        }
+
+    def write(self, folderPath: str):
+        if not os.path.exists(folderPath):
+            os.makedirs(folderPath)
+        fileName = '{}_{}.json'.format(''.join(c if c.isalnum() else '_' for c in self.name), time.strftime('%Y%m%d-%H%M%S'))
+        tracePath = os.path.join(folderPath, fileName)
+        with open(tracePath, 'w') as traceFile:
+            json.dump(self.toChromeTrace(), traceFile)
+        return tracePath
+
+activeTracer: Tracer = None
+
+def startTrace(name: str, traceHelpers: bool = True):
+    global activeTracer
+    activeTracer = Tracer(name, traceHelpers)
+    activeTracer.start()
+    return activeTracer
+
+def stopTrace(folderPath: str = None):
+    global activeTracer
+    if activeTracer is None:
+        return None
+    tracer = activeTracer
+    activeTracer = None
+    tracer.stop()
+    if folderPath is not None:
+        try:
+            tracePath = tracer.write(folderPath)
+            futil.log(f'Trace written to {tracePath}')
+        except Exception as err:
+            futil.log(f'Couldn\'t write trace to {folderPath}, error: {err}')
+    return tracer
+
+@contextlib.contextmanager
+def span(name: str, **args):
+    if activeTracer is None:
+        yield
+        return
+    tracer = activeTracer
+    tracer.begin(name, **args)
+    try:
+        yield
+    finally:
+        tracer.end()
@@ -0,0 +1,2 @@
+class InfeasibleInputException(Exception):
+    pass
\ No newline at end of file